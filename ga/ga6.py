@@ -4,31 +4,34 @@ import random
 import math
 import json
 import argparse
+import gzip
+import hashlib
+import multiprocessing
+import os
+import pickle
+import signal
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from itertools import compress
+from operator import ne
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Callable
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import version_intern
+from version_intern import normalize_version
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
-#  Version
 
 
-def normalize_version(v: str) -> Tuple[int, ...]:
-    """
-    "3.10.0a0" -> (3, 10, 0)
-    "3.9"      -> (3, 9)
-    """
-    cleaned = ""
-    for ch in v:
-        if ch.isdigit() or ch == ".":
-            cleaned += ch
-        else:
-            break
-    if not cleaned:
-        return (0,)
-    parts = [int(p) for p in cleaned.split(".") if p != ""]
-    if not parts:
-        return (0,)
-    return tuple(parts)
+#  Version
 
 
 def cmp_version(a: str, b: str) -> int:
@@ -36,18 +39,9 @@ def cmp_version(a: str, b: str) -> int:
     a < b  -> -1
     a == b ->  0
     a > b  -> +1
+    (normalize_version 기준, version_intern 의 rank 로 비교)
     """
-    ta = normalize_version(a)
-    tb = normalize_version(b)
-    L = max(len(ta), len(tb))
-    ta = ta + (0,) * (L - len(ta))
-    tb = tb + (0,) * (L - len(tb))
-    if ta < tb:
-        return -1
-    elif ta > tb:
-        return 1
-    else:
-        return 0
+    return version_intern.compare(a, b, "numeric")
 
 
 def check_one_constraint(ver: str, op: str, target: str) -> bool:
@@ -95,6 +89,9 @@ def version_distance(v1: str, v2: str) -> float:
 #  encoding (염색체 구조)
 
 
+DEFAULT_PYTHON_CANDIDATES = ("3.8", "3.9", "3.10", "3.11", "3.12", "3.14")
+
+
 def build_encoding(repo: Dict[str, Any], python_candidates: Optional[List[str]] = None):
     """
     repo: 네가 준 JSON dict (패키지 -> 버전 -> {depends, constrains})
@@ -102,7 +99,7 @@ def build_encoding(repo: Dict[str, Any], python_candidates: Optional[List[str]]
     """
     if python_candidates is None:
 
-        python_candidates = ["3.8", "3.9", "3.10", "3.11", "3.12", "3.14"]
+        python_candidates = list(DEFAULT_PYTHON_CANDIDATES)
 
     package_names = sorted(repo.keys())  
 
@@ -122,6 +119,321 @@ def build_encoding(repo: Dict[str, Any], python_candidates: Optional[List[str]]
     return package_names, gene_choices
 
 
+def search_space_log10(repo: Dict[str, Any], python_candidates: List[str]) -> float:
+    """build_encoding 이 만드는 탐색 공간 크기(유전자별 allele 수의 곱)의 log10"""
+    return math.log10(len(python_candidates)) + sum(
+        math.log10(len(versions) + 1) for versions in repo.values()
+    )
+
+
+def python_minor_versions(repo: Dict[str, Any]) -> List[str]:
+    """
+    DEFAULT_PYTHON_CANDIDATES 에 dep space 의 python 조건에 나오는 3.x minor 버전을 더한 후보 (오름차순)
+    가장 낮은 기본 후보보다 오래된 버전은 넣지 않음
+    """
+    lowest = normalize_version(DEFAULT_PYTHON_CANDIDATES[0])
+    minors = set(DEFAULT_PYTHON_CANDIDATES)
+    for versions in repo.values():
+        for meta in versions.values():
+            for cons in (meta or {}).get("depends", {}).get("python", []):
+                key = normalize_version(cons["ver"])[:2]
+                if len(key) == 2 and key[0] == 3 and key >= lowest:
+                    minors.add(f"{key[0]}.{key[1]}")
+    return sorted(minors, key=normalize_version)
+
+
+def filter_python(
+    repo: Dict[str, Any],
+    python_ver: str,
+    hard_constraints: Optional[Dict[str, List[Dict[str, str]]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    python_ver 와 맞지 않는 python depends 를 가진 버전을 뺀 repo
+    hard_constraints 패키지 중 만족하는 버전이 있었는데 모두 빠지면 None
+    (처음부터 만족할 수 없는 hard constraint 는 reduce_domains 처럼 fitness 의 패널티에 맡김)
+    """
+    hard_constraints = hard_constraints or {}
+    filtered = {}
+    for pkg, versions in repo.items():
+        kept = {
+            ver: meta for ver, meta in versions.items()
+            if check_constraint_list(python_ver, (meta or {}).get("depends", {}).get("python", []))
+        }
+        cons_list = hard_constraints.get(pkg)
+        if cons_list and not any(check_constraint_list(v, cons_list) for v in kept):
+            if any(check_constraint_list(v, cons_list) for v in versions):
+                return None
+        filtered[pkg] = kept
+    return filtered
+
+
+def derive_python_candidates(
+    repo: Dict[str, Any],
+    hard_constraints: Optional[Dict[str, List[Dict[str, str]]]] = None,
+) -> List[str]:
+    """python_minor_versions 중 filter_python 으로 hard constraints 를 만족할 수 있는 후보만"""
+    return [
+        python_ver for python_ver in python_minor_versions(repo)
+        if filter_python(repo, python_ver, hard_constraints) is not None
+    ]
+
+
+def reduce_domains(
+    repo: Dict[str, Any],
+    python_candidates: List[str],
+    hard_constraints: Optional[Dict[str, List[Dict[str, str]]]] = None,
+):
+    """
+    AC-3 방식으로 절대 만족될 수 없는 버전을 도메인에서 제거
+      - 버전 v 는 depends 의 각 패키지(python 포함)에 조건을 만족하는 버전이 하나라도 남아 있어야 함
+        (설치된 패키지의 의존성이 빠지는 경우도 허용하지 않음, dep space 밖의 패키지는 무시)
+      - python 과 hard_constraints 패키지는 반드시 설치되므로 constrains 도 같은 방식으로 적용
+      - hard_constraints 패키지의 도메인은 조건을 만족하는 버전으로 시작
+    전파 도중 hard_constraints 패키지의 도메인이 비면 모순이므로 None 을 반환
+    return: (축소된 repo, python_candidates) 또는 None
+    """
+    hard_constraints = hard_constraints or {}
+    # python 유전자(0번)의 도메인은 repo 의 패키지 이름과 겹치지 않도록 키를 None 으로 둠
+    domains: Dict[Optional[str], List[str]] = {None: list(python_candidates)}
+    required: set = {None}
+    for pkg, versions in repo.items():
+        satisfying = []
+        if pkg in hard_constraints:
+            satisfying = [v for v in versions if check_constraint_list(v, hard_constraints[pkg])]
+        if satisfying:
+            required.add(pkg)
+            domains[pkg] = satisfying
+        else:
+            # 처음부터 만족할 수 없는 hard constraint 는 fitness 의 패널티에 맡김
+            domains[pkg] = list(versions)
+
+    def edges(pkg: str, ver: str):
+        meta = repo[pkg].get(ver) or {}
+        for dep_pkg, cons_list in meta.get("depends", {}).items():
+            yield dep_pkg, cons_list
+        for dep_pkg, cons_list in meta.get("constrains", {}).items():
+            if dep_pkg in ("python", "python_abi") or dep_pkg in required:
+                yield dep_pkg, cons_list
+
+    def target(dep_pkg: str):
+        """dep 이름 -> domains 키 (dep space 밖이면 False)"""
+        if dep_pkg in ("python", "python_abi"):
+            return None
+        return dep_pkg if dep_pkg in repo else False
+
+    # dependents[j] = j 의 도메인이 줄면 다시 검사해야 하는 패키지들
+    dependents: Dict[str, set] = {pkg: set() for pkg in domains}
+    for pkg, versions in repo.items():
+        for ver in versions:
+            for dep_pkg, _ in edges(pkg, ver):
+                j = target(dep_pkg)
+                if j is not False and j != pkg:
+                    dependents[j].add(pkg)
+
+    # (대상, 조건) -> 지지 여부, 도메인은 줄어들기만 하므로 도메인 크기를 키에 넣으면 충분
+    support_cache: Dict[Tuple, bool] = {}
+
+    def supported(j: Optional[str], cons_list: List[Dict[str, str]]) -> bool:
+        key = (j, len(domains[j]), tuple((c["op"], c["ver"]) for c in cons_list))
+        ok = support_cache.get(key)
+        if ok is None:
+            ok = any(check_constraint_list(w, cons_list) for w in domains[j])
+            support_cache[key] = ok
+        return ok
+
+    queue = list(repo)
+    queued = set(queue)
+    while queue:
+        pkg = queue.pop()
+        queued.discard(pkg)
+        kept = []
+        for ver in domains[pkg]:
+            for dep_pkg, cons_list in edges(pkg, ver):
+                j = target(dep_pkg)
+                if j is not False and not supported(j, cons_list):
+                    break
+            else:
+                kept.append(ver)
+
+        if len(kept) == len(domains[pkg]):
+            continue
+        if not kept and pkg in required:
+            return None
+        domains[pkg] = kept
+        for dependent in dependents[pkg]:
+            if dependent not in queued:
+                queued.add(dependent)
+                queue.append(dependent)
+
+    reduced = {pkg: {ver: repo[pkg][ver] for ver in domains[pkg]} for pkg in repo}
+    return reduced, domains[None]
+
+
+# 이보다 작은 연결 요소들은 하나로 묶어서 풂 (GA 실행 1회의 고정 비용이 요소 크기보다 커지므로)
+COMPONENT_MIN_GENES = 8
+
+
+def split_components(repo: Dict[str, Any]) -> List[List[str]]:
+    """
+    depends / constrains 그래프(python 제외, dep space 밖 패키지 무시)의 약연결 요소로 패키지를 나눔
+    요소끼리는 python 유전자만 공유하므로 python 을 고정하면 서로 독립적으로 풀 수 있다.
+    COMPONENT_MIN_GENES 보다 작은 요소들은 그 크기 이상이 될 때까지 한 묶음으로 합침
+    return: 패키지 이름 리스트들 (큰 묶음부터)
+    """
+    parent = {pkg: pkg for pkg in repo}
+
+    def find(pkg: str) -> str:
+        while parent[pkg] != pkg:
+            parent[pkg] = parent[parent[pkg]]
+            pkg = parent[pkg]
+        return pkg
+
+    for pkg, versions in repo.items():
+        for meta in versions.values():
+            meta = meta or {}
+            for key in ("depends", "constrains"):
+                for dep_pkg in meta.get(key, {}):
+                    if dep_pkg in parent:
+                        a, b = find(pkg), find(dep_pkg)
+                        if a != b:
+                            parent[a] = b
+
+    components: Dict[str, List[str]] = {}
+    for pkg in sorted(repo):
+        components.setdefault(find(pkg), []).append(pkg)
+
+    groups: List[List[str]] = []
+    small: List[str] = []
+    for component in sorted(components.values(), key=len, reverse=True):
+        if len(component) >= COMPONENT_MIN_GENES:
+            groups.append(component)
+            continue
+        small.extend(component)
+        if len(small) >= COMPONENT_MIN_GENES:
+            groups.append(sorted(small))
+            small = []
+    if small:
+        groups.append(sorted(small))
+    return groups
+
+
+# warm start 에서 조건이 바뀐 패키지로부터 이 거리(depends / constrains 간선 수) 안의 패키지까지 다시 풂
+WARM_START_RADIUS = 2
+# warm start 초기 개체군에서 다시 풀 유전자 각각을 이전 해와 다른 무작위 버전으로 바꿀 확률 (0번 개체는 이전 해 그대로)
+WARM_START_PERTURB_PROB = 0.5
+# warm start 초기 개체군 중 greedy_individual 로 만들 최소 비율
+# (고정된 패키지는 이전 버전 그대로이고 다시 풀 패키지만 hard constraint 부터 맞춰짐)
+WARM_START_GREEDY_FRACTION = 0.2
+
+
+def previous_assignment(previous: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Optional[str]]]:
+    """
+    이전 GA 결과(ga_solution_detailed.json 또는 ga_solution.json 형식)를 (python_ver, {pkg: ver or None}) 로
+    "all_packages" 가 없으면 "packages" 에 없는 패키지는 이전 해에서 정해지지 않은 것으로 봄
+    """
+    packages = previous.get("all_packages")
+    if packages is None:
+        packages = previous.get("packages", {})
+    return previous.get("python_version"), dict(packages)
+
+
+def warm_start_repo(
+    repo: Dict[str, Any],
+    python_candidates: List[str],
+    hard_constraints: Optional[Dict[str, List[Dict[str, str]]]],
+    previous: Dict[str, Any],
+    radius: int = WARM_START_RADIUS,
+):
+    """
+    이전 해에서 바뀐 조건의 영향을 받는 패키지만 다시 풀도록 나머지 패키지의 도메인을 이전 버전으로 고정
+    영향을 받는 패키지:
+      - 이전 해에 없거나 이전 버전이 dep space 에서 사라진 패키지
+      - hard constraint 를 만족하지 않는 패키지 (미설치 포함)
+      - 이전 해 안에서 depends / constrains 가 위반되는 패키지와 그 대상
+      - 위 패키지들에서 radius 번 이내로 닿는 패키지 (바뀌는 패키지의 모든 버전이 조건을 거는 패키지와
+        이전 해의 버전이 그 패키지에 조건을 거는 패키지)
+    python 은 이전 버전이 후보에 있고 python 조건 위반이 없으면 그 버전만 남김
+    (python 이 바뀌면 모든 후보에서 python 조건을 만족하지는 않는 패키지도 영향을 받음)
+    return: (축소된 repo, python_candidates, 영향 받는 패키지 집합)
+    """
+    hard_constraints = hard_constraints or {}
+    prev_python, prev_versions = previous_assignment(previous)
+
+    affected = set()
+    python_affected = prev_python not in python_candidates
+    for pkg, versions in repo.items():
+        if pkg not in prev_versions:
+            affected.add(pkg)
+            continue
+        ver = prev_versions[pkg]
+        if ver is not None and ver not in versions:
+            affected.add(pkg)
+        elif pkg in hard_constraints and (ver is None or not check_constraint_list(ver, hard_constraints[pkg])):
+            affected.add(pkg)
+
+    def python_conditions(pkg: str):
+        meta = repo[pkg].get(prev_versions.get(pkg)) or {}
+        for key in ("depends", "constrains"):
+            for dep_pkg, cons_list in meta.get(key, {}).items():
+                if dep_pkg in ("python", "python_abi"):
+                    yield cons_list
+
+    if not python_affected:
+        python_affected = any(
+            not check_constraint_list(prev_python, cons_list)
+            for pkg, cons_list in hard_constraints.items() if pkg in ("python", "python_abi")
+        ) or any(
+            not check_constraint_list(prev_python, cons_list)
+            for pkg in repo if pkg not in affected for cons_list in python_conditions(pkg)
+        )
+    if python_affected:
+        for pkg in repo:
+            if any(
+                not check_constraint_list(p, cons_list)
+                for cons_list in python_conditions(pkg) for p in python_candidates
+            ):
+                affected.add(pkg)
+
+    # pkg 가 바뀌면 그 모든 버전의 depends / constrains 대상과, 이전 해에서 pkg 를 조건으로 가진 패키지가 영향을 받음
+    neighbors: Dict[str, set] = {pkg: set() for pkg in repo}
+    for pkg, versions in repo.items():
+        ver = prev_versions.get(pkg)
+        for v, meta in versions.items():
+            meta = meta or {}
+            for key in ("depends", "constrains"):
+                for dep_pkg, cons_list in meta.get(key, {}).items():
+                    if dep_pkg not in neighbors or dep_pkg == pkg:
+                        continue
+                    neighbors[pkg].add(dep_pkg)
+                    if v != ver:
+                        continue
+                    neighbors[dep_pkg].add(pkg)
+                    if dep_pkg not in prev_versions:
+                        continue
+                    # fitness 와 같이 대상이 미설치면 위반으로 보지 않음
+                    dep_ver = prev_versions[dep_pkg]
+                    if dep_ver is not None and not check_constraint_list(dep_ver, cons_list):
+                        affected.update((pkg, dep_pkg))
+
+    frontier = set(affected)
+    for _ in range(radius):
+        frontier = {n for pkg in frontier for n in neighbors[pkg]} - affected
+        if not frontier:
+            break
+        affected |= frontier
+
+    reduced = {}
+    for pkg, versions in repo.items():
+        if pkg in affected:
+            reduced[pkg] = versions
+        else:
+            ver = prev_versions[pkg]
+            reduced[pkg] = {} if ver is None else {ver: versions[ver]}
+    if not python_affected:
+        python_candidates = [prev_python]
+    return reduced, python_candidates, affected
+
+
 def decode_individual(
     individual: List[int],
     package_names: List[str],
@@ -145,6 +457,19 @@ def decode_individual(
 #  Fitness 함수
 # -------------------------
 
+#MISSING_DEP_PENALTY = 0.5
+#for ga required 설치만을 할때
+#CONFLICT_PENALTY = 30.0
+#CONSTRAIN_PENALTY = 3.0
+#INSTALLED_REWARD = 10.0
+#REQUIRED_MISSING_PENALTY = 500.0
+
+#dep space 전체 설치시
+CONFLICT_PENALTY = 12.0
+CONSTRAIN_PENALTY = 3.0
+INSTALLED_REWARD = 10.0
+
+
 def fitness(
     individual: List[int],
     repo: Dict[str, Any],
@@ -159,18 +484,6 @@ def fitness(
     """
     python_ver, pkg_versions = decode_individual(individual, package_names, gene_choices)
 
-    #MISSING_DEP_PENALTY = 0.5
-    #for ga required 설치만을 할때
-    CONFLICT_PENALTY = 30.0
-    CONSTRAIN_PENALTY = 3.0
-    INSTALLED_REWARD = 10.0
-    #REQUIRED_MISSING_PENALTY = 500.0
-
-    #dep space 전체 설치시
-    CONFLICT_PENALTY = 12.0
-    CONSTRAIN_PENALTY = 3.0
-    INSTALLED_REWARD = 10.0
-
     missing_dep = 0
     conflicts = 0
     constrain_conflicts = 0
@@ -291,9 +604,820 @@ def fitness(
     return score
 
 
+#  Compiled fitness 테이블
+
+# delta 평가: 부모와 다른 유전자 비율이 이보다 크면 전체 재평가
+# (delta 평가는 바뀐 유전자마다 들어오는 간선까지 보므로 유전자당 비용이 전체 평가의 수 배)
+DELTA_EVAL_MAX_FRACTION = 0.2
+# linkage crossover: 평균적으로 상대 버전의 이 비율 이상을 배제하는 depends 쌍을 한 묶음으로
+LINKAGE_TIGHTNESS = 0.5
+# linkage crossover: 묶음 하나가 가질 수 있는 최대 유전자 비율
+LINKAGE_MAX_CLUSTER_FRACTION = 0.25
+# greedy 초기화: 호환되는 버전 중 최신 버전을 고를 확률 (아니면 다음 후보로 넘어감)
+GREEDY_NEWEST_PROB = 0.8
+
+
+class CompiledRepo:
+    """
+    fitness() 를 룩업 테이블로 미리 컴파일한 것 (run_ga 호출당 1회 생성)
+
+    (패키지, 버전, 의존 패키지) 마다 gene_choices 상의 허용 allele 여부를
+    bool 튜플로 계산해 두기 때문에, 간선 하나의 검사는 인덱스 한 번으로 끝난다.
+      - unary[i][a]      : 설치 보상 + hard_constraints 점수
+      - depends[i][a]    : ((j, allowed), ...)  allowed[b] == j번 유전자가 b일 때 만족 여부
+      - constrains[i][a] : depends 와 같은 형식
+    """
+
+    def __init__(
+        self,
+        repo: Dict[str, Any],
+        package_names: List[str],
+        gene_choices: List[List[Optional[str]]],
+        hard_constraints: Optional[Dict[str, List[Dict[str, str]]]] = None,
+    ):
+        self.package_names = package_names
+        self.gene_choices = gene_choices
+        self.gene_index = {pkg: i for i, pkg in enumerate(package_names, start=1)}
+        self._allowed_cache: Dict[Tuple, Tuple[bool, ...]] = {}
+
+        self.unary: List[List[float]] = [[0.0] * len(gene_choices[0])]
+        self.depends: List[List[Tuple]] = [[() for _ in gene_choices[0]]]
+        self.constrains: List[List[Tuple]] = [[() for _ in gene_choices[0]]]
+
+        for i, pkg in enumerate(package_names, start=1):
+            unary_row = []
+            depends_row = []
+            constrains_row = []
+            for ver in gene_choices[i]:
+                if ver is None:
+                    unary_row.append(0.0)
+                    depends_row.append(())
+                    constrains_row.append(())
+                    continue
+
+                unary_row.append(INSTALLED_REWARD)
+                meta = repo.get(pkg, {}).get(ver)
+                if not meta:
+                    depends_row.append(())
+                    constrains_row.append(())
+                    continue
+
+                depends_row.append(self._compile_edges(meta.get("depends", {})))
+                constrains_row.append(self._compile_edges(meta.get("constrains", {})))
+
+            self.unary.append(unary_row)
+            self.depends.append(depends_row)
+            self.constrains.append(constrains_row)
+
+        # hard_genes = ((i, ok), ...)  ok[a] == i번 유전자가 a일 때 hard constraint 만족 여부
+        hard_genes = []
+        if hard_constraints:
+            for constraint_pkg, cons_list in hard_constraints.items():
+                i = self.gene_index.get(constraint_pkg)
+                if i is None:
+                    continue
+                for a, ver in enumerate(gene_choices[i]):
+                    self.unary[i][a] += self._hard_score(ver, cons_list)
+                hard_genes.append((i, tuple(
+                    ver is not None and check_constraint_list(ver, cons_list)
+                    for ver in gene_choices[i]
+                )))
+        self.hard_genes = tuple(hard_genes)
+        self._hard_ok = dict(hard_genes)
+
+    def _compile_edges(self, edges: Dict[str, List[Dict[str, str]]]) -> Tuple:
+        compiled = []
+        for dep_pkg, cons_list in edges.items():
+            if dep_pkg in ("python", "python_abi"):
+                j = 0
+            else:
+                j = self.gene_index.get(dep_pkg)
+                if j is None:
+                    # dep space 밖의 패키지는 fitness 에서도 점수에 반영되지 않음
+                    continue
+            compiled.append((j, self._allowed(j, cons_list)))
+        return tuple(compiled)
+
+    def _allowed(self, j: int, cons_list: List[Dict[str, str]]) -> Tuple[bool, ...]:
+        """j번 유전자의 각 allele 이 cons_list 를 만족하는지 (None 은 항상 허용)"""
+        key = (j, tuple((c["op"], c["ver"]) for c in cons_list))
+        allowed = self._allowed_cache.get(key)
+        if allowed is None:
+            allowed = tuple(
+                ver is None or check_constraint_list(ver, cons_list)
+                for ver in self.gene_choices[j]
+            )
+            self._allowed_cache[key] = allowed
+        return allowed
+
+    @staticmethod
+    def _hard_score(ver: Optional[str], cons_list: List[Dict[str, str]]) -> float:
+        """fitness() 의 hard_constraints 항을 allele 하나에 대해 계산"""
+        target_ver = None
+        for c in cons_list:
+            if c.get("op") in ("==", "="):
+                target_ver = c.get("ver")
+                break
+
+        if ver is None:
+            return -1.0
+        if check_constraint_list(ver, cons_list):
+            return 1.0
+        if target_ver:
+            return -(1 + version_distance(ver, target_ver))
+        return -1.0
+
+    def _build_links(self):
+        """
+        depends / constrains 간선을 대상 유전자별로 묶은 테이블 (delta 평가용)
+          links[i][a]   = ((j, row), ...)
+          reverse[j]    = ((s, rows), ...)   rows[a] = s가 allele a 일 때 j 로 향하는 row (없으면 None)
+        row[b] 는 j번 유전자가 b일 때의 (depends 위반 수 << shift | constrains 위반 수)
+        shift 는 개체 하나의 constrains 위반 수 상한보다 크게 잡아 합산해도 섞이지 않게 함
+        """
+        max_constrains = sum(max(len(edges) for edges in rows) for rows in self.constrains)
+        shift = self._pack_shift = max_constrains.bit_length() + 1
+        row_cache: Dict[Tuple, Tuple[int, ...]] = {}
+        incoming: List[Dict[int, List]] = [{} for _ in self.gene_choices]
+        self.links = []
+
+        for i, choices in enumerate(self.gene_choices):
+            link_rows = []
+            for a in range(len(choices)):
+                per_target: Dict[int, Tuple[List, List]] = {}
+                for j, allowed in self.depends[i][a]:
+                    per_target.setdefault(j, ([], []))[0].append(allowed)
+                for j, allowed in self.constrains[i][a]:
+                    per_target.setdefault(j, ([], []))[1].append(allowed)
+
+                links = []
+                for j, (dep_allowed, con_allowed) in per_target.items():
+                    # allowed 튜플은 _allowed_cache 에 살아 있으므로 id 로 키를 만들어도 안전
+                    key = (j, tuple(map(id, dep_allowed)), tuple(map(id, con_allowed)))
+                    row = row_cache.get(key)
+                    if row is None:
+                        counts = [0] * len(self.gene_choices[j])
+                        for weight, allowed_list in ((1 << shift, dep_allowed), (1, con_allowed)):
+                            for allowed in allowed_list:
+                                counts = [c if ok else c + weight for c, ok in zip(counts, allowed)]
+                        row = tuple(counts)
+                        row_cache[key] = row
+                    links.append((j, row))
+                    incoming[j].setdefault(i, [None] * len(choices))[a] = row
+                link_rows.append(tuple(links))
+            self.links.append(link_rows)
+
+        self.reverse = [
+            tuple((s, tuple(rows)) for s, rows in sorted(sources.items()))
+            for sources in incoming
+        ]
+
+    def evaluate(self, individual: List[int]) -> Tuple[float, int, int]:
+        """
+        fitness() 와 같은 점수를 테이블 룩업만으로 계산
+        return: (score, depends 위반 수, constrains 위반 수)
+        """
+        unary = self.unary
+        depends = self.depends
+        constrains = self.constrains
+
+        score = 0.0
+        conflicts = 0
+        constrain_conflicts = 0
+        for i, a in enumerate(individual):
+            score += unary[i][a]
+            for j, allowed in depends[i][a]:
+                if not allowed[individual[j]]:
+                    conflicts += 1
+            for j, allowed in constrains[i][a]:
+                if not allowed[individual[j]]:
+                    constrain_conflicts += 1
+
+        score -= CONFLICT_PENALTY * conflicts + CONSTRAIN_PENALTY * constrain_conflicts
+        return score, conflicts, constrain_conflicts
+
+    def fitness(self, individual: List[int]) -> float:
+        return self.evaluate(individual)[0]
+
+    def evaluate_conflicts(self, individual: List[int]) -> Tuple[float, int, int, Dict[int, int]]:
+        """
+        evaluate() 에 위반에 관여한 유전자별 횟수를 더한 것 (conflict 변이용, 간선 순회 1회)
+        횟수는 위반된 links 행 (i -> j 유전자 쌍) 마다 양 끝에 1씩 + hard constraint 를 어기면 1
+        delta / batch 평가도 같은 단위로 세므로 자식의 횟수를 부모에게서 이어서 계산할 수 있음
+        return: (score, depends 위반 수, constrains 위반 수, {유전자: 횟수})
+        """
+        if not hasattr(self, "links"):
+            self._build_links()
+
+        unary = self.unary
+        links = self.links
+        score = 0.0
+        packed = 0
+        counts: Dict[int, int] = {}
+        for i, a in enumerate(individual):
+            score += unary[i][a]
+            for j, row in links[i][a]:
+                v = row[individual[j]]
+                if v:
+                    packed += v
+                    counts[i] = counts.get(i, 0) + 1
+                    counts[j] = counts.get(j, 0) + 1
+        for i, ok in self.hard_genes:
+            if not ok[individual[i]]:
+                counts[i] = counts.get(i, 0) + 1
+
+        conflicts, constrain_conflicts = self._split_packed(packed)
+        score -= CONFLICT_PENALTY * conflicts + CONSTRAIN_PENALTY * constrain_conflicts
+        return score, conflicts, constrain_conflicts, counts
+
+    def conflict_genes(self, individual: List[int]) -> List[int]:
+        """
+        evaluate() 가 세는 위반에 관여한 유전자들
+        depends / constrains 위반 간선의 양 끝 유전자 + hard constraint 를 만족하지 않는 유전자
+        """
+        return sorted(self.evaluate_conflicts(individual)[3])
+
+    def evaluate_delta(
+        self,
+        parent: List[int],
+        parent_eval: Tuple[float, int, int],
+        child: List[int],
+        changed: List[int],
+    ) -> Tuple[float, int, int]:
+        """
+        parent 와 changed 유전자만 다른 child 를 parent_eval 에서 출발해 재평가
+        changed 유전자에 닿는 간선만 다시 계산하므로 비용은 changed 크기에 비례
+        parent_eval 이 evaluate_conflicts 형식이면 유전자별 위반 횟수도 같은 간선들로 갱신해서 돌려줌
+        """
+        if not hasattr(self, "links"):
+            self._build_links()
+
+        unary = self.unary
+        links = self.links
+        reverse = self.reverse
+        score, conflicts, constrain_conflicts = parent_eval[:3]
+        d_score = 0.0
+        d_packed = 0
+
+        # changed 유전자에서 나가는 간선: 이전 allele 의 간선을 빼고 새 allele 의 간선을 더함
+        for i in changed:
+            a_old = parent[i]
+            a_new = child[i]
+            d_score += unary[i][a_new] - unary[i][a_old]
+            for j, row in links[i][a_old]:
+                d_packed -= row[parent[j]]
+            for j, row in links[i][a_new]:
+                d_packed += row[child[j]]
+
+        # 바뀌지 않은 유전자에서 changed 유전자로 들어오는 간선
+        changed_set = set(changed)
+        for j in changed:
+            b_old = parent[j]
+            b_new = child[j]
+            for s, rows in reverse[j]:
+                if s in changed_set:
+                    continue
+                row = rows[child[s]]
+                if row is not None:
+                    d_packed += row[b_new] - row[b_old]
+
+        d_conflicts, d_constrain = self._split_packed(d_packed)
+        score += d_score - CONFLICT_PENALTY * d_conflicts - CONSTRAIN_PENALTY * d_constrain
+        if len(parent_eval) > 3:
+            counts = self._delta_conflict_counts(parent, child, changed, changed_set, parent_eval[3])
+            return score, conflicts + d_conflicts, constrain_conflicts + d_constrain, counts
+        return score, conflicts + d_conflicts, constrain_conflicts + d_constrain
+
+    def _delta_conflict_counts(
+        self,
+        parent: List[int],
+        child: List[int],
+        changed: List[int],
+        changed_set: set,
+        parent_counts: Dict[int, int],
+    ) -> Dict[int, int]:
+        """evaluate_delta 와 같은 간선들만 보고 parent 의 유전자별 위반 횟수를 child 것으로 갱신"""
+        counts = dict(parent_counts)
+
+        def bump(g: int, d: int):
+            c = counts.get(g, 0) + d
+            if c:
+                counts[g] = c
+            else:
+                del counts[g]
+
+        links = self.links
+        for i in changed:
+            for j, row in links[i][parent[i]]:
+                if row[parent[j]]:
+                    bump(i, -1)
+                    bump(j, -1)
+            for j, row in links[i][child[i]]:
+                if row[child[j]]:
+                    bump(i, 1)
+                    bump(j, 1)
+            ok = self._hard_ok.get(i)
+            if ok is not None and ok[parent[i]] != ok[child[i]]:
+                bump(i, 1 if ok[parent[i]] else -1)
+        for j in changed:
+            for s, rows in self.reverse[j]:
+                if s in changed_set:
+                    continue
+                row = rows[child[s]]
+                if row is None:
+                    continue
+                d = bool(row[child[j]]) - bool(row[parent[j]])
+                if d:
+                    bump(s, d)
+                    bump(j, d)
+        return counts
+
+    def _split_packed(self, d_packed: int) -> Tuple[int, int]:
+        """부호 있는 packed 차이를 (depends, constrains) 차이로 분리"""
+        shift = self._pack_shift
+        half = 1 << (shift - 1)
+        d_constrain = ((d_packed + half) & ((1 << shift) - 1)) - half
+        return (d_packed - d_constrain) >> shift, d_constrain
+
+    def _move_gain(self, individual: List[int], g: int, b: int) -> float:
+        """g번 유전자만 b 로 바꿨을 때의 점수 변화 (evaluate_delta 의 유전자 1개 버전)"""
+        links = self.links
+        a = individual[g]
+        d_packed = 0
+        for j, row in links[g][a]:
+            d_packed -= row[a if j == g else individual[j]]
+        for j, row in links[g][b]:
+            d_packed += row[b if j == g else individual[j]]
+        for s, rows in self.reverse[g]:
+            if s == g:
+                continue
+            row = rows[individual[s]]
+            if row is not None:
+                d_packed += row[b] - row[a]
+
+        d_conflicts, d_constrain = self._split_packed(d_packed)
+        return (
+            self.unary[g][b] - self.unary[g][a]
+            - CONFLICT_PENALTY * d_conflicts - CONSTRAIN_PENALTY * d_constrain
+        )
+
+    def _nearest_allele(self, g: int, current: int, ok) -> Optional[int]:
+        """current 에서 인덱스(=버전 순서)가 가장 가까운, ok(b) 를 만족하는 설치 allele"""
+        n = len(self.gene_choices[g])
+        lowest = 1 if g else 0  # 패키지 유전자의 0번은 None (미설치)
+        for d in range(1, n):
+            for b in (current - d, current + d):
+                if lowest <= b < n and ok(b):
+                    return b
+        return None
+
+    def repair(self, individual: List[int], max_moves: int, moved: Optional[List[int]] = None) -> int:
+        """
+        depends 위반 간선마다 의존 대상(j)이나 의존하는 쪽(i)을 간선을 만족하는
+        가장 가까운 allele 로 옮겨 보고, 점수가 더 오르는 쪽을 받아들임 (제자리 수정)
+        최대 max_moves 번 이동, return: 실제 이동 수
+        moved: 있으면 옮긴 유전자 위치를 덧붙임 (delta 평가용)
+        """
+        if not hasattr(self, "links"):
+            self._build_links()
+
+        depends = self.depends
+        violations = [
+            (i, a, j, allowed)
+            for i, a in enumerate(individual)
+            for j, allowed in depends[i][a]
+            if not allowed[individual[j]]
+        ]
+        random.shuffle(violations)
+
+        moves = 0
+        for i, a, j, allowed in violations:
+            if moves >= max_moves:
+                break
+            # 앞선 이동으로 이미 해결됐거나 간선이 사라진 경우
+            if individual[i] != a or allowed[individual[j]]:
+                continue
+
+            candidates = []
+            b = self._nearest_allele(j, individual[j], allowed.__getitem__)
+            if b is not None:
+                candidates.append((self._move_gain(individual, j, b), j, b))
+            b = self._nearest_allele(
+                i, a,
+                lambda c: all(ok[individual[j]] for k, ok in depends[i][c] if k == j),
+            )
+            if b is not None:
+                candidates.append((self._move_gain(individual, i, b), i, b))
+
+            if candidates:
+                gain, g, b = max(candidates)
+                if gain > 0:
+                    individual[g] = b
+                    moves += 1
+                    if moved is not None:
+                        moved.append(g)
+        return moves
+
+    def _compatible(self, assigned: List[int], i: int, a: int) -> bool:
+        """i번 유전자를 a로 두었을 때 이미 정한 유전자(assigned >= 0)와 위반이 없는지"""
+        for j, row in self.links[i][a]:
+            b = a if j == i else assigned[j]
+            if b >= 0 and row[b]:
+                return False
+        for s, rows in self.reverse[i]:
+            if s == i or assigned[s] < 0:
+                continue
+            row = rows[assigned[s]]
+            if row is not None and row[a]:
+                return False
+        return True
+
+    def greedy_individual(self, roots: List[int]) -> List[int]:
+        """
+        roots 에서 depends 를 따라가며 유전자마다 이미 정한 유전자와 호환되는 가장 최신 버전을 고름
+          - python 유전자도 처음 닿았을 때 같은 방식으로 정함 (후보 목록의 뒤쪽을 최신으로 봄)
+          - 최신 후보는 GREEDY_NEWEST_PROB 확률로 받아들이고 아니면 다음 후보로 (다양성 확보)
+          - roots 에서 닿지 않는 유전자도 랜덤 순서로 같은 방식으로 채움
+          - 호환되는 버전이 없으면 미설치(None)
+        hard constraint 가 있는 유전자는 그것을 만족하는 버전 중에서 먼저 찾음
+        """
+        if not hasattr(self, "links"):
+            self._build_links()
+
+        n = len(self.gene_choices)
+        hard_ok = dict(self.hard_genes)
+        assigned = [-1] * n
+
+        def choose(i: int) -> int:
+            lowest = 1 if i else 0  # 패키지 유전자의 0번은 None (미설치)
+            candidates = range(len(self.gene_choices[i]) - 1, lowest - 1, -1)
+            ok = hard_ok.get(i)
+            if ok is not None:
+                # hard constraint 를 만족하는 버전을 먼저, 그다음 나머지
+                candidates = [a for a in candidates if ok[a]] + [a for a in candidates if not ok[a]]
+            fallback = None  # python 유전자는 0번도 실제 후보이므로 0 으로 "없음" 을 나타낼 수 없음
+            for a in candidates:
+                if not self._compatible(assigned, i, a):
+                    continue
+                if random.random() < GREEDY_NEWEST_PROB:
+                    return a
+                if fallback is None:
+                    fallback = a
+            # 호환되는 버전이 없으면 미설치 (python 유전자는 첫 후보)
+            return 0 if fallback is None else fallback
+
+        rest = list(range(n))
+        random.shuffle(rest)
+        roots = list(roots)
+        random.shuffle(roots)
+        for start in roots + rest:
+            if assigned[start] >= 0:
+                continue
+            stack = [start]
+            while stack:
+                i = stack.pop()
+                if assigned[i] >= 0:
+                    continue
+                a = assigned[i] = choose(i)
+                targets = [j for j, _ in self.depends[i][a] if assigned[j] < 0]
+                random.shuffle(targets)
+                stack.extend(targets)
+        return assigned
+
+    def evaluate_from_parents(
+        self,
+        child: List[int],
+        parents: List[Tuple[List[int], Tuple[float, int, int], Optional[List[int]]]],
+        track_conflicts: bool = False,
+    ) -> Tuple[float, int, int]:
+        """
+        parents = [(parent, parent_eval, changed), ...] 중 child 와 충분히 가까운 첫 부모로부터 delta 평가
+        changed: 교차 / 변이가 기록한 parent 와 달라진 유전자 (None 이면 염색체 전체를 비교해서 구함)
+        모든 부모와 바뀐 유전자가 너무 많으면 처음부터 다시 평가
+        track_conflicts: evaluate_conflicts 형식으로 (parent_eval 도 그 형식이어야 함)
+        """
+        max_changed = DELTA_EVAL_MAX_FRACTION * len(child)
+        for parent, parent_eval, changed in parents:
+            if changed is None:
+                changed = list(compress(range(len(child)), map(ne, parent, child)))
+            if not changed:
+                return parent_eval
+            if len(changed) <= max_changed:
+                return self.evaluate_delta(parent, parent_eval, child, changed)
+        return self.evaluate_conflicts(child) if track_conflicts else self.evaluate(child)
+
+    def _build_batch_tables(self):
+        """
+        fitness_batch 용 numpy 테이블 (처음 호출될 때 1회 생성)
+          - unary 전체를 1차원으로 이어 붙이고 유전자별 offset 으로 gather
+          - (i, j) 유전자 쌍마다 |D_i| x |D_j| 위반 횟수 행렬을 만들어 1차원으로 이어 붙임
+        """
+        sizes = [len(choices) for choices in self.gene_choices]
+
+        self._unary_offsets = np.cumsum([0] + sizes[:-1])
+        self._unary_flat = np.concatenate([np.asarray(row, dtype=np.float64) for row in self.unary])
+
+        pair_tables: Dict[Tuple[int, int], Any] = {}
+        for edge_table, channel in ((self.depends, 0), (self.constrains, 1)):
+            for i, rows in enumerate(edge_table):
+                for a, edges in enumerate(rows):
+                    for j, allowed in edges:
+                        table = pair_tables.get((i, j))
+                        if table is None:
+                            table = np.zeros((2, sizes[i], sizes[j]), dtype=np.int32)
+                            pair_tables[(i, j)] = table
+                        table[channel, a] += ~np.asarray(allowed, dtype=bool)
+
+        pairs = sorted(pair_tables)
+        self._pair_src = np.asarray([i for i, _ in pairs], dtype=np.intp)
+        self._pair_tgt = np.asarray([j for _, j in pairs], dtype=np.intp)
+        self._pair_stride = np.asarray([sizes[j] for _, j in pairs], dtype=np.intp)
+        self._pair_offsets = np.cumsum([0] + [pair_tables[p][0].size for p in pairs[:-1]]).astype(np.intp)
+        # depends / constrains 위반 횟수를 int64 하나에 상위/하위 32bit 로 묶어서 gather 1회로 처리
+        self._pair_counts = np.zeros(0, dtype=np.int64)
+        if pairs:
+            self._pair_counts = np.concatenate([
+                (pair_tables[p][0].astype(np.int64) << 32 | pair_tables[p][1]).ravel()
+                for p in pairs
+            ])
+        self._batch_ready = True
+
+    def evaluate_batch(self, population):
+        """
+        개체군 전체(개체 x 유전자 2차원 정수 배열)를 한 번에 평가
+        return: (scores, installed, conflicts, constrain_conflicts) numpy 배열들
+        """
+        return self._evaluate_batch(population)[:4]
+
+    def _evaluate_batch(self, population):
+        """evaluate_batch 에 (개체 x 유전자 쌍) 위반 횟수 행렬을 더해서 반환"""
+        if not getattr(self, "_batch_ready", False):
+            self._build_batch_tables()
+
+        pop = np.asarray(population, dtype=np.intp)
+        scores = self._unary_flat[self._unary_offsets + pop].sum(axis=1)
+        installed = np.count_nonzero(pop[:, 1:], axis=1)
+
+        idx = pop[:, self._pair_src] * self._pair_stride
+        idx += pop[:, self._pair_tgt]
+        idx += self._pair_offsets
+        pair_counts = self._pair_counts[idx]
+        counts = pair_counts.sum(axis=1)
+        conflicts = counts >> 32
+        constrain_conflicts = counts & 0xFFFFFFFF
+
+        scores = scores - CONFLICT_PENALTY * conflicts - CONSTRAIN_PENALTY * constrain_conflicts
+        return scores, installed, conflicts, constrain_conflicts, pair_counts
+
+    def evaluate_batch_conflicts(self, population) -> List[Tuple[float, int, int, Dict[int, int]]]:
+        """
+        개체마다 evaluate_conflicts 와 같은 결과 (evaluate_batch 의 gather 결과에서 위반 쌍을 골라 셈)
+        batch 테이블의 (i, j) 쌍은 links 행과 같은 단위라 횟수가 일치함
+        """
+        scores, _, conflicts, constrain_conflicts, pair_counts = self._evaluate_batch(population)
+        all_counts: List[Dict[int, int]] = [{} for _ in range(len(scores))]
+        rows, cols = np.nonzero(pair_counts)
+        for r, i, j in zip(rows.tolist(), self._pair_src[cols].tolist(), self._pair_tgt[cols].tolist()):
+            counts = all_counts[r]
+            counts[i] = counts.get(i, 0) + 1
+            counts[j] = counts.get(j, 0) + 1
+        for counts, ind in zip(all_counts, population):
+            for i, ok in self.hard_genes:
+                if not ok[ind[i]]:
+                    counts[i] = counts.get(i, 0) + 1
+        return list(zip(scores.tolist(), conflicts.tolist(), constrain_conflicts.tolist(), all_counts))
+
+    def fitness_batch(self, population) -> List[float]:
+        """evaluate_batch 의 점수만 float 리스트로 반환 (fitness() 와 같은 값)"""
+        return self.evaluate_batch(population)[0].tolist()
+
+    def _build_clusters(self):
+        """
+        linkage crossover 용 유전자 묶음 (self.clusters = [[유전자 인덱스, ...], ...])
+        i 의 설치 버전들이 j 의 설치 버전을 평균 LINKAGE_TIGHTNESS 이상 배제하면 (또는 반대로)
+        강하게 묶인 쌍으로 보고, 강한 쌍부터 union-find 로 합침 (python 유전자는 따로)
+        """
+        n = len(self.gene_choices)
+        tightness: Dict[Tuple[int, int], float] = {}
+        for i in range(1, n):
+            installed = len(self.gene_choices[i]) - 1
+            if installed <= 0:
+                continue
+            excluded: Dict[int, float] = {}
+            for a in range(1, installed + 1):
+                for j, allowed in self.depends[i][a]:
+                    if j == 0 or j == i or len(allowed) <= 1:
+                        continue
+                    fraction = allowed[1:].count(False) / (len(allowed) - 1)
+                    excluded[j] = excluded.get(j, 0.0) + fraction
+            for j, total in excluded.items():
+                pair = (min(i, j), max(i, j))
+                tightness[pair] = max(tightness.get(pair, 0.0), total / installed)
+
+        parent = list(range(n))
+        size = [1] * n
+        max_size = max(2, int(LINKAGE_MAX_CLUSTER_FRACTION * n))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for (i, j), t in sorted(tightness.items(), key=lambda kv: -kv[1]):
+            if t < LINKAGE_TIGHTNESS:
+                break
+            ri, rj = find(i), find(j)
+            if ri == rj or size[ri] + size[rj] > max_size:
+                continue
+            if size[ri] < size[rj]:
+                ri, rj = rj, ri
+            parent[rj] = ri
+            size[ri] += size[rj]
+
+        groups: Dict[int, List[int]] = {}
+        for g in range(n):
+            groups.setdefault(find(g), []).append(g)
+        self.clusters = list(groups.values())
+
+
+
+#  Fitness 캐시
+
+
+def chromosome_key(individual: List[int]) -> bytes:
+    """염색체를 16바이트 해시로 압축 (FitnessCache 키)"""
+    return hashlib.blake2b(array("I", individual).tobytes(), digest_size=16).digest()
+
+
+class FitnessCache:
+    """
+    chromosome_key -> 평가 결과 (score, conflicts, constrain_conflicts) LRU 캐시
+    maxsize 를 넘으면 가장 오래 쓰이지 않은 항목부터 제거
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[bytes, Tuple[float, int, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: bytes) -> Optional[Tuple[float, int, int]]:
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: bytes, value: Tuple[float, int, int]):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def state(self):
+        """checkpoint 용 (LRU 순서의 항목들, hits, misses)"""
+        return list(self._data.items()), self.hits, self.misses
+
+    def load_state(self, state):
+        items, self.hits, self.misses = state
+        self._data = OrderedDict(items[-self.maxsize:])
+
+
+#  멀티코어 평가
+
+# 워커 프로세스가 들고 있는 CompiledRepo (fork 로 상속되거나 워커당 1회만 전달됨)
+_worker_compiled: Optional[CompiledRepo] = None
+
+
+def _ignore_stop_signals():
+    """워커는 SIGINT 를 무시하고 SIGTERM 은 기본 동작으로 (중단 처리는 메인 프로세스가 담당)"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+def _init_worker(compiled: CompiledRepo):
+    global _worker_compiled
+    _ignore_stop_signals()
+    _worker_compiled = compiled
+
+
+def _evaluate_item(item) -> Tuple[float, int, int]:
+    individual, parents, track_conflicts = item
+    if parents is not None:
+        return _worker_compiled.evaluate_from_parents(individual, parents, track_conflicts)
+    if track_conflicts:
+        return _worker_compiled.evaluate_conflicts(individual)
+    return _worker_compiled.evaluate(individual)
+
+
+class EvaluationPool:
+    """
+    fitness 평가용 프로세스 풀
+    CompiledRepo 는 풀 생성 시 initializer 로 한 번만 넘긴다.
+    fork 를 쓸 수 있으면 pickle 없이 부모 메모리를 그대로 상속하고,
+    아니면 워커당 1회만 pickle 된다. 세대마다 넘어가는 것은 염색체뿐이다.
+    """
+
+    def __init__(self, compiled: CompiledRepo, workers: int):
+        try:
+            ctx = multiprocessing.get_context("fork")
+        except ValueError:
+            ctx = multiprocessing.get_context()
+        self.workers = workers
+        self._pool = ctx.Pool(workers, initializer=_init_worker, initargs=(compiled,))
+
+    def evaluate(self, items) -> List[Tuple[float, int, int]]:
+        """items = [(individual, parents or None, track_conflicts), ...]"""
+        chunksize = max(1, len(items) // (self.workers * 4))
+        return self._pool.map(_evaluate_item, items, chunksize=chunksize)
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def terminate(self):
+        self._pool.terminate()
+        self._pool.join()
+
+
+def evaluate_population(
+    population: List[List[int]],
+    compiled: CompiledRepo,
+    parents: Optional[List[List[Tuple[List[int], Tuple[float, int, int], Optional[List[int]]]]]] = None,
+    cache: Optional[FitnessCache] = None,
+    batch_eval: bool = False,
+    pool: Optional[EvaluationPool] = None,
+    track_conflicts: bool = False,
+) -> List[Tuple[float, int, int]]:
+    """
+    개체군 전체 평가 -> 개체별 (score, conflicts, constrain_conflicts)
+    parents: 개체별 [(parent, parent_eval, changed), ...] 이 있으면 delta 평가 사용 (evaluate_from_parents)
+    cache: 있으면 캐시에 있는 염색체와 같은 세대 안의 중복 염색체는 다시 평가하지 않음
+    pool: 있으면 캐시 miss 개체들을 워커 프로세스에 나눠서 평가 (batch_eval 이면 사용 안 함)
+    track_conflicts: 개체별 결과에 evaluate_conflicts 처럼 유전자별 위반 횟수를 붙임 (conflict 변이용)
+    """
+    evals: List[Optional[Tuple[float, int, int]]] = [None] * len(population)
+    pending: Dict[Any, List[int]] = {}
+    for k, ind in enumerate(population):
+        if cache is None:
+            pending[k] = [k]
+            continue
+        key = chromosome_key(ind)
+        if key in pending:
+            pending[key].append(k)
+            cache.hits += 1
+            continue
+        hit = cache.get(key)
+        if hit is not None:
+            evals[k] = hit
+        else:
+            pending[key] = [k]
+
+    todo = [ks[0] for ks in pending.values()]
+    if batch_eval and todo and track_conflicts:
+        results = compiled.evaluate_batch_conflicts([population[k] for k in todo])
+    elif batch_eval and todo:
+        scores, _, conflicts, constrain_conflicts = compiled.evaluate_batch([population[k] for k in todo])
+        results = list(zip(scores.tolist(), conflicts.tolist(), constrain_conflicts.tolist()))
+    elif pool is not None and todo:
+        results = pool.evaluate([
+            (population[k], parents[k] if parents is not None else None, track_conflicts)
+            for k in todo
+        ])
+    elif parents is not None:
+        results = [compiled.evaluate_from_parents(population[k], parents[k], track_conflicts) for k in todo]
+    elif track_conflicts:
+        results = [compiled.evaluate_conflicts(population[k]) for k in todo]
+    else:
+        results = [compiled.evaluate(population[k]) for k in todo]
+
+    for (key, ks), result in zip(pending.items(), results):
+        for k in ks:
+            evals[k] = result
+        if cache is not None:
+            cache.put(key, result)
+    return evals
+
+
 
 #  GA 연산 (선택 / 교차 / 변이)
 
+# conflict 변이: 위반에 관여한 유전자의 변이 확률 (초기값 / 하한 / 상한)
+CONFLICT_PM_INITIAL = 0.25
+CONFLICT_PM_MIN = 0.05
+CONFLICT_PM_MAX = 0.8
+# conflict 변이: 최고 적합도가 오른 세대에는 DECAY 배, 정체된 세대에는 GROW 배
+CONFLICT_PM_DECAY = 0.9
+CONFLICT_PM_GROW = 1.1
+# conflict 변이: 위반과 무관한 유전자는 pm 에 이 비율을 곱한 확률로 변이
+CONFLICT_BACKGROUND_FRACTION = 0.1
+
 
 def random_individual(gene_choices: List[List[Optional[str]]]) -> List[int]:
     return [random.randrange(len(choices)) for choices in gene_choices]
@@ -354,28 +1478,64 @@ def tournament_selection(
     """
     k-토너먼트 선택
     """
+    return population[tournament_selection_index(fitnesses, k)][:]
+
+
+def tournament_selection_index(fitnesses: List[float], k: int = 3) -> int:
+    """
+    k-토너먼트 선택 (선택된 개체의 인덱스 반환)
+    """
     best_idx = None
     for _ in range(k):
-        i = random.randrange(len(population))
+        i = random.randrange(len(fitnesses))
         if best_idx is None or fitnesses[i] > fitnesses[best_idx]:
             best_idx = i
-    return population[best_idx][:]
+    return best_idx
 
 
 def crossover(
     parent1: List[int],
     parent2: List[int],
     pc: float = 0.9,
+    with_swapped: bool = False,
 ):
     """
     1-point crossover
+    with_swapped: True 면 c1 이 parent2 에게서 (c2 는 parent1 에게서) 받은 유전자 위치도 반환 (delta 평가용)
     """
     if random.random() > pc:
-        return parent1[:], parent2[:]
-    point = random.randrange(1, len(parent1))  
-    c1 = parent1[:point] + parent2[point:]
-    c2 = parent2[:point] + parent1[point:]
-    return c1, c2
+        c1, c2, swapped = parent1[:], parent2[:], range(0)
+    else:
+        point = random.randrange(1, len(parent1))
+        c1 = parent1[:point] + parent2[point:]
+        c2 = parent2[:point] + parent1[point:]
+        swapped = range(point, len(parent1))
+    return (c1, c2, swapped) if with_swapped else (c1, c2)
+
+
+def linkage_crossover(
+    parent1: List[int],
+    parent2: List[int],
+    clusters: List[List[int]],
+    pc: float = 0.9,
+    with_swapped: bool = False,
+):
+    """
+    유전자 묶음(CompiledRepo.clusters) 단위 uniform crossover
+    묶음마다 어느 부모에게서 통째로 물려받을지 정하므로 강하게 묶인 패키지가 갈라지지 않음
+    with_swapped: crossover 와 같음
+    """
+    c1 = parent1[:]
+    c2 = parent2[:]
+    swapped: List[int] = []
+    if random.random() <= pc:
+        for cluster in clusters:
+            if random.random() < 0.5:
+                for g in cluster:
+                    c1[g] = parent2[g]
+                    c2[g] = parent1[g]
+                swapped.extend(cluster)
+    return (c1, c2, swapped) if with_swapped else (c1, c2)
 
 
 def mutate(
@@ -385,16 +1545,765 @@ def mutate(
 ):
     """
     각 유전자마다 확률 pm으로 다른 값으로 랜덤하게 변경
+    return: 변이를 적용한 유전자 위치 (값이 그대로일 수도 있음)
     """
+    mutated = []
     for i in range(len(individual)):
         if random.random() < pm:
             individual[i] = random.randrange(len(gene_choices[i]))
+            mutated.append(i)
+    return mutated
+
+
+def conflict_mutate(
+    individual: List[int],
+    gene_choices: List[List[Optional[str]]],
+    conflict_genes: List[int],
+    pm_conflict: float,
+    pm_background: float,
+):
+    """
+    conflict_genes 는 확률 pm_conflict, 나머지 유전자는 pm_background 로 랜덤하게 변경
+    나머지 유전자는 다음 변이 위치까지의 간격을 기하분포로 뽑아 유전자마다 난수를 쓰지 않음
+    return: mutate 와 같음
+    """
+    mutated = []
+    for g in conflict_genes:
+        if random.random() < pm_conflict:
+            individual[g] = random.randrange(len(gene_choices[g]))
+            mutated.append(g)
+
+    if pm_background <= 0:
+        return mutated
+    if pm_background >= 1:
+        return mutated + mutate(individual, gene_choices, pm=1.0)
+    n = len(individual)
+    log_q = math.log(1.0 - pm_background)
+    g = -1
+    while True:
+        g += 1 + int(math.log(1.0 - random.random()) / log_q)
+        if g >= n:
+            break
+        individual[g] = random.randrange(len(gene_choices[g]))
+        mutated.append(g)
+    return mutated
+
+
+def batch_tournament(fitnesses, n_pairs: int, k: int, rng):
+    """
+    세대 전체의 k-토너먼트를 한 번의 난수 draw 로 (numpy 필요)
+    fitnesses: (P,) 배열, rng: numpy Generator
+    return: 쌍마다 두 부모의 인덱스 (n_pairs, 2) 배열
+    """
+    entrants = rng.integers(0, len(fitnesses), size=(n_pairs, 2, k))
+    # tournament_selection_index 처럼 fitness 가 같으면 먼저 뽑힌 개체
+    best = fitnesses[entrants].argmax(axis=2)
+    return np.take_along_axis(entrants, best[..., None], axis=2)[..., 0]
+
+
+def batch_crossover_mutate(population, parents, n_choices, rng, pc: float, pm: float, gene_cluster=None):
+    """
+    parents 쌍마다 교차해 자식 둘을 만들고 uniform 변이까지 배열 연산으로 (numpy 필요)
+    population: (P, G) 정수 배열, parents: batch_tournament 결과, n_choices: 유전자별 allele 수 (G,) 배열
+    gene_cluster: 있으면 유전자별 묶음 번호 (묶음 밖은 -1) 로 linkage_crossover, 없으면 crossover 와 같은 1-point
+    return: 쌍 순서대로 (c1, c2) 를 이어 붙인 (2 * n_pairs, G) 배열
+    """
+    n_pairs = len(parents)
+    n_genes = population.shape[1]
+    p1 = population[parents[:, 0]]
+    p2 = population[parents[:, 1]]
+
+    if gene_cluster is None:
+        # 1-point: point 부터 끝까지를 맞바꿈
+        points = rng.integers(1, max(n_genes, 2), size=n_pairs)
+        swap = np.arange(n_genes)[None, :] >= points[:, None]
+    else:
+        # 묶음마다 절반 확률로 맞바꿈, 마지막 열(-1 번)은 묶음 밖 유전자용으로 항상 False
+        n_clusters = int(gene_cluster.max()) + 1
+        bits = rng.random((n_pairs, n_clusters + 1)) < 0.5
+        bits[:, -1] = False
+        swap = bits[:, gene_cluster]
+    swap &= (rng.random(n_pairs) < pc)[:, None]
+
+    children = np.empty((2 * n_pairs, n_genes), dtype=population.dtype)
+    children[0::2] = np.where(swap, p2, p1)
+    children[1::2] = np.where(swap, p1, p2)
+
+    rows, cols = np.nonzero(rng.random(children.shape) < pm)
+    children[rows, cols] = rng.integers(0, n_choices[cols])
+    return children
+
+
+def _kept_genes(swapped, n_genes: int):
+    """crossover 의 swapped 가 아닌 유전자 위치"""
+    if isinstance(swapped, range):
+        # 1-point crossover 는 항상 뒤쪽을 맞바꿈
+        return range(swapped.start)
+    swapped = set(swapped)
+    return [g for g in range(n_genes) if g not in swapped]
+
+
+def _changed_genes(parent: List[int], child: List[int], crossed, touched: List[int]) -> List[int]:
+    """
+    교차 / 변이가 기록한 위치만 보고 child 가 parent 와 달라진 유전자를 구함 (delta 평가용)
+    crossed: 교차로 다른 부모에게서 받았을 수 있는 위치, touched: 변이 / repair 가 바꾼 위치
+    """
+    changed = set(compress(crossed, map(ne, map(parent.__getitem__, crossed), map(child.__getitem__, crossed))))
+    changed.update(g for g in touched if parent[g] != child[g])
+    return sorted(changed)
 
 
 
 #  GA 메인 루프
 
 
+class Evolution:
+    """
+    개체군 하나의 진화 상태 (개체군, 평가 결과, 지금까지의 최고 개체)
+    한 세대 = evaluate() 후 breed()
+    """
+
+    _STATE_FIELDS = (
+        "population", "evals", "fitnesses", "best_individual", "best_fitness", "pm_conflict",
+        "origins", "prev_population", "prev_evals", "n_evaluations", "rng",
+    )
+
+    def __init__(
+        self,
+        compiled: CompiledRepo,
+        population: List[List[int]],
+        pc: float = 0.9,
+        pm: float = 0.05,
+        tournament_k: int = 3,
+        incremental_eval: bool = True,
+        cache: Optional[FitnessCache] = None,
+        batch_eval: bool = False,
+        pool: Optional[EvaluationPool] = None,
+        repair_moves: int = 0,
+        crossover_op: str = "onepoint",
+        mutation_op: str = "uniform",
+        batch_variation: bool = False,
+        steady_state: bool = False,
+        steady_offspring: int = 2,
+    ):
+        self.compiled = compiled
+        self.gene_choices = compiled.gene_choices
+        self.population = population
+        self.pc = pc
+        self.pm = pm
+        self.tournament_k = tournament_k
+        self.incremental_eval = incremental_eval
+        self.cache = cache
+        self.batch_eval = batch_eval
+        self.pool = pool
+        self.repair_moves = repair_moves
+        self.clusters = None
+        if crossover_op == "linkage":
+            if not hasattr(compiled, "clusters"):
+                compiled._build_clusters()
+            self.clusters = compiled.clusters
+        # conflict 변이: 위반 유전자의 변이 확률은 세대마다 조정, 나머지는 pm 의 일부로 고정
+        self.conflict_mutation = mutation_op == "conflict"
+        self.pm_conflict = CONFLICT_PM_INITIAL
+        self.pm_background = pm * CONFLICT_BACKGROUND_FRACTION
+
+        self.evals: List[Tuple[float, int, int]] = []
+        self.fitnesses: List[float] = []
+        self.best_individual: Optional[List[int]] = None
+        self.best_fitness = -math.inf
+        # 자식별 (delta 평가의 기준 부모 인덱스, 그 부모와 달라진 유전자) 와 부모 세대 (첫 세대는 없음)
+        # 달라진 유전자는 incremental_eval 일 때만 교차 / 변이 / repair 가 기록 (아니면 None)
+        self.origins: Optional[List[Tuple[int, Optional[List[int]]]]] = None
+        self.prev_population: List[List[int]] = []
+        self.prev_evals: List[Tuple[float, int, int]] = []
+        # 실제로 평가한 염색체 수 (캐시 hit 과 같은 세대 안의 중복은 제외)
+        self.n_evaluations = 0
+        # 있으면 breed 가 선택 / 교차·변이(repair 포함)에 쓴 시간을 "selection" / "variation" 에 더함 (trace 용)
+        self.timings: Optional[Dict[str, float]] = None
+
+        # batch_variation: 선택 / 교차 / 변이를 numpy 배열 연산으로 (conflict 변이는 지원 안 함)
+        # 난수는 random 에서 seed 를 받은 numpy Generator 에서 세대마다 몇 번의 배열 draw 로 뽑으므로 seed 가 같으면 재현됨
+        self.rng = None
+        if batch_variation:
+            self.rng = np.random.default_rng(random.getrandbits(64))
+            self.n_choices = np.array([len(choices) for choices in self.gene_choices], dtype=np.int64)
+            self.gene_cluster = None
+            if self.clusters is not None:
+                self.gene_cluster = np.full(len(self.gene_choices), -1, dtype=np.int64)
+                for c, cluster in enumerate(self.clusters):
+                    self.gene_cluster[cluster] = c
+        # 현재 개체군의 배열 (batch_variation 이 만든 세대면 다시 변환하지 않음)
+        self.population_array = None
+
+        # steady-state: breed 가 자식을 steady_offspring 개씩 평가해서 바로 최악 개체와 교체
+        self.steady_state = steady_state
+        self.steady_offspring = max(1, steady_offspring)
+        # 개체군의 염색체 -> 개수 (중복 자식을 거르는 데 사용, 개체군이 바깥에서 바뀌면 None 으로 두고 다시 만듦)
+        self.population_counts: Optional[Dict[bytes, int]] = None
+
+    def state(self) -> Dict[str, Any]:
+        """checkpoint 용 진화 상태 (compiled, cache, pool 같은 실행 환경은 제외)"""
+        return {name: getattr(self, name) for name in self._STATE_FIELDS}
+
+    def load_state(self, state: Dict[str, Any]):
+        for name in self._STATE_FIELDS:
+            setattr(self, name, state[name])
+        self.population_array = None
+        self.population_counts = None
+
+    def evaluate(self):
+        """현재 개체군을 평가하고 최고 개체를 갱신"""
+        if self.steady_state and self.fitnesses:
+            # steady-state 는 breed 에서 자식을 평가해 교체하므로 첫 세대 이후 개체군은 항상 평가된 상태
+            return
+        parents = None
+        if self.incremental_eval and self.origins is not None:
+            parents = [
+                [(self.prev_population[i], self.prev_evals[i], changed)]
+                for i, changed in self.origins
+            ]
+        misses = self.cache.misses if self.cache is not None else 0
+        self.evals = evaluate_population(
+            self.population, self.compiled, parents, self.cache, self.batch_eval, self.pool,
+            track_conflicts=self.conflict_mutation,
+        )
+        self.n_evaluations += self.cache.misses - misses if self.cache is not None else len(self.population)
+        self.fitnesses = [e[0] for e in self.evals]
+
+        prev_best = self.best_fitness
+        for ind, f in zip(self.population, self.fitnesses):
+            if f > self.best_fitness:
+                self.best_fitness = f
+                self.best_individual = ind[:]
+
+        if self.conflict_mutation and self.origins is not None:
+            # 개선되면 위반 유전자 근처를 덜 흔들고, 정체되면 더 강하게 흔듦
+            if self.best_fitness > prev_best:
+                self.pm_conflict = max(CONFLICT_PM_MIN, self.pm_conflict * CONFLICT_PM_DECAY)
+            else:
+                self.pm_conflict = min(CONFLICT_PM_MAX, self.pm_conflict * CONFLICT_PM_GROW)
+
+    def breed(self):
+        """토너먼트 선택 / 교차 / 변이 (/ repair) 로 다음 세대 개체군 생성"""
+        if self.steady_state:
+            self._breed_steady()
+            return
+        if self.rng is not None:
+            self._breed_batch()
+            return
+        population = self.population
+        fitnesses = self.fitnesses
+        pop_size = len(population)
+
+        new_population: List[List[int]] = []
+        origins = []
+        while len(new_population) < pop_size:
+            c1, c2, o1, o2 = self._offspring()
+            new_population.append(c1)
+            origins.append(o1)
+            if len(new_population) < pop_size:
+                new_population.append(c2)
+                origins.append(o2)
+
+        self.prev_population, self.prev_evals = population, self.evals
+        self.origins = origins
+        self.population = new_population
+
+    def _breed_steady(self):
+        """
+        breed 의 steady-state 버전: 세대 하나만큼(pop_size 개)의 자식을 steady_offspring 개씩 만들어
+        바로 평가하고, 개체군의 최악 개체보다 나쁘지 않으면 그 개체와 교체 (좋은 개체는 사라지지 않음)
+        개체군이나 같은 묶음에 이미 있는 염색체와 같은 자식은 평가하지 않고 버림
+        """
+        population = self.population
+        evals = self.evals
+        fitnesses = self.fitnesses
+        pop_size = len(population)
+        if self.population_counts is None:
+            self.population_counts = {}
+            for ind in population:
+                key = chromosome_key(ind)
+                self.population_counts[key] = self.population_counts.get(key, 0) + 1
+        counts = self.population_counts
+        timings = self.timings
+        prev_best = self.best_fitness
+
+        n_bred = 0
+        while n_bred < pop_size:
+            children: List[List[int]] = []
+            keys: List[bytes] = []
+            parents = []
+            while len(children) < self.steady_offspring and n_bred < pop_size:
+                c1, c2, o1, o2 = self._offspring()
+                for child, (i, changed) in ((c1, o1), (c2, o2)):
+                    n_bred += 1
+                    key = chromosome_key(child)
+                    if key in counts or key in keys:
+                        continue
+                    children.append(child)
+                    keys.append(key)
+                    parents.append([(population[i], evals[i], changed)])
+            if not children:
+                continue
+
+            if timings is not None:
+                t0 = time.perf_counter()
+            misses = self.cache.misses if self.cache is not None else 0
+            child_evals = evaluate_population(
+                children, self.compiled, parents if self.incremental_eval else None,
+                self.cache, self.batch_eval, self.pool, track_conflicts=self.conflict_mutation,
+            )
+            self.n_evaluations += self.cache.misses - misses if self.cache is not None else len(children)
+            if timings is not None:
+                timings["evaluation"] += time.perf_counter() - t0
+
+            for child, key, ev in zip(children, keys, child_evals):
+                worst = min(range(pop_size), key=fitnesses.__getitem__)
+                if ev[0] < fitnesses[worst]:
+                    continue
+                old_key = chromosome_key(population[worst])
+                if counts[old_key] == 1:
+                    del counts[old_key]
+                else:
+                    counts[old_key] -= 1
+                counts[key] = 1
+                population[worst] = child
+                evals[worst] = ev
+                fitnesses[worst] = ev[0]
+                if ev[0] > self.best_fitness:
+                    self.best_fitness = ev[0]
+                    self.best_individual = child[:]
+
+        if self.conflict_mutation:
+            # evaluate 와 같은 규칙으로 세대마다 위반 유전자 변이 확률을 조정
+            if self.best_fitness > prev_best:
+                self.pm_conflict = max(CONFLICT_PM_MIN, self.pm_conflict * CONFLICT_PM_DECAY)
+            else:
+                self.pm_conflict = min(CONFLICT_PM_MAX, self.pm_conflict * CONFLICT_PM_GROW)
+
+    def _offspring(self):
+        """
+        토너먼트로 부모 둘을 고르고 교차 / 변이 (/ repair) 한 자식 둘
+        return: (c1, c2, o1, o2), o 는 자식별 (기준 부모 인덱스, 그 부모와 달라진 유전자 또는 None)
+        """
+        population = self.population
+        fitnesses = self.fitnesses
+        timings = self.timings
+        if timings is not None:
+            t0 = time.perf_counter()
+        i1 = tournament_selection_index(fitnesses, k=self.tournament_k)
+        i2 = tournament_selection_index(fitnesses, k=self.tournament_k)
+        if timings is not None:
+            t1 = time.perf_counter()
+            timings["selection"] += t1 - t0
+        p1, p2 = population[i1], population[i2]
+        if self.clusters is not None:
+            c1, c2, swapped = linkage_crossover(p1, p2, self.clusters, pc=self.pc, with_swapped=True)
+        else:
+            c1, c2, swapped = crossover(p1, p2, pc=self.pc, with_swapped=True)
+        if self.conflict_mutation:
+            # 자식의 위반은 대부분 부모에게서 물려받으므로 두 부모의 위반 유전자를 대상으로 삼음
+            # (평가할 때 evaluate_conflicts 형식으로 함께 센 것)
+            genes = sorted(self.evals[i1][3].keys() | self.evals[i2][3].keys())
+            m1 = conflict_mutate(c1, self.gene_choices, genes, self.pm_conflict, self.pm_background)
+            m2 = conflict_mutate(c2, self.gene_choices, genes, self.pm_conflict, self.pm_background)
+        else:
+            m1 = mutate(c1, self.gene_choices, pm=self.pm)
+            m2 = mutate(c2, self.gene_choices, pm=self.pm)
+        if self.repair_moves:
+            self.compiled.repair(c1, self.repair_moves, m1)
+            self.compiled.repair(c2, self.repair_moves, m2)
+
+        if not self.incremental_eval:
+            o1, o2 = (i1, None), (i2, None)
+        elif 2 * len(swapped) <= len(c1):
+            # 교차로 바뀐 쪽이 절반 이하면 자식은 교차 전의 부모에 가까움
+            o1 = (i1, _changed_genes(p1, c1, swapped, m1))
+            o2 = (i2, _changed_genes(p2, c2, swapped, m2))
+        else:
+            kept = _kept_genes(swapped, len(c1))
+            o1 = (i2, _changed_genes(p2, c1, kept, m1))
+            o2 = (i1, _changed_genes(p1, c2, kept, m2))
+        if timings is not None:
+            timings["variation"] += time.perf_counter() - t1
+        return c1, c2, o1, o2
+
+    def _breed_batch(self):
+        """breed 의 batch_variation 버전: 세대 전체를 batch_tournament / batch_crossover_mutate 로"""
+        timings = self.timings
+        if timings is not None:
+            t0 = time.perf_counter()
+        population = self.population
+        pop_size = len(population)
+        if self.population_array is None:
+            self.population_array = np.array(population, dtype=np.int32)
+        parents = batch_tournament(np.asarray(self.fitnesses), (pop_size + 1) // 2, self.tournament_k, self.rng)
+        if timings is not None:
+            t1 = time.perf_counter()
+            timings["selection"] += t1 - t0
+
+        children = batch_crossover_mutate(
+            self.population_array, parents, self.n_choices, self.rng, self.pc, self.pm, self.gene_cluster,
+        )[:pop_size]
+        new_population = children.tolist()
+        if self.repair_moves:
+            for child in new_population:
+                self.compiled.repair(child, self.repair_moves)
+            children = None
+        if timings is not None:
+            timings["variation"] += time.perf_counter() - t1
+
+        pairs = np.repeat(parents, 2, axis=0)[:pop_size]
+        if self.incremental_eval:
+            # 자식마다 덜 달라진 부모를 기준으로 달라진 유전자를 배열 연산으로 구함
+            if children is None:
+                children = np.array(new_population, dtype=self.population_array.dtype)
+            diff1 = children != self.population_array[pairs[:, 0]]
+            diff2 = children != self.population_array[pairs[:, 1]]
+            use2 = diff2.sum(axis=1) < diff1.sum(axis=1)
+            diff = np.where(use2[:, None], diff2, diff1)
+            bases = np.where(use2, pairs[:, 1], pairs[:, 0]).tolist()
+            origins = [(i, np.flatnonzero(row).tolist()) for i, row in zip(bases, diff)]
+        else:
+            origins = [(i, None) for i in pairs[:, 0].tolist()]
+
+        self.prev_population, self.prev_evals = population, self.evals
+        self.origins = origins
+        self.population = new_population
+        self.population_array = children
+
+    def emigrants(self, k: int) -> List[Tuple[List[int], Tuple[float, int, int]]]:
+        """평가된 현재 개체군의 상위 k 개체 (복사본, 평가 결과)"""
+        order = sorted(range(len(self.population)), key=lambda i: self.fitnesses[i], reverse=True)
+        return [(self.population[i][:], self.evals[i]) for i in order[:k]]
+
+    def immigrate(self, migrants: List[Tuple[List[int], Tuple[float, int, int]]]):
+        """평가된 현재 개체군의 하위 개체들을 migrants 로 교체"""
+        order = sorted(range(len(self.population)), key=lambda i: self.fitnesses[i])
+        self.population_array = None
+        self.population_counts = None
+        for i, (ind, ev) in zip(order, migrants):
+            self.population[i] = ind
+            self.evals[i] = ev
+            self.fitnesses[i] = ev[0]
+            if ev[0] > self.best_fitness:
+                self.best_fitness = ev[0]
+                self.best_individual = ind[:]
+
+    def run_epoch(self, n_generations: int, migrants=None):
+        """
+        (섬 모델용) 이전 epoch 의 마지막 평가 세대에 migrants 를 받아들인 뒤
+        n_generations 세대를 진행. epoch 가 끝나면 개체군은 평가된 상태
+        """
+        if self.evals:
+            if migrants:
+                self.immigrate(migrants)
+            self.breed()
+        for g in range(n_generations):
+            if g:
+                self.breed()
+            self.evaluate()
+
+
+class StopCondition:
+    """
+    조기 종료 조건
+      - time_limit: 시작 후 time_limit 초가 지나면 종료
+      - deadline: time.monotonic() 기준 절대 시각, 지나면 종료 (여러 run_ga 가 예산 하나를 나눠 쓸 때)
+      - stall_generations: 그 세대 수 동안 best fitness 가 나아지지 않으면 종료
+    """
+
+    def __init__(
+        self,
+        time_limit: Optional[float] = None,
+        stall_generations: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ):
+        if time_limit:
+            limit_deadline = time.monotonic() + time_limit
+            deadline = limit_deadline if deadline is None else min(deadline, limit_deadline)
+        self.deadline = deadline
+        self.stall_generations = stall_generations
+        self.best_fitness = -math.inf
+        self.last_improved = 0
+
+    def check(self, gen: int, best_fitness: float) -> Optional[str]:
+        """gen 세대까지 진행한 뒤 호출. 멈춰야 하면 이유 문자열 반환"""
+        if best_fitness > self.best_fitness:
+            self.best_fitness = best_fitness
+            self.last_improved = gen
+        if self.stall_generations and gen - self.last_improved >= self.stall_generations:
+            return f"{self.stall_generations}세대 동안 개선 없음"
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return "시간 제한 도달"
+        return None
+
+
+
+#  trace
+
+class GenerationTrace:
+    """
+    세대마다 JSON 한 줄을 path 에 씀 (run_ga 의 trace_path)
+      - seconds: 이 세대를 만든 선택 / 교차·변이 시간과 이 세대의 평가 시간
+        (steady-state 는 이 세대를 만들며 자식을 평가한 시간)
+      - evaluations / evaluations_per_second: 실제로 평가한 염색체 수와 평가 처리량
+      - fitness: 세대의 best / mean / median 과 지금까지의 best
+      - diversity: 서로 다른 염색체 비율(unique)과 유전자별로 최빈 allele 이 아닌 개체 비율의 평균(genes)
+      - conflicts / constrain_conflicts: 세대 최고 개체의 위반 수와 세대 평균
+      - cache: 이 세대의 hit 비율과 누적 hit 비율 (캐시가 없으면 null)
+    """
+
+    def __init__(self, path: str, evolution: Evolution, cache: Optional[FitnessCache]):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(path, "w")
+        self.start = time.perf_counter()
+        self.evolution = evolution
+        self.cache = cache
+        # 체크포인트에서 재개한 경우에도 이번 실행의 세대별 차이만 기록
+        self.evaluations = evolution.n_evaluations
+        self.cache_counts = (cache.hits, cache.misses) if cache is not None else (0, 0)
+        # evaluation 은 steady-state 에서 breed 안의 자식 평가 시간
+        self.timings = evolution.timings = {"selection": 0.0, "variation": 0.0, "evaluation": 0.0}
+
+    def record(self, gen: int, evaluation_seconds: float):
+        evaluation_seconds += self.timings["evaluation"]
+        evolution = self.evolution
+        cache = self.cache
+        population = evolution.population
+        fitnesses = evolution.fitnesses
+        n = len(population)
+        evaluations = evolution.n_evaluations - self.evaluations
+        self.evaluations = evolution.n_evaluations
+
+        ranked = sorted(fitnesses)
+        mid = n // 2
+        median = ranked[mid] if n % 2 else (ranked[mid - 1] + ranked[mid]) / 2
+        best = max(range(n), key=fitnesses.__getitem__)
+
+        unique = len({chromosome_key(ind) for ind in population}) / n
+        off_mode = 0
+        for alleles in zip(*population):
+            counts: Dict[int, int] = {}
+            for a in alleles:
+                counts[a] = counts.get(a, 0) + 1
+            off_mode += n - max(counts.values())
+        genes = off_mode / (n * len(population[0]))
+
+        cache_stats = None
+        if cache is not None:
+            hits, misses = cache.hits - self.cache_counts[0], cache.misses - self.cache_counts[1]
+            self.cache_counts = (cache.hits, cache.misses)
+            cache_stats = {
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "total_hit_rate": cache.hits / (cache.hits + cache.misses) if cache.hits + cache.misses else 0.0,
+            }
+
+        line = {
+            "gen": gen,
+            "elapsed": time.perf_counter() - self.start,
+            "seconds": dict(self.timings, evaluation=evaluation_seconds),
+            "evaluations": evaluations,
+            "evaluations_per_second": evaluations / evaluation_seconds if evaluation_seconds > 0 else None,
+            "fitness": {
+                "best": ranked[-1],
+                "mean": sum(fitnesses) / n,
+                "median": median,
+                "best_ever": evolution.best_fitness,
+            },
+            "diversity": {"unique": unique, "genes": genes},
+            "conflicts": {"best": evolution.evals[best][1], "mean": sum(e[1] for e in evolution.evals) / n},
+            "constrain_conflicts": {"best": evolution.evals[best][2], "mean": sum(e[2] for e in evolution.evals) / n},
+            "cache": cache_stats,
+        }
+        self.file.write(json.dumps(line) + "\n")
+        self.file.flush()
+        for key in self.timings:
+            self.timings[key] = 0.0
+
+    def close(self):
+        self.file.close()
+
+
+
+#  checkpoint
+
+CHECKPOINT_VERSION = 6
+
+
+def problem_fingerprint(
+    package_names: List[str],
+    gene_choices: List[List[Optional[str]]],
+    options: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    체크포인트가 같은 인코딩(패키지, allele 목록)과 같은 GA 옵션에서 저장된 것인지 확인하기 위한 해시
+    options: 진화 과정을 바꾸는 run_ga 인자 (pop_size, pc, pm, hard_constraints, 세대 방식, ...)
+    """
+    data = json.dumps([package_names, gene_choices, options or {}], sort_keys=True).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def save_checkpoint(
+    path: str,
+    fingerprint: str,
+    generation: int,
+    evolution: Evolution,
+    cache: Optional[FitnessCache],
+    stop: StopCondition,
+):
+    """
+    다음에 평가할 세대 번호, 진화 상태, 캐시, 난수 상태를 gzip 으로 압축한 pickle 로 저장
+    임시 파일에 쓴 뒤 교체하므로 저장 도중 중단되어도 이전 체크포인트는 남음
+    """
+    state = {
+        "version": CHECKPOINT_VERSION,
+        "fingerprint": fingerprint,
+        "generation": generation,
+        "random_state": random.getstate(),
+        "evolution": evolution.state(),
+        "cache": cache.state() if cache is not None else None,
+        "stop": (stop.best_fitness, stop.last_improved),
+    }
+    tmp_path = Path(f"{path}.tmp")
+    tmp_path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(tmp_path, "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str, fingerprint: str) -> Dict[str, Any]:
+    """save_checkpoint 로 저장한 상태, 다른 인코딩 / 옵션에서 저장된 것이면 ValueError"""
+    with gzip.open(path, "rb") as f:
+        state = pickle.load(f)
+    if state.get("version") != CHECKPOINT_VERSION or state.get("fingerprint") != fingerprint:
+        raise ValueError(f"체크포인트가 현재 의존성 공간 / 옵션과 맞지 않습니다: {path}")
+    return state
+
+
+#  섬(island) 모델
+
+
+def _island_main(conn, compiled: CompiledRepo, population: List[List[int]], seed: int, options: Dict[str, Any]):
+    """
+    섬 하나를 담당하는 프로세스
+    받는 메시지: (n_generations, migrants) 또는 None(종료)
+    보내는 메시지: (best_fitness, best_individual, emigrants)
+    """
+    _ignore_stop_signals()
+    try:
+        random.seed(seed)
+        migration_size = options.pop("migration_size")
+        cache_size = options.pop("cache_size")
+        cache = FitnessCache(cache_size) if cache_size > 0 else None
+        evolution = Evolution(compiled, population, cache=cache, **options)
+        while True:
+            msg = conn.recv()
+            if msg is None:
+                break
+            n_generations, migrants = msg
+            evolution.run_epoch(n_generations, migrants)
+            conn.send((evolution.best_fitness, evolution.best_individual, evolution.emigrants(migration_size)))
+    except Exception as e:
+        conn.send(("error", repr(e)))
+    finally:
+        conn.close()
+
+
+def run_islands(
+    compiled: CompiledRepo,
+    populations: List[List[List[int]]],
+    n_generations: int,
+    migration_interval: int = 10,
+    migration_size: int = 2,
+    cache_size: int = 10000,
+    stop: Optional[StopCondition] = None,
+    progress: Optional[Callable[[int, float], None]] = None,
+    stats: Optional[Dict[str, Any]] = None,
+    **options,
+):
+    """
+    개체군마다 별도 프로세스에서 진화시키고 migration_interval 세대마다
+    각 섬의 상위 migration_size 개체를 다음 섬(링 구조)의 하위 개체와 교체
+    stop: 이주 시점마다 확인하는 조기 종료 조건
+    progress: 이주 시점마다 (세대, 최고 적합도) 로 호출
+    stats: 있으면 SIGINT 로 멈췄을 때 "interrupted" 를 True 로 둠 (run_ga 와 같음)
+    options: Evolution 인자 (pc, pm, tournament_k, incremental_eval, batch_eval)
+    return: (best_individual, best_fitness)
+    """
+    try:
+        ctx = multiprocessing.get_context("fork")
+    except ValueError:
+        ctx = multiprocessing.get_context()
+
+    conns = []
+    procs = []
+    for population in populations:
+        parent_conn, child_conn = ctx.Pipe()
+        island_options = dict(options, migration_size=migration_size, cache_size=cache_size)
+        proc = ctx.Process(
+            target=_island_main,
+            args=(child_conn, compiled, population, random.getrandbits(32), island_options),
+            daemon=True,
+        )
+        proc.start()
+        child_conn.close()
+        conns.append(parent_conn)
+        procs.append(proc)
+
+    best_individual = None
+    best_fitness = -math.inf
+    migrants: List[Optional[List]] = [None] * len(populations)
+    try:
+        gen = 0
+        while gen < n_generations:
+            n = min(migration_interval, n_generations - gen)
+            for conn, incoming in zip(conns, migrants):
+                conn.send((n, incoming))
+            results = [conn.recv() for conn in conns]
+            gen += n
+
+            for result in results:
+                if result[0] == "error":
+                    raise RuntimeError(f"island process failed: {result[1]}")
+            for island_best, island_ind, _ in results:
+                if island_best > best_fitness:
+                    best_fitness = island_best
+                    best_individual = island_ind
+
+            # 링 구조: i 번 섬의 상위 개체 -> i+1 번 섬
+            emigrants = [result[2] for result in results]
+            migrants = emigrants[-1:] + emigrants[:-1]
+
+            island_bests = ", ".join(f"{result[0]:.1f}" for result in results)
+            print(f"[gen {gen - 1:03d}] best fitness = {best_fitness:.3f} | islands: {island_bests}")
+            if progress is not None:
+                progress(gen - 1, best_fitness)
+
+            reason = stop.check(gen - 1, best_fitness) if stop is not None else None
+            if reason:
+                print(f"[*] 조기 종료 (gen {gen - 1:03d}): {reason}")
+                break
+    except KeyboardInterrupt:
+        if best_individual is None:
+            raise
+        print("[WARN] 중단 신호 수신: 지금까지의 최고 해를 반환합니다.")
+        if stats is not None:
+            stats["interrupted"] = True
+    finally:
+        for conn in conns:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+
+    return best_individual, best_fitness
+
+
 def run_ga(
     repo: Dict[str, Any],
     python_candidates: Optional[List[str]] = None,
@@ -405,62 +2314,609 @@ def run_ga(
     tournament_k: int = 3,
     seed: Optional[int] = None,
     hard_constraints: Optional[Dict[str, List[Dict[str, str]]]] = None,
+    batch_eval: bool = False,
+    incremental_eval: bool = True,
+    cache_size: int = 10000,
+    workers: int = 1,
+    islands: int = 1,
+    migration_interval: int = 10,
+    migration_size: int = 2,
+    time_limit: Optional[float] = None,
+    deadline: Optional[float] = None,
+    stall_generations: Optional[int] = None,
+    repair_moves: int = 0,
+    domain_reduction: bool = False,
+    crossover_op: str = "onepoint",
+    mutation_op: str = "uniform",
+    greedy_seed_fraction: float = 0.0,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_interval: int = 10,
+    resume: bool = False,
+    progress: Optional[Callable[[int, float], None]] = None,
+    warm_start: Optional[Dict[str, Any]] = None,
+    warm_start_radius: int = WARM_START_RADIUS,
+    stats: Optional[Dict[str, int]] = None,
+    trace_path: Optional[str] = None,
+    batch_variation: bool = False,
+    steady_state: bool = False,
+    steady_offspring: int = 2,
 ):
     """
     repo: JSON dict
     hard_constraints: {package: [{"op": "==", "ver": "1.0"}]} (must be satisfied)
+    batch_eval: True 면 개체군 전체를 numpy 배열로 한 번에 평가
+    incremental_eval: True 면 자식을 부모와 달라진 유전자만으로 delta 평가
+    cache_size: fitness LRU 캐시 크기 (0 이면 캐시 사용 안 함)
+    workers: 2 이상이면 개체 평가를 workers 개 프로세스에 나눠서 실행
+    islands: 2 이상이면 섬 모델 (섬마다 pop_size 개체군 + 프로세스 1개, workers 는 무시)
+    migration_interval / migration_size: 섬 사이 이주 주기(세대)와 이주 개체 수
+    time_limit: 초 단위 실행 시간 제한, stall_generations: 개선 없이 허용하는 세대 수
+      (둘 중 하나에 걸리거나 SIGINT 를 받으면 그때까지의 최고 해를 반환)
+    deadline: time.monotonic() 기준 절대 종료 시각 (run_ga_components / run_ga_per_python 이
+      time_limit 을 바꿔 넘김, 이미 지났으면 첫 세대만 평가하고 종료)
+    domain_reduction: True 면 인코딩 전에 reduce_domains 로 불가능한 버전을 제거
+    crossover_op: "onepoint" (1-point) 또는 "linkage" (의존성 묶음 단위 교차)
+    repair_moves: 0 보다 크면 자식마다 depends 위반을 최대 그 횟수만큼 국소 수정 (memetic GA)
+    greedy_seed_fraction: 초기 개체군 중 greedy_individual 로 만들 비율
+      (hard_constraints 패키지부터 depends 를 따라 호환되는 최신 버전을 고름)
+    mutation_op: "uniform" (유전자마다 확률 pm) 또는 "conflict"
+      (부모의 위반 유전자 위주로 변이, 그 확률은 세대마다 개선 여부에 따라 조정)
+    checkpoint_path: 있으면 checkpoint_interval 세대마다 진화 상태와 난수 상태를 저장 (섬 모델은 지원 안 함)
+    resume: True 이고 checkpoint_path 파일이 있으면 저장된 세대부터 이어서 실행
+      (같은 seed / 옵션이면 중단 없이 실행한 것과 같은 결과)
+    progress: 세대마다 (세대, 최고 적합도) 로 호출 (섬 모델은 이주 시점마다)
+    warm_start: 이전 결과 ({"python_version", "all_packages"}, ga_solution_detailed.json 형식)
+      있으면 warm_start_repo 로 영향 받는 패키지만 다시 풀고, 초기 개체군을 이전 해와 그 변형으로 채움
+      (warm_start_radius: 바뀐 조건에서 몇 칸 떨어진 패키지까지 다시 풀지)
+    stats: 있으면 "evaluations" (실제 fitness 평가 수) 와 "generations" 에 이번 실행분을 더하고
+      SIGINT 로 멈췄으면 "interrupted" 를 True 로 둠 (같은 dict 를 쓰는 다음 묶음 / 후보가 멈추는 데 사용)
+      (섬 모델은 평가 수를 집계하지 않고, 묶음 / 후보를 프로세스 풀에서 풀면 그 프로세스의 dict 에 더해짐)
+    trace_path: 있으면 세대마다 GenerationTrace 의 JSON 한 줄을 씀 (섬 모델은 지원 안 함)
+    batch_variation: True 면 세대 전체의 선택 / 교차 / 변이를 numpy 배열 연산으로 (numpy 필요, conflict 변이는 지원 안 함)
+      난수 흐름이 달라 같은 seed 라도 기본 경로와 결과는 다르지만 같은 seed 끼리는 재현됨
+    steady_state: True 면 세대 교체 대신 자식을 steady_offspring 개씩 평가해 최악 개체와 교체
+      (개체군에 이미 있는 염색체는 평가하지 않음, 한 세대는 pop_size 개의 자식을 만드는 것)
+      workers / batch_eval 을 쓰면 steady_offspring 을 크게 해야 한 번에 평가하는 양이 늘어남
     return: (best_fitness, best_python_ver, best_pkg_versions 딕셔너리)
     """
+    stop = StopCondition(time_limit, stall_generations, deadline)
     if seed is not None:
         random.seed(seed)
 
+    version_intern.register_dep_space(repo)
+    affected = None
+    if warm_start is not None:
+        if python_candidates is None:
+            python_candidates = list(DEFAULT_PYTHON_CANDIDATES)
+        repo, python_candidates, affected = warm_start_repo(
+            repo, python_candidates, hard_constraints, warm_start, warm_start_radius,
+        )
+        print(f"[*] warm start: 패키지 {len(affected)}/{len(repo)}개, Python 후보 {len(python_candidates)}개를 다시 풉니다.")
+    if domain_reduction:
+        if python_candidates is None:
+            python_candidates = list(DEFAULT_PYTHON_CANDIDATES)
+        reduced = reduce_domains(repo, python_candidates, hard_constraints)
+        if reduced is None:
+            print("[WARN] hard constraints 를 만족할 수 있는 버전이 없어 도메인 축소를 건너뜁니다.")
+        else:
+            before = search_space_log10(repo, python_candidates)
+            n_before = sum(len(versions) for versions in repo.values())
+            repo, python_candidates = reduced
+            n_removed = n_before - sum(len(versions) for versions in repo.values())
+            print(
+                f"[*] 도메인 축소: 버전 {n_removed}개 제거, 탐색 공간 "
+                f"10^{before:.1f} -> 10^{search_space_log10(repo, python_candidates):.1f}"
+            )
     package_names, gene_choices = build_encoding(repo, python_candidates)
+    compiled = CompiledRepo(repo, package_names, gene_choices, hard_constraints)
+
+    if batch_eval and not HAS_NUMPY:
+        print("[WARN] numpy가 없어 batch 평가 대신 개체별 평가를 사용합니다.")
+        batch_eval = False
+    if batch_variation and not HAS_NUMPY:
+        print("[WARN] numpy가 없어 batch 변이 대신 개체별 선택 / 교차 / 변이를 사용합니다.")
+        batch_variation = False
+    if batch_variation and mutation_op == "conflict":
+        print("[WARN] conflict 변이는 batch 변이를 지원하지 않아 개체별 선택 / 교차 / 변이를 사용합니다.")
+        batch_variation = False
+    if batch_variation and steady_state:
+        print("[WARN] steady-state 에서는 batch 변이 대신 개체별 선택 / 교차 / 변이를 사용합니다.")
+        batch_variation = False
+
+    # 변이만으로도 자식이 부모와 DELTA_EVAL_MAX_FRACTION 이상 달라지면 delta 평가는 손해
+    incremental_eval = incremental_eval and not batch_eval and pm < DELTA_EVAL_MAX_FRACTION
+
+    if checkpoint_path and islands > 1:
+        print("[WARN] 섬 모델에서는 체크포인트를 사용하지 않습니다.")
+        checkpoint_path = None
+    if trace_path and islands > 1:
+        print("[WARN] 섬 모델에서는 trace 를 기록하지 않습니다.")
+        trace_path = None
+    checkpoint = None
+    if checkpoint_path:
+        fingerprint = problem_fingerprint(package_names, gene_choices, {
+            "pop_size": pop_size,
+            "pc": pc,
+            "pm": pm,
+            "tournament_k": tournament_k,
+            "hard_constraints": hard_constraints or {},
+            "crossover_op": crossover_op,
+            "mutation_op": mutation_op,
+            "steady_state": steady_state,
+            "steady_offspring": steady_offspring,
+            "batch_variation": batch_variation,
+        })
+        if resume and Path(checkpoint_path).exists():
+            checkpoint = load_checkpoint(checkpoint_path, fingerprint)
+
+    if warm_start is not None:
+        greedy_seed_fraction = max(greedy_seed_fraction, WARM_START_GREEDY_FRACTION)
+    n_greedy = min(pop_size, round(greedy_seed_fraction * pop_size))
+    roots = [compiled.gene_index[pkg] for pkg in hard_constraints or {} if pkg in compiled.gene_index]
+
+    warm_individual = None
+    if affected is not None:
+        # 이전 해를 그대로 인코딩 (도메인 축소로 빠진 버전만 무작위)
+        prev_python, prev_versions = previous_assignment(warm_start)
+        warm_individual = random_individual(gene_choices)
+        values = [prev_python] + [prev_versions.get(pkg) for pkg in package_names]
+        for i, value in enumerate(values):
+            if value in gene_choices[i]:
+                warm_individual[i] = gene_choices[i].index(value)
+        perturbed = [0] + [i for i, pkg in enumerate(package_names, start=1) if pkg in affected]
+        # 0번 개체는 이전 해 그대로, 그다음 n_greedy 개는 greedy, 나머지는 이전 해의 변형
+        n_greedy += 1
+
+    populations = []
+    for _ in range(max(islands, 1) if checkpoint is None else 0):
+        population = []
+        for k in range(pop_size):
+            if warm_individual is not None and k == 0:
+                ind = list(warm_individual)
+            elif k < n_greedy:
+                ind = compiled.greedy_individual(roots)
+            elif warm_individual is not None:
+                ind = list(warm_individual)
+                for i in perturbed:
+                    n_choices = len(gene_choices[i])
+                    if n_choices > 1 and random.random() < WARM_START_PERTURB_PROB:
+                        # 이전 해와 다른 allele 로
+                        ind[i] = (ind[i] + random.randrange(1, n_choices)) % n_choices
+            elif hard_constraints:
+                ind = random_individual_respecting_constraints(gene_choices, package_names, hard_constraints)
+            else:
+                ind = random_individual(gene_choices)
+            population.append(ind)
+        populations.append(population)
+
+    if islands > 1:
+        # fork 전에 테이블을 만들어 두어야 섬마다 다시 만들지 않음
+        if incremental_eval or repair_moves or mutation_op == "conflict":
+            compiled._build_links()
+        if batch_eval:
+            compiled._build_batch_tables()
+        if crossover_op == "linkage":
+            compiled._build_clusters()
+        best_individual, best_fitness = run_islands(
+            compiled, populations, n_generations,
+            migration_interval=migration_interval, migration_size=migration_size,
+            cache_size=cache_size, pc=pc, pm=pm, tournament_k=tournament_k,
+            incremental_eval=incremental_eval, batch_eval=batch_eval, repair_moves=repair_moves,
+            crossover_op=crossover_op, mutation_op=mutation_op, batch_variation=batch_variation,
+            steady_state=steady_state, steady_offspring=steady_offspring, stop=stop, progress=progress,
+            stats=stats,
+        )
+        assert best_individual is not None
+        best_python_ver, best_pkg_versions = decode_individual(best_individual, package_names, gene_choices)
+        return best_fitness, best_python_ver, best_pkg_versions
+
+    population = populations[0] if checkpoint is None else checkpoint["evolution"]["population"]
+    cache = FitnessCache(cache_size) if cache_size > 0 else None
+
+    pool = None
+    if workers > 1 and not batch_eval:
+        if incremental_eval or mutation_op == "conflict":
+            # fork 전에 만들어 두어야 워커들이 다시 만들지 않음
+            compiled._build_links()
+        pool = EvaluationPool(compiled, workers)
+
+    evolution = Evolution(
+        compiled, population, pc=pc, pm=pm, tournament_k=tournament_k,
+        incremental_eval=incremental_eval, cache=cache, batch_eval=batch_eval, pool=pool,
+        repair_moves=repair_moves, crossover_op=crossover_op, mutation_op=mutation_op,
+        batch_variation=batch_variation, steady_state=steady_state, steady_offspring=steady_offspring,
+    )
+    start_gen = 0
+    if checkpoint is not None:
+        evolution.load_state(checkpoint["evolution"])
+        if cache is not None and checkpoint["cache"] is not None:
+            cache.load_state(checkpoint["cache"])
+        stop.best_fitness, stop.last_improved = checkpoint["stop"]
+        random.setstate(checkpoint["random_state"])
+        start_gen = checkpoint["generation"]
+        print(f"[*] 체크포인트에서 재개: {checkpoint_path} (gen {start_gen:03d})")
+    evaluations_before = evolution.n_evaluations
+    generations_run = 0
+    trace = GenerationTrace(trace_path, evolution, cache) if trace_path else None
+    try:
+        for gen in range(start_gen, n_generations):
+            if trace is not None:
+                t = time.perf_counter()
+            evolution.evaluate()
+            if trace is not None:
+                trace.record(gen, time.perf_counter() - t)
+            generations_run += 1
+            reason = stop.check(gen, evolution.best_fitness)
+            if progress is not None:
+                progress(gen, evolution.best_fitness)
+
+            if gen % 10 == 0 or gen == n_generations - 1 or reason:
+                if cache is not None:
+                    print(
+                        f"[gen {gen:03d}] best fitness = {evolution.best_fitness:.3f}"
+                        f" | cache hit {cache.hits} / miss {cache.misses}"
+                    )
+                else:
+                    print(f"[gen {gen:03d}] best fitness = {evolution.best_fitness:.3f}")
+
+            if reason:
+                print(f"[*] 조기 종료 (gen {gen:03d}): {reason}")
+                break
+
+            evolution.breed()
+            if checkpoint_path and (gen + 1) % checkpoint_interval == 0:
+                save_checkpoint(checkpoint_path, fingerprint, gen + 1, evolution, cache, stop)
+    except KeyboardInterrupt:
+        if evolution.best_individual is None:
+            raise
+        print("[WARN] 중단 신호 수신: 지금까지의 최고 해를 반환합니다.")
+        if stats is not None:
+            stats["interrupted"] = True
+    finally:
+        if pool is not None:
+            pool.terminate()
+        if trace is not None:
+            trace.close()
+
+    if stats is not None:
+        stats["evaluations"] = stats.get("evaluations", 0) + evolution.n_evaluations - evaluations_before
+        stats["generations"] = stats.get("generations", 0) + generations_run
+
+    best_individual = evolution.best_individual
+    best_fitness = evolution.best_fitness
+    assert best_individual is not None
+    best_python_ver, best_pkg_versions = decode_individual(best_individual, package_names, gene_choices)
+    return best_fitness, best_python_ver, best_pkg_versions
 
-   
-    population = []
-    for _ in range(pop_size):
-        if hard_constraints:
-            ind = random_individual_respecting_constraints(gene_choices, package_names, hard_constraints)
-        else:
-            ind = random_individual(gene_choices)
-        population.append(ind)
-    
-    best_individual = None
-    best_fitness = -math.inf
 
-    for gen in range(n_generations):
-        fitnesses = []
-        for ind in population:
-            f = fitness(ind, repo, package_names, gene_choices, hard_constraints)
-            fitnesses.append(f)
 
-        for ind, f in zip(population, fitnesses):
-            if f > best_fitness:
-                best_fitness = f
-                best_individual = ind[:]
+def _shared_budget(options: Dict[str, Any]) -> Tuple[Optional[float], Dict[str, Any]]:
+    """
+    run_ga 를 여러 번 부르는 풀이 (묶음 / python 후보) 의 options 에서 time_limit 을 절대 시각 deadline 으로 바꾸고
+    stats dict 를 하나로 정함 (하위 run_ga 가 모두 같은 예산과 중단 표시를 공유)
+    time.monotonic 은 fork 한 프로세스에서도 같은 시계라 프로세스 풀로 넘겨도 그대로 쓸 수 있음
+    return: (deadline, stats), options 는 제자리에서 바뀜
+    """
+    time_limit = options.pop("time_limit", None)
+    deadline = options.get("deadline")
+    if time_limit:
+        limit_deadline = time.monotonic() + time_limit
+        deadline = limit_deadline if deadline is None else min(deadline, limit_deadline)
+    options["deadline"] = deadline
+    if options.get("stats") is None:
+        options["stats"] = {}
+    return deadline, options["stats"]
 
-      
-        if gen % 10 == 0 or gen == n_generations - 1:
-            print(f"[gen {gen:03d}] best fitness = {best_fitness:.3f}")
 
-        
-        new_population: List[List[int]] = []
-        while len(new_population) < pop_size:
-            p1 = tournament_selection(population, fitnesses, k=tournament_k)
-            p2 = tournament_selection(population, fitnesses, k=tournament_k)
-            c1, c2 = crossover(p1, p2, pc=pc)
-            mutate(c1, gene_choices, pm=pm)
-            mutate(c2, gene_choices, pm=pm)
-            new_population.append(c1)
-            if len(new_population) < pop_size:
-                new_population.append(c2)
-        population = new_population
+def _budget_spent(deadline: Optional[float], stats: Dict[str, Any]) -> bool:
+    return bool(stats.get("interrupted")) or (deadline is not None and time.monotonic() >= deadline)
 
-    assert best_individual is not None
-    best_python_ver, best_pkg_versions = decode_individual(best_individual, package_names, gene_choices)
+
+def _run_indexed(item):
+    run, k, job = item
+    return k, run(job)
+
+
+def _run_jobs(run: Callable, jobs: List[Tuple], workers: int, stats: Dict[str, Any], fill_remaining: bool) -> List:
+    """
+    jobs 마다 run(job) 을 실행 (workers 가 2 이상이면 fork 프로세스 풀에서), 결과는 job 순서
+    직렬이면 options 의 deadline 까지 남은 시간을 남은 job 들에 고르게 나눠 줌
+    SIGINT 를 받으면 이미 끝난 결과는 그대로 쓰고 남은 job 은 더 풀지 않음
+      - 직렬: run_ga 가 stats["interrupted"] 를 남기면 그 job 의 최고 해까지만
+      - 풀: 워커는 SIGINT 를 무시하므로 메인 프로세스가 받아서 풀을 종료
+    남은 job 은 fill_remaining 이면 1세대만 돌린 결과 (초기 개체군의 최고 해) 로 채우고, 아니면 None
+    job 의 마지막 원소는 run_ga options
+    """
+    results: List = [None] * len(jobs)
+    pending = set(range(len(jobs)))
+    if workers > 1 and len(jobs) > 1:
+        try:
+            ctx = multiprocessing.get_context("fork")
+        except ValueError:
+            ctx = multiprocessing.get_context()
+        pool = ctx.Pool(min(workers, len(jobs)), initializer=_ignore_stop_signals)
+        try:
+            for k, result in pool.imap_unordered(_run_indexed, [(run, k, job) for k, job in enumerate(jobs)]):
+                results[k] = result
+                pending.discard(k)
+        except KeyboardInterrupt:
+            print(f"[WARN] 중단 신호 수신: 끝난 {len(jobs) - len(pending)}/{len(jobs)}개의 결과만 사용합니다.")
+            stats["interrupted"] = True
+        finally:
+            pool.terminate()
+            pool.join()
+    else:
+        for k, job in enumerate(jobs):
+            if stats.get("interrupted"):
+                break
+            deadline = job[-1].get("deadline")
+            if deadline is not None:
+                # 남은 예산을 남은 job 들에 고르게 나눔 (앞 job 이 일찍 끝나면 남은 시간은 뒤로 넘어감)
+                share = max(0.0, deadline - time.monotonic()) / (len(jobs) - k)
+                job = job[:-1] + (dict(job[-1], deadline=time.monotonic() + share),)
+            results[k] = run(job)
+            pending.discard(k)
+
+    if fill_remaining:
+        for k in sorted(pending):
+            results[k] = run(_quick_job(jobs[k]))
+    return results
+
+
+def _quick_job(job: Tuple) -> Tuple:
+    """중단 / 시간 초과 뒤에 남은 job 을 첫 세대만 평가하도록 바꾼 것 (체크포인트는 건드리지 않음)"""
+    return job[:-1] + (dict(job[-1], n_generations=1, checkpoint_path=None),)
+
+
+def _run_component(job):
+    """split_components 묶음 하나를 run_ga 로 풂 (프로세스 풀에서도 호출됨)"""
+    sub_repo, python_candidates, sub_hard, seed, options = job
+    return run_ga(sub_repo, python_candidates=python_candidates, hard_constraints=sub_hard, seed=seed, **options)
+
+
+def run_ga_components(
+    repo: Dict[str, Any],
+    python_candidates: Optional[List[str]] = None,
+    hard_constraints: Optional[Dict[str, List[Dict[str, str]]]] = None,
+    seed: Optional[int] = None,
+    workers: int = 1,
+    **options,
+):
+    """
+    split_components 로 나눈 묶음마다 run_ga 를 따로 실행하고 결과를 합침
+    (fitness 는 유전자별 점수의 합이라 python 이 같으면 묶음별 최적의 합이 전체 최적)
+    workers: 2 이상이면 묶음들을 그 수만큼의 프로세스에서 동시에 풂
+      (묶음 안의 run_ga 는 workers=1, 병렬일 때는 islands=1 로 실행)
+    options: 나머지 run_ga 인자 (pop_size, n_generations, ...)
+      time_limit 은 묶음마다가 아니라 전체 (다시 푸는 묶음 포함) 에 대한 예산이고,
+      예산이 다 되거나 SIGINT 를 받은 뒤의 묶음은 첫 세대만 평가함
+    묶음마다 고른 python 이 다르면 가장 많은 패키지를 가진 쪽의 python 으로 고정해 나머지를 다시 풂
+      (예산이 남아 있을 때만)
+    return: run_ga 와 같은 (best_fitness, best_python_ver, best_pkg_versions), fitness 는 repo 전체 기준
+    """
+    if python_candidates is None:
+        python_candidates = list(DEFAULT_PYTHON_CANDIDATES)
+    groups = split_components(repo)
+    if len(groups) <= 1:
+        return run_ga(
+            repo, python_candidates=python_candidates, hard_constraints=hard_constraints,
+            seed=seed, workers=workers, **options,
+        )
+    print(f"[*] 연결 요소 분해: 패키지 {len(repo)}개 -> 묶음 {len(groups)}개 (가장 큰 묶음 {len(groups[0])}개)")
+
+    options = dict(options, workers=1)
+    deadline, stats = _shared_budget(options)
+    if workers > 1:
+        if options.get("islands", 1) > 1:
+            print("[WARN] 묶음을 병렬로 풀 때는 섬 모델을 사용하지 않습니다.")
+        options["islands"] = 1
+    rng = random.Random(seed)
+    seeds = [rng.randrange(2 ** 32) for _ in groups]
+    hard_constraints = hard_constraints or {}
+
+    def make_jobs(indices, pythons):
+        jobs = []
+        for k in indices:
+            sub_repo = {pkg: repo[pkg] for pkg in groups[k]}
+            sub_hard = {pkg: cons for pkg, cons in hard_constraints.items() if pkg in sub_repo}
+            job_options = options
+            if options.get("checkpoint_path"):
+                # 묶음마다 체크포인트 파일을 따로 둠 (python 을 고정해 다시 풀 때는 인코딩이 달라 새로 시작)
+                job_options = dict(options, checkpoint_path=f"{options['checkpoint_path']}.{k}")
+            if options.get("trace_path"):
+                job_options = dict(job_options, trace_path=f"{options['trace_path']}.{k}")
+            jobs.append((sub_repo, pythons, sub_hard or None, seeds[k], job_options))
+        return jobs
+
+    def solve(jobs):
+        return _run_jobs(_run_component, jobs, workers, stats, fill_remaining=True)
+
+    results = solve(make_jobs(range(len(groups)), python_candidates))
+
+    # python 유전자는 모든 묶음이 공유하므로 하나로 맞춤
+    votes: Dict[str, int] = {}
+    for group, (_, python_ver, _) in zip(groups, results):
+        votes[python_ver] = votes.get(python_ver, 0) + len(group)
+    best_python_ver = max(votes, key=votes.get)
+    redo = [k for k, (_, python_ver, _) in enumerate(results) if python_ver != best_python_ver]
+    if redo and _budget_spent(deadline, stats):
+        print(f"[WARN] 시간 제한 또는 중단으로 python 이 다른 묶음 {len(redo)}개를 다시 풀지 않습니다.")
+    elif redo:
+        print(f"[*] python {best_python_ver} 으로 고정해 묶음 {len(redo)}개를 다시 풂")
+        for k, result in zip(redo, solve(make_jobs(redo, [best_python_ver]))):
+            results[k] = result
+
+    merged: Dict[str, Optional[str]] = {}
+    for _, _, pkg_versions in results:
+        merged.update(pkg_versions)
+
+    best_pkg_versions = {pkg: merged[pkg] for pkg in sorted(repo)}
+    best_fitness, _, _ = evaluate_solution(repo, python_candidates, hard_constraints, best_python_ver, best_pkg_versions)
     return best_fitness, best_python_ver, best_pkg_versions
 
 
+def evaluate_solution(
+    repo: Dict[str, Any],
+    python_candidates: List[str],
+    hard_constraints: Optional[Dict[str, List[Dict[str, str]]]],
+    python_ver: str,
+    pkg_versions: Dict[str, Optional[str]],
+) -> Tuple[float, int, int]:
+    """
+    디코딩된 해를 repo 전체 기준으로 다시 평가 (도메인 축소나 분해 후 나온 해를 비교할 때 사용)
+    return: CompiledRepo.evaluate 와 같은 (score, depends 위반 수, constrains 위반 수)
+    """
+    package_names, gene_choices = build_encoding(repo, python_candidates)
+    compiled = CompiledRepo(repo, package_names, gene_choices, hard_constraints)
+    individual = [gene_choices[0].index(python_ver)] + [
+        gene_choices[i].index(pkg_versions.get(pkg)) for i, pkg in enumerate(package_names, start=1)
+    ]
+    return compiled.evaluate(individual)
+
+
+def _run_python_job(job):
+    """python 버전 하나로 고정한 풀이 (프로세스 풀에서도 호출됨)"""
+    python_ver, sub_repo, hard_constraints, seed, components, options = job
+    solve = run_ga_components if components else run_ga
+    return solve(sub_repo, python_candidates=[python_ver], hard_constraints=hard_constraints, seed=seed, **options)
+
+
+def run_ga_per_python(
+    repo: Dict[str, Any],
+    python_candidates: Optional[List[str]] = None,
+    hard_constraints: Optional[Dict[str, List[Dict[str, str]]]] = None,
+    seed: Optional[int] = None,
+    workers: int = 1,
+    components: bool = False,
+    **options,
+):
+    """
+    python 후보마다 python 을 고정하고 따로 풀어 가장 좋은 해를 고름
+    후보마다 filter_python 으로 그 python 과 맞지 않는 버전을 먼저 제거하고,
+    hard constraints 를 만족할 수 없게 되는 후보는 풀지 않음 (모든 후보가 그렇다면 모두 풂)
+    python_candidates: None 이면 python_minor_versions(repo) 로 dep space 에서 구함
+    workers: 2 이상이면 후보들을 그 수만큼의 프로세스에서 동시에 풂 (후보 안의 풀이는 workers=1)
+      풀 후보가 하나뿐이면 그 후보의 풀이 (묶음 / 개체 평가) 에 workers 를 넘김
+    components: True 면 후보마다 run_ga_components 로 풂
+    options: 나머지 run_ga 인자 (pop_size, n_generations, ...)
+      time_limit 은 후보마다가 아니라 모든 후보 (와 그 안의 묶음) 에 대한 예산이고,
+      SIGINT 를 받으면 그때까지 끝난 후보 중에서 고름 (풀지 못한 후보의 요약은 fitness 가 None)
+    return: (best_fitness, best_python_ver, best_pkg_versions, summary)
+      summary = [{"python", "feasible", "fitness", "conflicts", "constrain_conflicts"}, ...] (후보 순서)
+      fitness 는 모두 repo 전체 기준, 후보가 없으면 best_* 는 None
+    """
+    if python_candidates is None:
+        python_candidates = python_minor_versions(repo)
+    options = dict(options, workers=1)
+    _, stats = _shared_budget(options)
+    if workers > 1:
+        options["islands"] = 1
+    rng = random.Random(seed)
+
+    summary = []
+    filtered_repos = []
+    for python_ver in python_candidates:
+        filtered = filter_python(repo, python_ver, hard_constraints)
+        summary.append({
+            "python": python_ver, "feasible": filtered is not None,
+            "fitness": None, "conflicts": None, "constrain_conflicts": None,
+        })
+        filtered_repos.append(filtered)
+    if not any(entry["feasible"] for entry in summary):
+        # 위반이 가장 적은 해라도 찾도록 hard constraints 를 빼고 거른 repo 로 모든 후보를 풂
+        print("[WARN] hard constraints 를 모두 만족할 수 있는 Python 후보가 없어 모든 후보를 풉니다.")
+        filtered_repos = [filter_python(repo, python_ver) for python_ver in python_candidates]
+
+    jobs = []
+    for python_ver, filtered in zip(python_candidates, filtered_repos):
+        job_seed = rng.randrange(2 ** 32)
+        if filtered is not None:
+            job_options = options
+            if options.get("checkpoint_path"):
+                job_options = dict(options, checkpoint_path=f"{options['checkpoint_path']}.py{python_ver}")
+            if options.get("trace_path"):
+                job_options = dict(job_options, trace_path=f"{options['trace_path']}.py{python_ver}")
+            jobs.append((python_ver, filtered, hard_constraints, job_seed, components, job_options))
+    print(
+        f"[*] python 후보 {len(python_candidates)}개 중 {len(jobs)}개를 풉니다: "
+        f"{[job[0] for job in jobs]}"
+    )
+
+    if len(jobs) == 1 and workers > 1:
+        # 후보 사이에 나눌 것이 없으므로 후보 안에서 병렬로
+        job = jobs[0]
+        jobs[0] = job[:-1] + (dict(job[-1], workers=workers),)
+
+    # 하나도 끝나기 전에 중단되면 첫 후보만 1세대로 채움
+    results = _run_jobs(_run_python_job, jobs, workers, stats, fill_remaining=False)
+    if jobs and all(result is None for result in results):
+        results[0] = _run_python_job(_quick_job(jobs[0]))
+
+    best = (None, None, None)
+    by_python = {entry["python"]: entry for entry in summary}
+    for job, result in zip(jobs, results):
+        if result is None:
+            continue
+        _, python_ver, pkg_versions = result
+        score, conflicts, constrain_conflicts = evaluate_solution(
+            repo, python_candidates, hard_constraints, python_ver, pkg_versions,
+        )
+        by_python[job[0]].update(fitness=score, conflicts=conflicts, constrain_conflicts=constrain_conflicts)
+        if best[0] is None or score > best[0]:
+            best = (score, python_ver, pkg_versions)
+    return best[0], best[1], best[2], summary
+
+
+def solve_dep_space(
+    dep_space: Dict[str, Any],
+    hard_constraints: Optional[Dict[str, List[Dict[str, str]]]] = None,
+    python_candidates=None,
+    components: bool = False,
+    per_python: bool = False,
+    **options,
+) -> Dict[str, Any]:
+    """
+    메모리에 올라와 있는 dep space 를 GA 로 푸는 진입점 (run_cli 와 src/main.py 에서 사용)
+    python_candidates: 후보 리스트, None(DEFAULT_PYTHON_CANDIDATES) 또는 "auto" (dep space 의 python 조건에서 구함)
+    components / per_python: run_ga_components / run_ga_per_python 으로 풂
+    options: 나머지 run_ga 인자 (progress 콜백 포함, 프로세스 풀에서 푸는 묶음 / 후보는 그 프로세스에서 호출됨)
+    return: {"python_version", "packages" (설치된 것만), "all_packages", "fitness"}
+      per_python 이면 "python_summary" 추가, 풀 수 있는 Python 후보가 없으면 python_version 은 None
+    """
+    if python_candidates == "auto":
+        if per_python:
+            # 불가능한 후보도 요약에 남도록 run_ga_per_python 에서 거름
+            python_candidates = python_minor_versions(dep_space)
+        else:
+            python_candidates = derive_python_candidates(dep_space, hard_constraints)
+            if not python_candidates:
+                print("[WARN] hard constraints 를 만족하는 Python 후보가 없어 기본 후보를 사용합니다.")
+                python_candidates = list(DEFAULT_PYTHON_CANDIDATES)
+
+    python_summary = None
+    if per_python:
+        best_fitness, best_python_ver, best_pkg_versions, python_summary = run_ga_per_python(
+            dep_space, python_candidates, hard_constraints, components=components, **options,
+        )
+    else:
+        solve = run_ga_components if components else run_ga
+        best_fitness, best_python_ver, best_pkg_versions = solve(
+            dep_space, python_candidates=python_candidates, hard_constraints=hard_constraints, **options,
+        )
+
+    best_pkg_versions = best_pkg_versions or {}
+    result = {
+        "python_version": best_python_ver,
+        "packages": {pkg: ver for pkg, ver in best_pkg_versions.items() if ver is not None},
+        "all_packages": best_pkg_versions,
+        "fitness": best_fitness,
+    }
+    if python_summary is not None:
+        result["python_summary"] = python_summary
+    return result
+
+
+
 #  사용 예시
 
 if __name__ == "__main__":
@@ -559,6 +3015,53 @@ def save_json(data: Dict, path: str):
         print(f"[ERROR] {e}")
 
 
+def print_solution(solved: Dict[str, Any]):
+    """solve_dep_space 결과 출력"""
+    if "python_summary" in solved:
+        print("\n[*] Python 후보별 결과:")
+        for entry in solved["python_summary"]:
+            if entry["fitness"] is not None:
+                print(
+                    f"    {entry['python']}: 적합도 {entry['fitness']:.3f}, "
+                    f"depends 위반 {entry['conflicts']}, constrains 위반 {entry['constrain_conflicts']}"
+                )
+            else:
+                print(f"    {entry['python']}: hard constraints 를 만족할 수 없음")
+    if solved["python_version"] is None:
+        print("[ERROR] 풀 수 있는 Python 후보가 없습니다.")
+        return
+
+    print(f"\n[*] GA 실행 완료!")
+    print(f"[*] 최고 적합도: {solved['fitness']:.3f}")
+    print(f"[*] Python 버전: {solved['python_version']}")
+
+    installed_packages = solved["packages"]
+    print(f"[*] 설치된 패키지 ({len(installed_packages)}개):")
+    for pkg, ver in sorted(installed_packages.items()):
+        print(f"    {pkg} == {ver}")
+
+
+def save_solution(solved: Dict[str, Any], path: str):
+    """solve_dep_space 결과를 path 와 상세 결과(path 의 _detailed.json)로 저장"""
+    result = {
+        "python_version": solved["python_version"],
+        "packages": solved["packages"],
+        "fitness": solved["fitness"],
+    }
+    if "python_summary" in solved:
+        result["python_summary"] = solved["python_summary"]
+    save_json(result, path)
+
+    detailed_output = path.replace(".json", "_detailed.json")
+    detailed_result = {
+        "python_version": solved["python_version"],
+        "all_packages": solved["all_packages"],
+        "installed_packages": solved["packages"],
+        "fitness": solved["fitness"],
+    }
+    save_json(detailed_result, detailed_output)
+
+
 def run_cli():
     """CLI 모드로 실행"""
     parser = argparse.ArgumentParser(
@@ -580,7 +3083,12 @@ def run_cli():
         "--python-versions",
         type=str,
         default="3.8,3.9,3.10,3.11,3.12",
-        help="탐색할 Python 버전 (쉼표로 구분, 기본값: 3.8,3.9,3.10,3.11,3.12)",
+        help="탐색할 Python 버전 (쉼표로 구분, auto 면 dep space 의 python 조건에서 구함, 기본값: 3.8,3.9,3.10,3.11,3.12)",
+    )
+    parser.add_argument(
+        "--per-python",
+        action="store_true",
+        help="Python 후보마다 python 을 고정해 따로 풀고 가장 좋은 해를 고름, --workers 는 동시에 푸는 후보 수가 됨",
     )
     parser.add_argument(
         "--population-size",
@@ -625,7 +3133,145 @@ def run_cli():
         help="Hard constraint 파일 경로 (JSON 형식, {package: [{op: '==', ver: '1.0'}]})",
     )
 
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=10000,
+        help="fitness LRU 캐시 크기, 0이면 사용 안 함 (기본값: 10000)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="fitness 평가에 쓸 프로세스 수 (기본값: 1)",
+    )
+    parser.add_argument(
+        "--islands",
+        type=int,
+        default=1,
+        help="섬 모델의 섬(개체군) 수, 2 이상이면 섬마다 프로세스 1개 (기본값: 1)",
+    )
+    parser.add_argument(
+        "--migration-interval",
+        type=int,
+        default=10,
+        help="섬 사이 이주 주기, 세대 단위 (기본값: 10)",
+    )
+    parser.add_argument(
+        "--migration-size",
+        type=int,
+        default=2,
+        help="이주 때마다 옮기는 상위 개체 수 (기본값: 2)",
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=None,
+        help="실행 시간 제한(초), 넘으면 그때까지의 최고 해를 저장 (기본값: 없음)",
+    )
+    parser.add_argument(
+        "--stall-generations",
+        type=int,
+        default=None,
+        help="이 세대 수 동안 최고 적합도가 개선되지 않으면 조기 종료 (기본값: 없음)",
+    )
+    parser.add_argument(
+        "--crossover",
+        choices=["onepoint", "linkage"],
+        default="onepoint",
+        help="교차 연산: onepoint (1-point) 또는 linkage (강하게 묶인 패키지를 함께 물려받음) (기본값: onepoint)",
+    )
+    parser.add_argument(
+        "--mutation",
+        choices=["uniform", "conflict"],
+        default="uniform",
+        help="변이 연산: uniform (유전자마다 같은 확률) 또는 conflict (위반 유전자 위주, 확률 자동 조정) (기본값: uniform)",
+    )
+    parser.add_argument(
+        "--greedy-seed-fraction",
+        type=float,
+        default=0.0,
+        help="초기 개체군 중 호환되는 최신 버전으로 greedy 하게 만들 비율, 0~1 (기본값: 0)",
+    )
+    parser.add_argument(
+        "--components",
+        action="store_true",
+        help="의존성 그래프의 연결 요소마다 따로 풂, --workers 는 동시에 푸는 요소 수가 됨",
+    )
+    parser.add_argument(
+        "--reduce-domains",
+        action="store_true",
+        help="GA 전에 depends / python / hard constraints 로 불가능한 버전을 도메인에서 제거",
+    )
+    parser.add_argument(
+        "--repair-moves",
+        type=int,
+        default=0,
+        help="자식마다 depends 위반을 가까운 버전으로 고치는 최대 이동 수 (기본값: 0, 사용 안 함)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        default=None,
+        help="진화 상태를 주기적으로 저장할 체크포인트 파일 경로 (기본값: 없음)",
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=int,
+        default=10,
+        help="체크포인트 저장 주기, 세대 단위 (기본값: 10)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="--checkpoint 파일이 있으면 저장된 세대부터 이어서 실행",
+    )
+    parser.add_argument(
+        "--trace",
+        type=str,
+        default=None,
+        help="세대마다 시간 / 적합도 / 다양성 / 캐시 통계를 JSON 한 줄씩 기록할 파일 경로 (기본값: 없음)",
+    )
+    parser.add_argument(
+        "--warm-start",
+        type=str,
+        default=None,
+        help="이전 결과(ga_solution_detailed.json)에서 시작해 바뀐 조건의 영향을 받는 패키지만 다시 풂 (기본값: 없음)",
+    )
+    parser.add_argument(
+        "--warm-start-radius",
+        type=int,
+        default=WARM_START_RADIUS,
+        help=f"warm start 에서 바뀐 조건으로부터 다시 풀 패키지의 그래프 거리 (기본값: {WARM_START_RADIUS})",
+    )
+    parser.add_argument(
+        "--batch-eval",
+        action="store_true",
+        help="numpy로 개체군 전체를 한 번에 평가 (numpy 필요)",
+    )
+    parser.add_argument(
+        "--steady-state",
+        action="store_true",
+        help="세대 교체 대신 자식을 몇 개씩 평가해 최악 개체와 교체, 개체군에 있는 염색체와 같은 자식은 버림",
+    )
+    parser.add_argument(
+        "--steady-offspring",
+        type=int,
+        default=2,
+        help="steady-state 에서 한 번에 만들어 평가하는 자식 수 (기본값: 2)",
+    )
+    parser.add_argument(
+        "--batch-variation",
+        action="store_true",
+        help="numpy로 세대 전체의 선택 / 교차 / 변이를 한 번에 (numpy 필요, conflict 변이와 함께 쓸 수 없음)",
+    )
+
     args = parser.parse_args()
+    if args.resume and not args.checkpoint:
+        parser.error("--resume 은 --checkpoint 와 함께 사용해야 합니다")
+
+    # 배치 작업의 SIGTERM 도 SIGINT 와 같이 처리해서 현재 최고 해를 저장
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
 
 
     print("[*] 의존성 공간 로드 중...")
@@ -638,9 +3284,16 @@ def run_cli():
         hard_constraints = load_json(args.hard_constraints)
         print(f"[*] Hard constraint 로드 완료: {list(hard_constraints.keys())}")
 
+    warm_start = None
+    if args.warm_start:
+        warm_start = load_json(args.warm_start)
+        print(f"[*] Warm start 로드 완료: {args.warm_start}")
 
-    python_versions = args.python_versions.split(',')
-    python_versions = [v.strip() for v in python_versions]
+    if args.python_versions == "auto":
+        python_versions = "auto"
+    else:
+        python_versions = args.python_versions.split(',')
+        python_versions = [v.strip() for v in python_versions]
 
     print(f"[*] GA 실행 중...")
     print(f"    - 개체군 크기: {args.population_size}")
@@ -650,51 +3303,46 @@ def run_cli():
     print(f"    - Python 버전: {python_versions}")
 
     # GA 실행
-    best_fitness, best_python_ver, best_pkg_versions = run_ga(
+    solved = solve_dep_space(
         dep_space,
+        hard_constraints=hard_constraints,
         python_candidates=python_versions,
+        components=args.components,
+        per_python=args.per_python,
         pop_size=args.population_size,
         n_generations=args.generations,
         pc=args.crossover_rate,
         pm=args.mutation_rate,
         tournament_k=args.tournament_size,
         seed=args.seed,
-        hard_constraints=hard_constraints,
+        batch_eval=args.batch_eval,
+        batch_variation=args.batch_variation,
+        steady_state=args.steady_state,
+        steady_offspring=args.steady_offspring,
+        cache_size=args.cache_size,
+        workers=args.workers,
+        islands=args.islands,
+        migration_interval=args.migration_interval,
+        migration_size=args.migration_size,
+        time_limit=args.time_limit,
+        stall_generations=args.stall_generations,
+        repair_moves=args.repair_moves,
+        domain_reduction=args.reduce_domains,
+        crossover_op=args.crossover,
+        mutation_op=args.mutation,
+        greedy_seed_fraction=args.greedy_seed_fraction,
+        checkpoint_path=args.checkpoint,
+        checkpoint_interval=args.checkpoint_interval,
+        resume=args.resume,
+        warm_start=warm_start,
+        warm_start_radius=args.warm_start_radius,
+        trace_path=args.trace,
     )
+    print_solution(solved)
+    if solved["python_version"] is None:
+        sys.exit(1)
 
-    print(f"\n[*] GA 실행 완료!")
-    print(f"[*] 최고 적합도: {best_fitness:.3f}")
-    print(f"[*] Python 버전: {best_python_ver}")
-
-
-    installed_packages = {
-        pkg: ver
-        for pkg, ver in best_pkg_versions.items()
-        if ver is not None
-    }
-
-    print(f"[*] 설치된 패키지 ({len(installed_packages)}개):")
-    for pkg, ver in sorted(installed_packages.items()):
-        print(f"    {pkg} == {ver}")
-
-    # 결과 저장
-    result = {
-        "python_version": best_python_ver,
-        "packages": installed_packages,
-        "fitness": best_fitness,
-    }
-
-    save_json(result, args.output)
-
-    # 상세 결과도 저장
-    detailed_output = args.output.replace(".json", "_detailed.json")
-    detailed_result = {
-        "python_version": best_python_ver,
-        "all_packages": best_pkg_versions,
-        "installed_packages": installed_packages,
-        "fitness": best_fitness,
-    }
-    save_json(detailed_result, detailed_output)
+    save_solution(solved, args.output)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,29 @@
 import unittest
+import inspect
+import json
+import multiprocessing
+from unittest import mock
+import random
+import os
+import tempfile
+import time
 from ga.ga6 import normalize_version, cmp_version, check_one_constraint, run_ga
+from ga.ga6 import build_encoding, fitness, random_individual, CompiledRepo, HAS_NUMPY
+from ga.ga6 import FitnessCache, chromosome_key, StopCondition, reduce_domains, linkage_crossover, Evolution
+from ga.ga6 import conflict_mutate, split_components, run_ga_components, COMPONENT_MIN_GENES
+from ga.ga6 import derive_python_candidates, run_ga_per_python, solve_dep_space, warm_start_repo
+from ga.ga6 import DELTA_EVAL_MAX_FRACTION, EvaluationPool, evaluate_population
+from ga import ga6
+import solver
+import version_intern
+from solution_cache import SolutionCache, cache_key
+from packaging.version import Version
+
+try:
+    # main.py 는 pruning -> utils 를 거쳐 requests 를 import 함
+    import main as solve_main
+except ImportError:
+    solve_main = None
 
 # File: ga/test_ga6.py
 
@@ -51,5 +75,924 @@ class TestGA6(unittest.TestCase):
         self.assertIn("packageA", best_pkgs)
         self.assertIn("packageB", best_pkgs)
 
+    def test_compiled_fitness_matches_scalar(self):
+        repo = {
+            "packageA": {
+                "1.0.0": {
+                    "depends": {
+                        "packageB": [{"op": ">=", "ver": "2.0.0"}],
+                        "python": [{"op": ">=", "ver": "3.9"}],
+                    },
+                    "constrains": {"packageC": [{"op": "<", "ver": "1.5"}]}
+                },
+                "2.0.0": {
+                    "depends": {"packageB": [{"op": "==", "ver": "1.0.0"}]},
+                    "constrains": {}
+                }
+            },
+            "packageB": {
+                "1.0.0": {"depends": {}, "constrains": {}},
+                "2.0.0": {"depends": {"missing": []}, "constrains": {}}
+            },
+            "packageC": {
+                "1.0": {"depends": {}, "constrains": {}},
+                "2.0": {"depends": {}, "constrains": {}}
+            }
+        }
+        hard = {"packageA": [{"op": "==", "ver": "2.0.0"}], "packageC": []}
+        package_names, gene_choices = build_encoding(repo, ["3.8", "3.9"])
+        compiled = CompiledRepo(repo, package_names, gene_choices, hard)
+        random.seed(0)
+        population = [random_individual(gene_choices) for _ in range(50)]
+        expected = [fitness(ind, repo, package_names, gene_choices, hard) for ind in population]
+        self.assertEqual([compiled.fitness(ind) for ind in population], expected)
+        if HAS_NUMPY:
+            self.assertEqual(compiled.fitness_batch(population), expected)
+
+        for parent in population:
+            child = random_individual(gene_choices)
+            child[:2] = parent[:2]
+            changed = [g for g in range(len(child)) if child[g] != parent[g]]
+            self.assertEqual(
+                compiled.evaluate_delta(parent, compiled.evaluate(parent), child, changed),
+                compiled.evaluate(child),
+            )
+
+    def test_batch_eval_falls_back_without_numpy(self):
+        repo = {
+            f"p{k}": {
+                f"{v}.0": {
+                    "depends": {f"p{(k + 1) % 8}": [{"op": ">=", "ver": f"{v}.0"}]},
+                    "constrains": {f"p{(k + 2) % 8}": [{"op": "<", "ver": "3.0"}]},
+                }
+                for v in range(4)
+            }
+            for k in range(8)
+        }
+        hard = {"p0": [{"op": "==", "ver": "2.0"}]}
+        package_names, gene_choices = build_encoding(repo, ["3.9"])
+        compiled = CompiledRepo(repo, package_names, gene_choices, hard)
+        random.seed(0)
+        population = [random_individual(gene_choices) for _ in range(30)]
+        population += population[:5]
+        expected = [fitness(ind, repo, package_names, gene_choices, hard) for ind in population]
+        # numpy 없이 쓰는 개체별 평가 경로 (캐시 / 같은 세대 중복 포함)
+        for cache in (None, FitnessCache(100)):
+            evals = evaluate_population(population, compiled, cache=cache)
+            self.assertEqual([e[0] for e in evals], expected)
+
+        options = dict(python_candidates=["3.9"], pop_size=20, n_generations=8, seed=5, hard_constraints=hard)
+        with mock.patch.object(ga6, "HAS_NUMPY", False):
+            best_f, best_py, best_pkgs = run_ga(repo, batch_eval=True, **options)
+        self.assertEqual((best_f, best_py, best_pkgs), run_ga(repo, batch_eval=False, **options))
+        individual = [gene_choices[0].index(best_py)] + [
+            gene_choices[i].index(best_pkgs[pkg]) for i, pkg in enumerate(package_names, start=1)
+        ]
+        self.assertEqual(best_f, fitness(individual, repo, package_names, gene_choices, hard))
+
+    def test_conflict_counts_match_across_paths(self):
+        repo = {
+            "packageA": {
+                "1.0.0": {
+                    "depends": {"packageB": [{"op": ">=", "ver": "2.0.0"}]},
+                    "constrains": {"packageC": [{"op": "<", "ver": "2.0"}]},
+                },
+                "2.0.0": {"depends": {"packageB": [{"op": "==", "ver": "1.0.0"}]}, "constrains": {}},
+            },
+            "packageB": {
+                "1.0.0": {"depends": {"packageC": [{"op": ">=", "ver": "2.0"}]}, "constrains": {}},
+                "2.0.0": {"depends": {}, "constrains": {}},
+            },
+            "packageC": {
+                "1.0": {"depends": {}, "constrains": {}},
+                "2.0": {"depends": {}, "constrains": {}},
+            },
+        }
+        hard = {"packageB": [{"op": "==", "ver": "2.0.0"}]}
+        package_names, gene_choices = build_encoding(repo, ["3.9"])
+        compiled = CompiledRepo(repo, package_names, gene_choices, hard)
+        random.seed(1)
+        population = [random_individual(gene_choices) for _ in range(40)]
+        full = [compiled.evaluate_conflicts(ind) for ind in population]
+        for ind, result in zip(population, full):
+            self.assertEqual(result[:3], compiled.evaluate(ind))
+            self.assertEqual(sorted(result[3]), compiled.conflict_genes(ind))
+        if HAS_NUMPY:
+            self.assertEqual(compiled.evaluate_batch_conflicts(population), full)
+
+        for parent, parent_eval in zip(population, full):
+            child = random_individual(gene_choices)
+            changed = [g for g in range(len(child)) if child[g] != parent[g]]
+            self.assertEqual(
+                compiled.evaluate_delta(parent, parent_eval, child, changed),
+                compiled.evaluate_conflicts(child),
+            )
+
+    def test_tracked_changes_drive_delta_eval(self):
+        # 기본 pm 에서도 delta 평가가 켜져야 함
+        self.assertLess(inspect.signature(run_ga).parameters["pm"].default, DELTA_EVAL_MAX_FRACTION)
+
+        repo = {
+            f"p{k}": {
+                f"{v}.0": {"depends": {f"p{(k + 1) % 12}": [{"op": ">=", "ver": f"{v}.0"}]}, "constrains": {}}
+                for v in range(4)
+            }
+            for k in range(12)
+        }
+        package_names, gene_choices = build_encoding(repo, ["3.9"])
+        compiled = CompiledRepo(repo, package_names, gene_choices)
+        variants = [{}, {"crossover_op": "linkage"}, {"mutation_op": "conflict"}, {"repair_moves": 2}]
+        if HAS_NUMPY:
+            variants.append({"batch_variation": True})
+        for options in variants:
+            random.seed(0)
+            population = [random_individual(gene_choices) for _ in range(30)]
+            evolution = Evolution(compiled, population, **options)
+            evolution.evaluate()
+            for _ in range(3):
+                evolution.breed()
+                for child, (i, changed) in zip(evolution.population, evolution.origins):
+                    parent = evolution.prev_population[i]
+                    self.assertEqual(changed, [g for g in range(len(child)) if child[g] != parent[g]], options)
+                evolution.evaluate()
+                evaluate = compiled.evaluate_conflicts if evolution.conflict_mutation else compiled.evaluate
+                self.assertEqual(evolution.evals, [evaluate(ind) for ind in evolution.population], options)
+
+    def test_evaluation_pool_matches_serial(self):
+        repo = {
+            f"p{k}": {
+                f"{v}.0": {
+                    "depends": {f"p{(k + 1) % 10}": [{"op": ">=", "ver": f"{v}.0"}]},
+                    "constrains": {f"p{(k + 3) % 10}": [{"op": "<", "ver": "3.0"}]},
+                }
+                for v in range(4)
+            }
+            for k in range(10)
+        }
+        package_names, gene_choices = build_encoding(repo, ["3.9"])
+        compiled = CompiledRepo(repo, package_names, gene_choices)
+        compiled._build_links()
+        random.seed(0)
+        population = [random_individual(gene_choices) for _ in range(40)]
+        parent = population[0]
+        parent_eval = compiled.evaluate_conflicts(parent)
+        parents = [[(parent, parent_eval, None)] for _ in population]
+
+        pool = EvaluationPool(compiled, 2)
+        try:
+            for track in (False, True):
+                self.assertEqual(
+                    evaluate_population(population, compiled, pool=pool, track_conflicts=track),
+                    evaluate_population(population, compiled, track_conflicts=track),
+                )
+            self.assertEqual(
+                evaluate_population(population, compiled, parents, pool=pool, track_conflicts=True),
+                evaluate_population(population, compiled, parents, track_conflicts=True),
+            )
+        finally:
+            pool.close()
+        self.assertEqual(multiprocessing.active_children(), [])
+
+    def test_run_ga_pool_shuts_down_on_stop_and_interrupt(self):
+        repo = {
+            f"p{k}": {f"{v}.0": {"depends": {}, "constrains": {}} for v in range(3)}
+            for k in range(6)
+        }
+        # 풀 객체를 붙잡아 두어야 GC 의 정리가 아니라 run_ga 가 직접 종료했는지 확인할 수 있음
+        pools = []
+
+        class RecordingPool(EvaluationPool):
+            def __init__(self, *args):
+                super().__init__(*args)
+                pools.append(self)
+
+        def assert_workers_stopped():
+            self.assertTrue(pools)
+            workers = [p for pool in pools for p in pool._pool._pool]
+            self.assertTrue(workers)
+            self.assertFalse([p for p in workers if p.is_alive()])
+            pools.clear()
+
+        with mock.patch.object(ga6, "EvaluationPool", RecordingPool):
+            # 조기 종료
+            run_ga(repo, python_candidates=["3.9"], pop_size=10, n_generations=50, seed=0, workers=2, stall_generations=2)
+            assert_workers_stopped()
+
+            # 세대 도중 SIGINT: 지금까지의 최고 해를 반환하고 워커는 모두 종료
+            def interrupt(gen, best_fitness):
+                if gen == 3:
+                    raise KeyboardInterrupt
+
+            stats = {}
+            best_f, _, _ = run_ga(
+                repo, python_candidates=["3.9"], pop_size=10, n_generations=50, seed=0, workers=2,
+                progress=interrupt, stats=stats,
+            )
+            self.assertTrue(stats["interrupted"])
+            self.assertEqual(stats["generations"], 4)
+            self.assertGreater(best_f, 0)
+            assert_workers_stopped()
+
+    def test_run_ga_islands(self):
+        repo = {
+            "packageA": {
+                "1.0.0": {"depends": {"packageB": [{"op": ">=", "ver": "2.0.0"}]}, "constrains": {}},
+                "2.0.0": {"depends": {"packageB": [{"op": "<", "ver": "2.0.0"}]}, "constrains": {}},
+            },
+            "packageB": {
+                "1.0.0": {"depends": {}, "constrains": {}},
+                "2.0.0": {"depends": {}, "constrains": {}},
+            },
+        }
+        best_f, best_py, best_pkgs = run_ga(
+            repo,
+            python_candidates=["3.9"],
+            pop_size=10,
+            n_generations=12,
+            seed=1,
+            islands=2,
+            migration_interval=4,
+        )
+        self.assertEqual(best_f, 20.0)
+        self.assertIsNotNone(best_pkgs["packageA"])
+        self.assertIsNotNone(best_pkgs["packageB"])
+
+    def test_repair_fixes_depends_conflict(self):
+        repo = {
+            "packageA": {
+                "1.0.0": {"depends": {"packageB": [{"op": ">=", "ver": "2.0.0"}]}, "constrains": {}},
+            },
+            "packageB": {
+                "1.0.0": {"depends": {}, "constrains": {}},
+                "2.0.0": {"depends": {}, "constrains": {}},
+            },
+        }
+        package_names, gene_choices = build_encoding(repo, ["3.9"])
+        compiled = CompiledRepo(repo, package_names, gene_choices)
+        ind = [0, 1, 1]  # packageA 1.0.0 + packageB 1.0.0
+        self.assertEqual(compiled.evaluate(ind)[1], 1)
+        self.assertEqual(compiled.repair(ind, 3), 1)
+        self.assertEqual(ind, [0, 1, 2])
+        self.assertEqual(compiled.evaluate(ind), (20.0, 0, 0))
+
+    def test_reduce_domains(self):
+        repo = {
+            "packageA": {
+                "1.0.0": {"depends": {"packageB": [{"op": ">=", "ver": "3.0.0"}]}, "constrains": {}},
+                "2.0.0": {"depends": {"python": [{"op": "<", "ver": "3.0"}]}, "constrains": {}},
+                "3.0.0": {"depends": {"packageC": [{"op": ">=", "ver": "1.0"}]}, "constrains": {}},
+            },
+            "packageB": {
+                "1.0.0": {"depends": {}, "constrains": {}},
+                "2.0.0": {"depends": {}, "constrains": {}},
+            },
+            "packageC": {
+                "1.0": {"depends": {"packageB": [{"op": "==", "ver": "3.0.0"}]}, "constrains": {}},
+            },
+        }
+        reduced, python_candidates = reduce_domains(repo, ["3.9"])
+        self.assertEqual(python_candidates, ["3.9"])
+        self.assertEqual(reduced["packageA"], {})
+        self.assertEqual(reduced["packageC"], {})
+        self.assertEqual(set(reduced["packageB"]), {"1.0.0", "2.0.0"})
+        self.assertIsNone(reduce_domains(repo, ["3.9"], {"packageA": [{"op": ">=", "ver": "1.0.0"}]}))
+
+    def test_linkage_crossover_keeps_pinned_pair(self):
+        repo = {
+            "torch": {
+                "1.0": {"depends": {}, "constrains": {}},
+                "2.0": {"depends": {}, "constrains": {}},
+            },
+            "torchvision": {
+                "0.1": {"depends": {"torch": [{"op": "==", "ver": "1.0"}]}, "constrains": {}},
+                "0.2": {"depends": {"torch": [{"op": "==", "ver": "2.0"}]}, "constrains": {}},
+            },
+            "requests": {
+                "2.0": {"depends": {}, "constrains": {}},
+            },
+        }
+        package_names, gene_choices = build_encoding(repo, ["3.9"])
+        compiled = CompiledRepo(repo, package_names, gene_choices)
+        compiled._build_clusters()
+        pair = sorted(compiled.gene_index[p] for p in ("torch", "torchvision"))
+        self.assertIn(pair, [sorted(c) for c in compiled.clusters])
+
+        random.seed(0)
+        p1, p2 = [0, 1, 1, 1], [0, 0, 2, 2]
+        for _ in range(20):
+            for child in linkage_crossover(p1, p2, compiled.clusters, pc=1.0):
+                self.assertIn((child[pair[0]], child[pair[1]]), [(1, 1), (2, 2)])
+
+    def test_conflict_mutation_targets_conflicts(self):
+        repo = {
+            "packageA": {
+                "1.0.0": {"depends": {"packageB": [{"op": ">=", "ver": "2.0.0"}]}, "constrains": {}},
+            },
+            "packageB": {
+                "1.0.0": {"depends": {}, "constrains": {}},
+                "2.0.0": {"depends": {}, "constrains": {}},
+            },
+            "packageC": {
+                "1.0": {"depends": {}, "constrains": {}},
+                "2.0": {"depends": {}, "constrains": {}},
+            },
+        }
+        hard = {"packageC": [{"op": "==", "ver": "2.0"}]}
+        package_names, gene_choices = build_encoding(repo, ["3.9"])
+        compiled = CompiledRepo(repo, package_names, gene_choices, hard)
+        ind = [0, 1, 1, 1]  # A 1.0.0 -> B 1.0.0 위반, C 1.0 은 hard constraint 위반
+        self.assertEqual(compiled.conflict_genes(ind), [1, 2, 3])
+        self.assertEqual(compiled.conflict_genes([0, 1, 2, 2]), [])
+
+        random.seed(0)
+        for _ in range(20):
+            child = [0, 1, 1, 1]
+            conflict_mutate(child, gene_choices, [2], pm_conflict=1.0, pm_background=0.0)
+            self.assertEqual(child[:2] + child[3:], [0, 1, 1])
+
+        best_f, _, best_pkgs = run_ga(
+            repo, python_candidates=["3.9"], pop_size=10, n_generations=10, seed=3,
+            hard_constraints=hard, mutation_op="conflict",
+        )
+        self.assertEqual(best_pkgs["packageC"], "2.0")
+        self.assertEqual(best_f, 31.0)
+
+    def test_greedy_individual_is_conflict_free(self):
+        repo = {
+            "torch": {
+                "1.0": {"depends": {"python": [{"op": "<", "ver": "3.10"}]}, "constrains": {}},
+                "2.0": {"depends": {"python": [{"op": ">=", "ver": "3.10"}]}, "constrains": {}},
+            },
+            "torchvision": {
+                "0.1": {"depends": {"torch": [{"op": "==", "ver": "1.0"}]}, "constrains": {}},
+                "0.2": {"depends": {"torch": [{"op": "==", "ver": "2.0"}]}, "constrains": {}},
+            },
+            "requests": {
+                "2.0": {"depends": {}, "constrains": {"torch": [{"op": "<", "ver": "3.0"}]}},
+            },
+        }
+        hard = {"torchvision": [{"op": "==", "ver": "0.1"}]}
+        package_names, gene_choices = build_encoding(repo, ["3.9", "3.10"])
+        compiled = CompiledRepo(repo, package_names, gene_choices, hard)
+        root = compiled.gene_index["torchvision"]
+        random.seed(0)
+        for _ in range(20):
+            ind = compiled.greedy_individual([root])
+            self.assertEqual(compiled.evaluate(ind)[1:], (0, 0))
+            self.assertTrue(all(a > 0 for a in ind[1:]))
+
+        # 가장 최신 후보를 늘 거절해도 python 유전자의 0번 ("3.9") 을 호환되는 후보로 고름
+        with mock.patch.object(ga6, "GREEDY_NEWEST_PROB", 0.0):
+            ind = compiled.greedy_individual([root])
+        self.assertEqual(gene_choices[0][ind[0]], "3.9")
+        self.assertEqual(compiled.evaluate(ind)[1:], (0, 0))
+
+    def test_run_ga_components(self):
+        n = COMPONENT_MIN_GENES
+        repo = {}
+        for c in "ab":
+            for k in range(n):
+                nxt = f"{c}{(k + 1) % n}"
+                repo[f"{c}{k}"] = {
+                    "1.0": {"depends": {nxt: [{"op": ">=", "ver": "2.0"}]}, "constrains": {}},
+                    "2.0": {"depends": {"python": [{"op": "<", "ver": "3.10"}]}, "constrains": {}},
+                }
+        groups = split_components(repo)
+        self.assertEqual([sorted(g) for g in groups], [sorted(p for p in repo if p[0] == c) for c in "ab"])
+
+        best_f, best_py, best_pkgs = run_ga_components(
+            repo, python_candidates=["3.9", "3.10"], pop_size=20, n_generations=30, seed=0,
+        )
+        self.assertEqual(set(best_pkgs), set(repo))
+        package_names, gene_choices = build_encoding(repo, ["3.9", "3.10"])
+        compiled = CompiledRepo(repo, package_names, gene_choices)
+        individual = [gene_choices[0].index(best_py)] + [
+            gene_choices[i].index(best_pkgs[pkg]) for i, pkg in enumerate(package_names, start=1)
+        ]
+        self.assertAlmostEqual(best_f, compiled.fitness(individual))
+
+    def test_components_share_time_limit(self):
+        # 묶음 4개가 time_limit 을 하나씩 쓰면 1.2초 이상 걸림
+        n = COMPONENT_MIN_GENES
+        repo = {
+            f"{c}{k}": {
+                "1.0": {"depends": {f"{c}{(k + 1) % n}": [{"op": ">=", "ver": "2.0"}]}, "constrains": {}},
+                "2.0": {"depends": {"python": [{"op": "<", "ver": "3.10"}]}, "constrains": {}},
+            }
+            for c in "abcd" for k in range(n)
+        }
+        start = time.monotonic()
+        _, _, best_pkgs = run_ga_components(
+            repo, python_candidates=["3.9", "3.10"], pop_size=10, n_generations=10 ** 6,
+            time_limit=0.3, seed=0,
+        )
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual(set(best_pkgs), set(repo))
+
+    def test_run_ga_per_python(self):
+        repo = {
+            "A": {
+                "1.0": {"depends": {"python": [{"op": "<", "ver": "3.10"}]}, "constrains": {}},
+                "2.0": {"depends": {"python": [{"op": ">=", "ver": "3.11"}]}, "constrains": {}},
+            },
+            "B": {
+                "1.0": {"depends": {"python": [{"op": ">=", "ver": "3.13"}]}, "constrains": {}},
+            },
+        }
+        hard = {"A": [{"op": "==", "ver": "2.0"}]}
+        self.assertEqual(derive_python_candidates(repo, hard), ["3.11", "3.12", "3.13", "3.14"])
+
+        best_f, best_py, best_pkgs, summary = run_ga_per_python(
+            repo, ["3.9", "3.13"], hard, seed=0, pop_size=10, n_generations=10,
+        )
+        self.assertEqual([entry["feasible"] for entry in summary], [False, True])
+        self.assertIsNone(summary[0]["fitness"])
+        self.assertEqual(best_py, "3.13")
+        self.assertEqual(best_pkgs, {"A": "2.0", "B": "1.0"})
+        self.assertEqual(summary[1]["fitness"], best_f)
+
+    def test_per_python_shares_time_limit(self):
+        # 후보 3개 x 묶음 4개가 time_limit 을 하나씩 쓰면 3.6초 이상 걸림
+        n = COMPONENT_MIN_GENES
+        repo = {
+            f"{c}{k}": {
+                "1.0": {"depends": {f"{c}{(k + 1) % n}": [{"op": ">=", "ver": "2.0"}]}, "constrains": {}},
+                "2.0": {"depends": {"python": [{"op": "<", "ver": "3.10"}]}, "constrains": {}},
+            }
+            for c in "abcd" for k in range(n)
+        }
+        start = time.monotonic()
+        best_f, best_py, best_pkgs, summary = run_ga_per_python(
+            repo, ["3.8", "3.9", "3.10"], components=True, pop_size=10, n_generations=10 ** 6,
+            time_limit=0.3, seed=0,
+        )
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual(set(best_pkgs), set(repo))
+        self.assertTrue(all(entry["fitness"] is not None for entry in summary))
+
+    def test_warm_start_resolves_only_affected(self):
+        repo = {
+            "A": {
+                "1.0": {"depends": {"B": [{"op": "<", "ver": "2.0"}]}, "constrains": {}},
+                "2.0": {"depends": {"B": [{"op": ">=", "ver": "2.0"}]}, "constrains": {}},
+            },
+            "B": {"1.0": {"depends": {}, "constrains": {}}, "2.0": {"depends": {}, "constrains": {}}},
+            "C": {"1.0": {"depends": {}, "constrains": {}}, "2.0": {"depends": {}, "constrains": {}}},
+        }
+        previous = {"python_version": "3.10", "all_packages": {"A": "1.0", "B": "1.0", "C": "1.0"}}
+        # requirements 에서 A 를 2.0 으로 올린 경우: A 와 이웃 B 만 다시 풀고 C 는 이전 버전 유지
+        hard = {"A": [{"op": "==", "ver": "2.0"}]}
+        reduced, python_candidates, affected = warm_start_repo(repo, ["3.9", "3.10"], hard, previous, radius=1)
+        self.assertEqual(affected, {"A", "B"})
+        self.assertEqual(python_candidates, ["3.10"])
+        self.assertEqual(list(reduced["C"]), ["1.0"])
+
+        best_f, best_py, best_pkgs = run_ga(
+            repo, ["3.9", "3.10"], pop_size=20, n_generations=10, seed=0,
+            hard_constraints=hard, warm_start=previous, warm_start_radius=1,
+        )
+        self.assertEqual(best_py, "3.10")
+        self.assertEqual(best_pkgs, {"A": "2.0", "B": "2.0", "C": "1.0"})
+
+    def test_solve_dep_space_reports_progress(self):
+        repo = {
+            "A": {"1.0": {"depends": {"B": [{"op": ">=", "ver": "1.0"}]}, "constrains": {}}},
+            "B": {"1.0": {"depends": {}, "constrains": {}}},
+        }
+        seen = []
+        stats = {}
+        solved = solve_dep_space(
+            repo, hard_constraints={"A": []}, python_candidates=["3.9"],
+            pop_size=10, n_generations=5, seed=0, progress=lambda gen, best: seen.append(gen), stats=stats,
+        )
+        self.assertEqual(seen, list(range(5)))
+        # 4개 조합뿐이라 캐시 덕분에 평가는 최대 4번
+        self.assertEqual(stats["generations"], 5)
+        self.assertTrue(1 <= stats["evaluations"] <= 4)
+        self.assertEqual(solved["packages"], {"A": "1.0", "B": "1.0"})
+        self.assertEqual(solved["all_packages"], solved["packages"])
+
+    def test_checkpoint_resume_matches_uninterrupted(self):
+        rng = random.Random(0)
+        repo = {
+            f"p{i}": {
+                f"{v}.0": {
+                    "depends": {f"p{rng.randrange(12)}": [{"op": ">=", "ver": f"{rng.randint(1, 3)}.0"}]},
+                    "constrains": {},
+                }
+                for v in range(1, 4)
+            }
+            for i in range(12)
+        }
+        options = dict(python_candidates=["3.9"], pop_size=16, seed=5, pm=0.02, mutation_op="conflict")
+        expected = run_ga(repo, n_generations=20, **options)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ga.ckpt")
+            run_ga(repo, n_generations=12, checkpoint_path=path, checkpoint_interval=5, **options)
+            self.assertTrue(os.path.exists(path))
+            resumed = run_ga(repo, n_generations=20, checkpoint_path=path, resume=True, **options)
+            # 다른 옵션으로 저장된 체크포인트에서는 이어 풀지 않음
+            with self.assertRaises(ValueError):
+                run_ga(repo, n_generations=20, checkpoint_path=path, resume=True, **dict(options, pm=0.1))
+        self.assertEqual(resumed, expected)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy 필요")
+    def test_batch_variation_is_reproducible(self):
+        rng = random.Random(1)
+        repo = {
+            f"p{i}": {
+                f"{v}.0": {
+                    "depends": {f"p{rng.randrange(12)}": [{"op": ">=", "ver": f"{rng.randint(1, 3)}.0"}]},
+                    "constrains": {},
+                }
+                for v in range(1, 4)
+            }
+            for i in range(12)
+        }
+        for crossover_op in ("onepoint", "linkage"):
+            options = dict(
+                python_candidates=["3.9"], pop_size=15, seed=3, pm=0.02,
+                crossover_op=crossover_op, batch_variation=True,
+            )
+            expected = run_ga(repo, n_generations=20, **options)
+            self.assertEqual(run_ga(repo, n_generations=20, **options), expected)
+
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "ga.ckpt")
+                run_ga(repo, n_generations=12, checkpoint_path=path, checkpoint_interval=5, **options)
+                resumed = run_ga(repo, n_generations=20, checkpoint_path=path, resume=True, **options)
+            self.assertEqual(resumed, expected)
+
+    def test_trace_writes_one_line_per_generation(self):
+        repo = {
+            "A": {"1.0": {"depends": {"B": [{"op": ">=", "ver": "2.0"}]}, "constrains": {}}},
+            "B": {"1.0": {"depends": {}, "constrains": {}}, "2.0": {"depends": {}, "constrains": {}}},
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.jsonl")
+            run_ga(repo, ["3.9"], pop_size=8, n_generations=6, seed=0, trace_path=path)
+            with open(path) as f:
+                lines = [json.loads(line) for line in f]
+        self.assertEqual([line["gen"] for line in lines], list(range(6)))
+        self.assertEqual(lines[0]["seconds"]["selection"], 0.0)
+        for line in lines:
+            fit = line["fitness"]
+            self.assertLessEqual(fit["mean"], fit["best"])
+            self.assertLessEqual(fit["best"], fit["best_ever"])
+            self.assertTrue(0 < line["diversity"]["unique"] <= 1)
+            self.assertIsNotNone(line["cache"])
+
+    def test_steady_state_keeps_best_and_rejects_duplicates(self):
+        # allele 이 적어 중복 자식이 자주 생기는 repo
+        repo = {
+            f"p{i}": {
+                "1.0": {"depends": {f"p{(i + 1) % 6}": [{"op": ">=", "ver": "2.0"}]}, "constrains": {}},
+                "2.0": {"depends": {}, "constrains": {}},
+            }
+            for i in range(6)
+        }
+        package_names, gene_choices = build_encoding(repo, ["3.9"])
+        compiled = CompiledRepo(repo, package_names, gene_choices)
+        random.seed(0)
+        population = []
+        while len(population) < 12:
+            ind = random_individual(gene_choices)
+            if ind not in population:
+                population.append(ind)
+        evolution = Evolution(compiled, population, pm=0.1, steady_state=True)
+        evolution.evaluate()
+        worst = min(evolution.fitnesses)
+        for _ in range(10):
+            evolution.breed()
+            evolution.evaluate()
+            self.assertEqual(len({chromosome_key(ind) for ind in evolution.population}), 12)
+            self.assertGreaterEqual(min(evolution.fitnesses), worst)
+            worst = min(evolution.fitnesses)
+            self.assertEqual(max(evolution.fitnesses), evolution.best_fitness)
+        # 개체군에 이미 있는 자식은 평가하지 않음
+        self.assertLess(evolution.n_evaluations, 12 + 10 * 12)
+
+    def test_stop_condition_stall(self):
+        stop = StopCondition(stall_generations=3)
+        self.assertIsNone(stop.check(0, 1.0))
+        self.assertIsNone(stop.check(1, 2.0))
+        self.assertIsNone(stop.check(3, 2.0))
+        self.assertIsNotNone(stop.check(4, 2.0))
+        self.assertIsNotNone(StopCondition(time_limit=1e-9).check(0, 0.0))
+
+    def test_fitness_cache_lru(self):
+        cache = FitnessCache(2)
+        a, b, c = chromosome_key([0, 1]), chromosome_key([0, 2]), chromosome_key([1, 1])
+        cache.put(a, (1.0, 0, 0))
+        cache.put(b, (2.0, 0, 0))
+        self.assertEqual(cache.get(a), (1.0, 0, 0))
+        cache.put(c, (3.0, 0, 0))
+        self.assertIsNone(cache.get(b))
+        self.assertEqual(cache.get(c), (3.0, 0, 0))
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (2, 1, 2))
+
+
+
+class TestSolver(unittest.TestCase):
+
+    def test_solve_picks_newest_compatible(self):
+        dep_space = {
+            "A": {
+                "1.0": {"depends": {"B": [{"op": ">=", "ver": "1.0"}]}, "constrains": {}},
+                "2.0": {"depends": {"B": [{"op": "<", "ver": "2.0"}]}, "constrains": {}},
+            },
+            "B": {"1.0": {"depends": {}, "constrains": {}}, "2.0": {"depends": {}, "constrains": {}}},
+        }
+        self.assertEqual(solver.solve({"A": []}, dep_space), {"A": "2.0", "B": "1.0"})
+        self.assertEqual(solver.solve({"A": [], "B": [{"op": ">=", "ver": "2.0"}]}, dep_space), {"A": "1.0", "B": "2.0"})
+
+    def test_python_bound_selects_python(self):
+        dep_space = {"A": {"1.0": {"depends": {"python": [{"op": "<", "ver": "3.11"}]}, "constrains": {}}}}
+        solution = solver.solve({"A": []}, dep_space, ["3.9", "3.10", "3.11", "3.12"])
+        self.assertEqual(solution, {"python": "3.10", "A": "1.0"})
+
+    def test_python_bound_unsat_proof(self):
+        dep_space = {
+            "A": {"1.0": {"depends": {"python": [{"op": "<", "ver": "3.8"}]}, "constrains": {}}},
+            "B": {"1.0": {"depends": {}, "constrains": {}}},
+        }
+        with self.assertRaises(solver.UnsatisfiableError) as ctx:
+            solver.solve({"A": [], "B": []}, dep_space, ["3.9", "3.10"])
+        proof = "\n".join(ctx.exception.proof)
+        self.assertIn("project requires A", proof)
+        self.assertIn("A 1.0 depends on python <3.8 (no available version)", proof)
+        self.assertNotIn("B", proof)
+
+    def test_unsat_proof_names_conflicting_packages(self):
+        dep_space = {
+            "A": {"1.0": {"depends": {}, "constrains": {"B": [{"op": "<", "ver": "2.0"}]}}},
+            "B": {"1.0": {"depends": {}, "constrains": {}}, "2.0": {"depends": {}, "constrains": {}}},
+            "C": {"1.0": {"depends": {}, "constrains": {}}},
+        }
+        with self.assertRaises(solver.UnsatisfiableError) as ctx:
+            solver.solve({"A": [], "B": [{"op": ">=", "ver": "2.0"}], "C": []}, dep_space)
+        proof = ctx.exception.proof
+        self.assertIn("project requires B >=2.0", proof)
+        self.assertIn("A 1.0 constrains B <2.0", proof)
+        self.assertFalse(any("C" in line for line in proof))
+
+    def test_conflict_learns_clause_and_backjumps(self):
+        # A 의 최신 버전을 먼저 고르면 B==1.0 이 되어 C 를 설치할 수 없으므로
+        # level 1 충돌에서 not A==2.0 을 배우고 level 0 으로 돌아가야 함
+        dep_space = {
+            "A": {
+                "2.0": {"depends": {"B": [{"op": "==", "ver": "1.0"}]}, "constrains": {}},
+                "1.0": {"depends": {"B": [{"op": "==", "ver": "2.0"}]}, "constrains": {}},
+            },
+            "B": {"1.0": {"depends": {}, "constrains": {}}, "2.0": {"depends": {}, "constrains": {}}},
+            "C": {
+                "2.0": {"depends": {"B": [{"op": ">=", "ver": "2.0"}]}, "constrains": {}},
+                "1.0": {"depends": {"B": [{"op": ">=", "ver": "2.0"}]}, "constrains": {}},
+            },
+        }
+        resolver = solver.Resolver({"A": [], "C": []}, dep_space)
+        self.assertEqual(resolver.solve(), {"A": "1.0", "B": "2.0", "C": "2.0"})
+        self.assertTrue(any(info[0] == "learned" for info in resolver.info))
+
+    @unittest.skipIf(solve_main is None, "requests 필요")
+    def test_main_exact_path_respects_python_and_fixed_packages(self):
+        # pruning 은 torch / urllib3 / numpy 를 precomputed 로 옮기고 python depends 를 지움
+        # dep_space_clean 을 그대로 풀면 python 3.14 에 urllib3 없는 해가 나옴
+        def meta(**deps):
+            return {"depends": {pkg: [{"op": op, "ver": ver}] for pkg, (op, ver) in deps.items()}, "constrains": {}}
+        dep_space = {
+            "torchvision": {"0.1": meta(torch=("==", "1.0"), python=(">=", "3.8"))},
+            "torch": {"1.0": meta(python=("<", "3.11")), "2.0": meta(python=(">=", "3.9"))},
+            "scipy": {"1.0": meta(numpy=(">=", "1.0")), "1.1": meta(numpy=(">=", "1.1"))},
+            "numpy": {"1.0": meta(), "1.1": meta()},
+            "requests": {"2.0": meta(urllib3=(">=", "1.0")), "2.1": meta(urllib3=(">=", "1.0"))},
+            "urllib3": {"1.0": meta()},
+        }
+        proj_constraints = {"torchvision": [{"op": "==", "ver": "0.1"}], "scipy": [], "requests": []}
+        pruned = solve_main.run_pruning(
+            proj_constraints=proj_constraints, required_packages=list(proj_constraints),
+            visualize=False, save_files=False, dep_space=dep_space,
+        )
+        solution, proof = solve_main.solve_exact(proj_constraints, solve_main.requirements_slice(pruned))
+        self.assertIsNone(proof)
+        self.assertEqual(solution["python"], "3.10")
+        self.assertEqual(solution["torch"], "1.0")
+        self.assertEqual(solution["urllib3"], "1.0")
+        self.assertEqual(solution["numpy"], "1.1")
+
+    @unittest.skipIf(solve_main is None, "requests 필요")
+    def test_interrupted_ga_is_not_cached(self):
+        dep_space = {
+            "a": {"1.0": {"depends": {"b": [{"op": ">=", "ver": "2.0"}], "python": [{"op": ">=", "ver": "3.8"}]}, "constrains": {}}},
+            "b": {"1.0": {"depends": {}, "constrains": {}}},
+        }
+
+        def interrupt(gen, best_fitness):
+            raise KeyboardInterrupt
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                with open("requirements.txt", "w") as f:
+                    f.write("a\nb\n")
+                with open("dep_space.json", "w") as f:
+                    json.dump(dep_space, f)
+                argv = ["main.py", "--file", "requirements.txt", "--dep-space", "dep_space.json", "--cache-dir", "cache"]
+                with mock.patch.object(solve_main, "report_progress", interrupt), \
+                        mock.patch.object(solve_main, "GA_OUTPUT", "ga.json"), mock.patch("sys.argv", argv):
+                    solve_main.main()
+                self.assertTrue(os.path.exists("ga.json"))
+                self.assertEqual(os.listdir("cache") if os.path.exists("cache") else [], [])
+
+                # 끝까지 푼 결과는 캐시됨
+                with mock.patch.object(solve_main, "GA_OPTIONS", dict(solve_main.GA_OPTIONS, n_generations=2, pop_size=10)), \
+                        mock.patch.object(solve_main, "GA_OUTPUT", "ga.json"), mock.patch("sys.argv", argv):
+                    solve_main.main()
+                self.assertEqual(len(os.listdir("cache")), 1)
+            finally:
+                os.chdir(cwd)
+
+    def _workers_dispatch(self, **ga_options):
+        # 두 개의 독립된 9 패키지 사슬, 각 사슬의 끝이 처음 패키지의 없는 버전을 요구해 unsat
+        dep_space, proj_constraints = {}, {}
+        for chain in "xy":
+            for k in range(9):
+                name = f"{chain}{k}"
+                dep = {f"{chain}{k + 1}": [{"op": ">=", "ver": "1.0"}]} if k < 8 else {f"{chain}0": [{"op": ">=", "ver": "9.0"}]}
+                dep_space[name] = {f"{v}.0": {"depends": dep, "constrains": {}} for v in (1, 2)}
+                proj_constraints[name] = []
+
+        # main.py 는 ga6 를 최상위 모듈로 import 함
+        main_ga6 = inspect.getmodule(solve_main.solve_dep_space)
+        run_jobs = main_ga6._run_jobs
+        calls = []
+
+        def spy(run, jobs, workers, stats, fill_remaining):
+            calls.append((run.__name__, workers, len(jobs)))
+            return run_jobs(run, jobs, workers, stats, fill_remaining)
+
+        def prune(constraints, required, space):
+            return solve_main.run_pruning(
+                proj_constraints=constraints, required_packages=required,
+                visualize=False, save_files=False, dep_space=space,
+            )
+
+        options = dict(solve_main.GA_OPTIONS, n_generations=2, pop_size=10, **ga_options)
+        with mock.patch.object(main_ga6, "_run_jobs", spy), mock.patch.object(solve_main, "prune_project", prune), \
+                mock.patch.object(solve_main, "GA_OPTIONS", options):
+            outcome = solve_main.solve_requirements(proj_constraints, list(proj_constraints), dep_space, workers=2)
+        self.assertIn("ga", outcome)
+        return calls
+
+    @unittest.skipIf(solve_main is None, "requests 필요")
+    def test_workers_solve_components_in_parallel(self):
+        calls = self._workers_dispatch(per_python=False)
+        self.assertEqual(calls[0], ("_run_component", 2, 2))
+
+    @unittest.skipIf(solve_main is None, "requests 필요")
+    def test_workers_solve_python_candidates_in_parallel(self):
+        calls = self._workers_dispatch(per_python=True, python_candidates=None)
+        self.assertEqual(calls[0][:2], ("_run_python_job", 2))
+        self.assertGreater(calls[0][2], 1)
+
+        # 후보가 하나면 그 후보의 연결 요소들을 병렬로 풂
+        calls = self._workers_dispatch(per_python=True, python_candidates=["3.12"])
+        self.assertEqual(calls[0], ("_run_python_job", 2, 1))
+        self.assertEqual(calls[1], ("_run_component", 2, 2))
+
+
+class TestVersionIntern(unittest.TestCase):
+
+    VERSIONS = [
+        "1.0", "1.0.0", "1.0.post1", "1.0rc1", "1.0.dev0", "1.0a1", "0.9.9", "1.0+local",
+        "2!0.1", "1.10", "1.2", "10.0", "1.0.0.0", "1.1b2",
+    ]
+
+    def test_pep440_rank_matches_packaging(self):
+        table = version_intern.VersionTable()
+        for ver in self.VERSIONS:
+            table.intern(ver)
+        table.ensure_ranked("pep440")
+        for a in self.VERSIONS:
+            for b in self.VERSIONS:
+                expected = (Version(a) > Version(b)) - (Version(a) < Version(b))
+                got = table.rank(a) - table.rank(b)
+                self.assertEqual((got > 0) - (got < 0), expected, (a, b))
+                self.assertEqual(table.compare(a, b), expected, (a, b))
+
+    def test_base_rank_ignores_pre_post_local(self):
+        table = version_intern.VersionTable()
+        for a in self.VERSIONS:
+            for b in self.VERSIONS:
+                va, vb = Version(Version(a).base_version), Version(Version(b).base_version)
+                self.assertEqual(table.compare(a, b, "base"), (va > vb) - (va < vb), (a, b))
+
+    def test_trailing_zeros_are_equal(self):
+        table = version_intern.VersionTable()
+        for scheme in version_intern.SCHEMES:
+            self.assertEqual(table.compare("1.0", "1.0.0", scheme), 0, scheme)
+            self.assertEqual(table.rank("1.0", scheme), table.rank("1.0.0", scheme), scheme)
+            self.assertEqual(table.compare("1.0", "1.0.1", scheme), -1, scheme)
+
+    def test_compare_before_and_after_rebuild_agree(self):
+        # rank 가 없는 새 문자열은 캐시된 key 로 비교하고, 충분히 쌓이면 rank 를 다시 만듦
+        table = version_intern.VersionTable()
+        table.intern("1.0")
+        table.ensure_ranked("pep440")
+        self.assertEqual(table.compare("1.0rc1", "1.0"), -1)
+        for k in range(200):
+            table.intern(f"0.{k}")
+        self.assertEqual(table.compare("0.150", "0.20"), 1)
+        self.assertEqual(table.compare("1.0rc1", "1.0"), -1)
+        with self.assertRaises(version_intern.InvalidVersion):
+            table.compare("not a version", "1.0")
+
+    def test_register_dep_space_does_not_mutate(self):
+        dep_space = {
+            "a": {"1.0": {"depends": {"b": [{"op": ">=", "ver": "".join(["2", ".0"])}]}, "constrains": {}}},
+            "b": {"2.0": {"depends": {}, "constrains": {}}, "3.0": None},
+        }
+        cond = dep_space["a"]["1.0"]["depends"]["b"][0]
+        original = json.loads(json.dumps(dep_space))
+        ver = cond["ver"]
+
+        table = version_intern.VersionTable()
+        table.register_dep_space(dep_space)
+        self.assertEqual(dep_space, original)
+        self.assertIs(cond["ver"], ver)
+        self.assertEqual(len(table), 3)
+
+        table.canonicalize_dep_space(dep_space)
+        self.assertEqual(dep_space, original)
+        self.assertIs(cond["ver"], table.canonical("2.0"))
+        self.assertEqual(len(table), 3)
+
+
+class TestSolutionCache(unittest.TestCase):
+
+    DEP_SPACE = {
+        "A": {"1.0": {"depends": {"B": [{"op": ">=", "ver": "1.0"}]}, "constrains": {}}},
+        "B": {"1.0": {"depends": {}, "constrains": {}}},
+    }
+
+    def key(self, constraints=None, required=("A", "B"), dep_space=None, python=("3.9",), params=None):
+        if constraints is None:
+            constraints = {"A": [{"op": ">=", "ver": "1.0"}, {"op": "<", "ver": "2.0"}], "B": []}
+        return cache_key(
+            constraints, list(required), dep_space or self.DEP_SPACE, list(python), params or {"ga": {"pop_size": 10}},
+        )
+
+    def test_key_ignores_order_and_duplicates(self):
+        base = self.key()
+        self.assertEqual(self.key(constraints={"B": [], "A": [{"op": "<", "ver": "2.0"}, {"op": ">=", "ver": "1.0"}]}), base)
+        self.assertEqual(self.key(required=("B", "A", "A")), base)
+        reordered = {"B": self.DEP_SPACE["B"], "A": self.DEP_SPACE["A"]}
+        self.assertEqual(self.key(dep_space=reordered), base)
+
+    def test_key_changes_with_inputs(self):
+        base = self.key()
+        dep_space = json.loads(json.dumps(self.DEP_SPACE))
+        dep_space["B"]["2.0"] = {"depends": {}, "constrains": {}}
+        changed = [
+            self.key(constraints={"A": [{"op": ">=", "ver": "1.0"}], "B": []}),
+            self.key(required=("A",)),
+            self.key(dep_space=dep_space),
+            self.key(python=("3.9", "3.10")),
+            self.key(params={"ga": {"pop_size": 20}}),
+        ]
+        for key in changed:
+            self.assertNotEqual(key, base)
+        self.assertEqual(len(set(changed)), len(changed))
+
+    def test_get_put_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SolutionCache(tmp)
+            self.assertIsNone(cache.get("missing"))
+            cache.put("k", {"solution": {"A": "1.0"}})
+            self.assertEqual(cache.get("k"), {"solution": {"A": "1.0"}})
+            with open(os.path.join(tmp, "broken.json"), "w") as f:
+                f.write("{")
+            self.assertIsNone(cache.get("broken"))
+
+    def test_evicts_least_recently_used(self):
+        value = {"data": "x" * 1000}
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SolutionCache(tmp, max_bytes=2500)
+            cache.put("a", value)
+            cache.put("b", value)
+            # a 가 b 보다 먼저 쓰였지만 최근에 읽혔으므로 b 가 지워져야 함
+            past = time.time() - 100
+            os.utime(os.path.join(tmp, "a.json"), (past - 10, past - 10))
+            os.utime(os.path.join(tmp, "b.json"), (past, past))
+            self.assertEqual(cache.get("a"), value)
+            cache.put("c", value)
+            self.assertEqual(cache.get("a"), value)
+            self.assertIsNone(cache.get("b"))
+            self.assertEqual(cache.get("c"), value)
+            self.assertEqual(sorted(os.listdir(tmp)), ["a.json", "c.json"])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
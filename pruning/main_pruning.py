@@ -8,7 +8,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import pruning
 
-def run_pruning(dep_space_path=None, proj_constraints=None, required_packages=None, output_dir=None, visualize=True, save_files=True):
+def run_pruning(dep_space_path=None, proj_constraints=None, required_packages=None, output_dir=None, visualize=True, save_files=True, dep_space=None):
+    # dep_space 가 주어지면 (이미 로드한 경우) 파일을 다시 읽지 않음
     if dep_space_path is None:
         dep_space_path = Path(__file__).parent.parent / "data" / "dep_space.json"
     else:
@@ -21,8 +22,9 @@ def run_pruning(dep_space_path=None, proj_constraints=None, required_packages=No
 
     output_dir.mkdir(exist_ok=True)
 
-    with open(dep_space_path) as f:
-        dep_space = json.load(f)
+    if dep_space is None:
+        with open(dep_space_path) as f:
+            dep_space = json.load(f)
 
     result = pruning.preprocess_dependencies(
         dep_space,
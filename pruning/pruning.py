@@ -1,11 +1,11 @@
 from collections import defaultdict, deque
-from packaging.version import Version
 import sys
 from pathlib import Path
 import copy
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 import utils
+import version_intern
 
 import json
 import os
@@ -45,17 +45,19 @@ class DependencyGraph:
     def _convert_dep_space_to_list(self, dep_space):
         """
         input 형식:  {pkg: {ver_str: {depends: {...}, constrains: {...}}}}
-        output 형식: {pkg: [(ver_obj, ver_str, depends, constrains), ...]}
+        output 형식: {pkg: [(ver_rank, ver_str, depends, constrains), ...]}
+        ver_rank 는 version_intern 의 pep440 rank (클수록 최신)
         """
         converted = {}
+        version_intern.register_dep_space(dep_space)
 
         for pkg, versions in dep_space.items():
             version_list = []
             for ver_str, metadata in versions.items():
                 try:
-                    ver_obj = Version(ver_str)
+                    ver_rank = version_intern.rank(ver_str, "pep440")
                     version_list.append({
-                        'version_obj': ver_obj,
+                        'version_rank': ver_rank,
                         'version_str': ver_str,
                         'depends': metadata['depends'],
                         'constrains': metadata.get('constrains', {})
@@ -63,7 +65,7 @@ class DependencyGraph:
                 except Exception:
                     continue
 
-            version_list.sort(key=lambda x: x['version_obj'], reverse=True)
+            version_list.sort(key=lambda x: x['version_rank'], reverse=True)
             converted[pkg] = version_list
 
         return converted
@@ -0,0 +1,218 @@
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pruning"))
+from main_pruning import run_pruning
+sys.path.insert(0, str(Path(__file__).parent.parent / "ga"))
+from ga6 import solve_dep_space, print_solution, save_solution
+
+from pipeline import load_json, requirements_slice, solve_exact, GA_OPTIONS
+import parse
+import version_intern
+
+TARGET_PREFIXES = ["CVPR", "ICLR", "NeurIPS"]
+
+# 워커 프로세스가 fork 로 물려받는 dep space (프로젝트마다 다시 읽거나 pickle 하지 않음)
+_dep_space = None
+_ga_options = None
+
+def find_requirement_files(req_dir: Path, prefixes):
+    req_files = []
+    for p in prefixes:
+        req_files.extend((req_dir / p).rglob("*.txt"))
+    return sorted(req_files)
+
+def get_output_dirs(req_path: Path, req_dir: Path):
+    """
+    data/requirements/CVPR/2022/CRIS.txt
+    -> dep_space_result/CVPR/2022/CRIS/, ga_result/CVPR/2022/CRIS/
+    """
+    rel = req_path.relative_to(req_dir).with_suffix("")
+    return Path("dep_space_result") / rel, Path("ga_result") / rel
+
+def save_json(data, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+def solve_file(req_path: Path, req_dir: Path):
+    """
+    프로젝트 하나를 pruning -> exact solver -> (unsat 이면) GA 순서로 풀고
+    결과를 프로젝트별 디렉토리에 저장 (공유되는 data/ 경로에는 쓰지 않음)
+    return: 요약 dict (status, 단계별 시간 등)
+    """
+    out_dir, ga_dir = get_output_dirs(req_path, req_dir)
+    summary = {"file": str(req_path), "output_dir": str(out_dir)}
+    timings = summary["seconds"] = {}
+    start = time.perf_counter()
+
+    requirements = parse.load_reqs_txt(req_path)
+    proj_constraints = parse.parse_reqs(requirements)
+    required_packages = parse.get_all_package_names(requirements)
+
+    missing_pkgs = [pkg for pkg in proj_constraints if pkg not in _dep_space]
+    if missing_pkgs:
+        summary["status"] = "missing"
+        summary["missing"] = missing_pkgs
+        timings["total"] = time.perf_counter() - start
+        return summary
+
+    t = time.perf_counter()
+    result = run_pruning(
+        proj_constraints=proj_constraints,
+        required_packages=required_packages,
+        visualize=False,
+        save_files=False,
+        dep_space=_dep_space,
+    )
+    timings["pruning"] = time.perf_counter() - t
+    dep_space_slice = requirements_slice(result)
+    if result['dep_space_req'] is not None:
+        save_json(result['dep_space_req'], out_dir / "dep_space_req.json")
+    save_json(result['dep_space_clean'], out_dir / "dep_space_clean.json")
+    save_json(result['precomputed_dep_space'], out_dir / "precomputed.json")
+
+    t = time.perf_counter()
+    solution, proof = solve_exact(proj_constraints, dep_space_slice)
+    timings["exact"] = time.perf_counter() - t
+    if solution is not None:
+        save_json(solution, out_dir / "solution.json")
+        summary["status"] = "solved"
+        timings["total"] = time.perf_counter() - start
+        return summary
+    save_json(proof, out_dir / "unsat_proof.json")
+
+    t = time.perf_counter()
+    solved = solve_dep_space(
+        dep_space_slice,
+        hard_constraints=proj_constraints,
+        **_ga_options,
+    )
+    timings["ga"] = time.perf_counter() - t
+    print_solution(solved)
+    if solved["python_version"] is None:
+        summary["status"] = "failed"
+    else:
+        save_solution(solved, str(ga_dir / "ga_solution.json"))
+        summary["status"] = "ga"
+        summary["fitness"] = solved["fitness"]
+    timings["total"] = time.perf_counter() - start
+    return summary
+
+def _solve_job(job):
+    """워커에서 프로젝트 하나를 풂, 출력은 프로젝트별 log.txt 로 보냄"""
+    req_path, req_dir = job
+    out_dir, _ = get_output_dirs(req_path, req_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with open(out_dir / "log.txt", "w") as log, contextlib.redirect_stdout(log):
+        try:
+            return solve_file(req_path, req_dir)
+        except Exception as e:
+            print(f"[ERROR] {e!r}")
+            return {"file": str(req_path), "output_dir": str(out_dir), "status": "error", "error": repr(e)}
+
+def main():
+    global _dep_space, _ga_options
+
+    arg_parser = argparse.ArgumentParser(description="Batch dependency solver over a requirements corpus")
+    arg_parser.add_argument(
+        "--dep-space",
+        type=str,
+        required=True,
+        help="Path to dependency space JSON",
+    )
+    arg_parser.add_argument(
+        "--requirements-dir",
+        type=str,
+        default="data/requirements",
+        help="Root directory of requirements files (default: data/requirements)",
+    )
+    arg_parser.add_argument(
+        "--venues",
+        nargs="+",
+        default=TARGET_PREFIXES,
+        help=f"Subdirectories to solve (default: {' '.join(TARGET_PREFIXES)})",
+    )
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of projects solved in parallel (default: CPU count)",
+    )
+    arg_parser.add_argument(
+        "--ga-time-limit",
+        type=float,
+        default=None,
+        help="GA time budget in seconds per project, shared by all Python candidates and components (default: none)",
+    )
+    arg_parser.add_argument(
+        "--summary",
+        type=str,
+        default="dep_space_result/batch_summary.json",
+        help="Where to write per-project status and timing (default: dep_space_result/batch_summary.json)",
+    )
+    args = arg_parser.parse_args()
+
+    req_dir = Path(args.requirements_dir)
+    req_files = find_requirement_files(req_dir, args.venues)
+    print(f"[INFO] Found {len(req_files)} requirements files")
+
+    # dep space 는 한 번만 읽어 버전 문자열을 공유하도록 정리하고, 버전 rank 도 fork 전에 만들어 둠
+    t = time.perf_counter()
+    _dep_space = load_json(args.dep_space)
+    version_intern.canonicalize_dep_space(_dep_space)
+    for scheme in ("pep440", "base"):
+        version_intern.ensure_ranked(scheme)
+    print(f"[INFO] Loaded {len(_dep_space)} packages in {time.perf_counter() - t:.1f}s")
+
+    _ga_options = dict(GA_OPTIONS)
+    if args.ga_time_limit is not None:
+        _ga_options["time_limit"] = args.ga_time_limit
+
+    jobs = [(req_path, req_dir) for req_path in req_files]
+    start = time.perf_counter()
+    summaries = []
+    if args.workers > 1 and len(jobs) > 1:
+        try:
+            ctx = multiprocessing.get_context("fork")
+        except ValueError:
+            ctx = multiprocessing.get_context()
+        pool = ctx.Pool(min(args.workers, len(jobs)))
+        results = pool.imap_unordered(_solve_job, jobs)
+    else:
+        pool = None
+        results = map(_solve_job, jobs)
+
+    try:
+        for summary in results:
+            summaries.append(summary)
+            total = summary.get("seconds", {}).get("total")
+            took = f"{total:.1f}s" if total is not None else "-"
+            print(f"[{len(summaries)}/{len(jobs)}] {summary['status']:<7} {took:>8}  {summary['file']}")
+    except BaseException:
+        # Ctrl-C 등: 남은 프로젝트를 기다리지 않고 워커를 바로 종료
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        raise
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+    summaries.sort(key=lambda s: s["file"])
+    save_json(summaries, Path(args.summary))
+
+    counts = {}
+    for summary in summaries:
+        counts[summary["status"]] = counts.get(summary["status"], 0) + 1
+    print(f"[INFO] Done in {time.perf_counter() - start:.1f}s: {counts}")
+    print(f"[INFO] Summary written to {args.summary}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+import argparse
+import contextlib
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pruning"))
+from main_pruning import run_pruning
+sys.path.insert(0, str(Path(__file__).parent.parent / "ga"))
+from ga6 import solve_dep_space, evaluate_solution
+
+from pipeline import load_json, requirements_slice, solve_exact, GA_OPTIONS
+from batch import find_requirement_files, save_json, TARGET_PREFIXES
+import parse
+import version_intern
+
+DEFAULT_BASELINE = "benchmark_baseline.json"
+DEFAULT_OUTPUT = "dep_space_result/benchmark.json"
+# 학회마다 이 수만큼의 프로젝트를 seed 로 고정해서 뽑음
+BENCH_PER_VENUE = 4
+BENCH_SEED = 0
+# 시간 / 처리량 / 메모리는 baseline 대비 이 비율 이상 나빠지면 regression
+# (짧은 프로젝트의 측정 잡음 때문에 시간은 TIME_SLACK_SECONDS, 메모리는 RSS_SLACK_MB 까지 추가로 허용하고,
+#  처리량은 baseline 의 GA 가 THROUGHPUT_MIN_SECONDS 이상 걸린 프로젝트만 비교)
+DEFAULT_TOLERANCE = 0.25
+TIME_SLACK_SECONDS = 1.0
+RSS_SLACK_MB = 16.0
+THROUGHPUT_MIN_SECONDS = 1.0
+
+# fork 로 물려받는 dep space 와 GA 옵션 (batch.py 와 같은 방식)
+_dep_space = None
+_ga_options = None
+
+def select_projects(req_dir: Path, venues, per_venue, seed):
+    """학회마다 정렬한 파일 목록에서 (seed, 학회) 로 고정한 난수로 per_venue 개를 뽑음"""
+    selected = []
+    for venue in venues:
+        req_files = find_requirement_files(req_dir, [venue])
+        rng = random.Random(f"{seed}/{venue}")
+        selected.extend(sorted(rng.sample(req_files, min(per_venue, len(req_files)))))
+    return selected
+
+def peak_rss_mb():
+    # Linux 의 ru_maxrss 는 KB 단위
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def bench_project(req_path: Path, req_dir: Path):
+    """
+    프로젝트 하나를 pruning -> exact solver -> GA 로 풀면서 측정
+    GA 는 exact solver 결과와 관계없이 항상 같은 seed / 예산으로 실행해서 처리량과 품질을 비교할 수 있게 함
+    """
+    record = {"project": str(req_path.relative_to(req_dir).with_suffix(""))}
+    timings = record["seconds"] = {}
+    start = time.perf_counter()
+
+    requirements = parse.load_reqs_txt(req_path)
+    proj_constraints = parse.parse_reqs(requirements)
+    required_packages = parse.get_all_package_names(requirements)
+    missing_pkgs = [pkg for pkg in proj_constraints if pkg not in _dep_space]
+    if missing_pkgs:
+        record["status"] = "missing"
+        record["missing"] = missing_pkgs
+        return record
+
+    t = time.perf_counter()
+    result = run_pruning(
+        proj_constraints=proj_constraints,
+        required_packages=required_packages,
+        visualize=False,
+        save_files=False,
+        dep_space=_dep_space,
+    )
+    timings["pruning"] = time.perf_counter() - t
+    ga_dep_space = requirements_slice(result)
+
+    t = time.perf_counter()
+    solution, _ = solve_exact(proj_constraints, ga_dep_space)
+    record["exact"] = "solved" if solution is not None else "unsat"
+    timings["exact"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    stats = {}
+    solved = solve_dep_space(ga_dep_space, hard_constraints=proj_constraints, stats=stats, **_ga_options)
+    timings["ga"] = time.perf_counter() - t
+    timings["total"] = time.perf_counter() - start
+
+    record["evaluations"] = stats.get("evaluations", 0)
+    record["evaluations_per_second"] = record["evaluations"] / timings["ga"] if timings["ga"] > 0 else 0.0
+    if solved["python_version"] is None:
+        record["status"] = "failed"
+        return record
+    _, conflicts, constrain_conflicts = evaluate_solution(
+        ga_dep_space, [solved["python_version"]], proj_constraints,
+        solved["python_version"], solved["all_packages"],
+    )
+    record["status"] = "ok"
+    record["conflicts"] = conflicts + constrain_conflicts
+    record["packages"] = len(solved["packages"])
+    record["fitness"] = solved["fitness"]
+    return record
+
+def _bench_job(job):
+    """
+    새로 fork 한 프로세스에서 실행해서 peak RSS 가 프로젝트마다 따로 잡히게 함, GA 출력은 버림
+    fork 직후의 RSS 에는 부모에게서 물려받은 dep space 전체가 들어 있으므로
+    그 값을 빼서 이 프로젝트를 푸는 동안 늘어난 만큼만 peak_rss_delta_mb 로 기록
+    """
+    req_path, req_dir = job
+    start_rss = peak_rss_mb()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            record = bench_project(req_path, req_dir)
+        except Exception as e:
+            record = {"project": str(req_path.relative_to(req_dir).with_suffix("")), "status": "error", "error": repr(e)}
+    record["peak_rss_delta_mb"] = peak_rss_mb() - start_rss
+    return record
+
+def compare(records, baseline, tolerance):
+    """baseline 대비 나빠진 항목들 (사람이 읽을 수 있는 문장 리스트)"""
+    regressions = []
+    base_records = baseline["projects"]
+    for record in records:
+        name = record["project"]
+        base = base_records.get(name)
+        if base is None:
+            continue
+        if base["status"] == "ok" and record["status"] != "ok":
+            regressions.append(f"{name}: status {base['status']} -> {record['status']}")
+            continue
+        if record["status"] != "ok":
+            continue
+        if record["conflicts"] > base["conflicts"]:
+            regressions.append(f"{name}: conflicts {base['conflicts']} -> {record['conflicts']}")
+        base_time, cur_time = base["seconds"]["total"], record["seconds"]["total"]
+        if cur_time > base_time * (1 + tolerance) + TIME_SLACK_SECONDS:
+            regressions.append(f"{name}: wall time {base_time:.1f}s -> {cur_time:.1f}s")
+        base_eps, cur_eps = base["evaluations_per_second"], record["evaluations_per_second"]
+        if base["seconds"]["ga"] >= THROUGHPUT_MIN_SECONDS and cur_eps < base_eps * (1 - tolerance):
+            regressions.append(f"{name}: evaluations/s {base_eps:.0f} -> {cur_eps:.0f}")
+        base_rss, cur_rss = base["peak_rss_delta_mb"], record["peak_rss_delta_mb"]
+        if cur_rss > base_rss * (1 + tolerance) + RSS_SLACK_MB:
+            regressions.append(f"{name}: peak RSS growth {base_rss:.0f}MB -> {cur_rss:.0f}MB")
+    return regressions
+
+def print_record(record):
+    if record["status"] != "ok":
+        print(f"  {record['project']:<45} {record['status']}")
+        return
+    print(
+        f"  {record['project']:<45} {record['seconds']['total']:>7.1f}s"
+        f" {record['evaluations_per_second']:>9.0f} eval/s {record['peak_rss_delta_mb']:>+7.0f}MB"
+        f"  conflicts {record['conflicts']:>3}  packages {record['packages']:>4}  exact {record['exact']}"
+    )
+
+def main():
+    global _dep_space, _ga_options
+
+    arg_parser = argparse.ArgumentParser(description="Solver benchmark over a fixed sample of the requirements corpus")
+    arg_parser.add_argument(
+        "--dep-space",
+        type=str,
+        required=True,
+        help="Path to dependency space JSON",
+    )
+    arg_parser.add_argument(
+        "--requirements-dir",
+        type=str,
+        default="data/requirements",
+        help="Root directory of requirements files (default: data/requirements)",
+    )
+    arg_parser.add_argument(
+        "--venues",
+        nargs="+",
+        default=TARGET_PREFIXES,
+        help=f"Subdirectories to sample from (default: {' '.join(TARGET_PREFIXES)})",
+    )
+    arg_parser.add_argument(
+        "--per-venue",
+        type=int,
+        default=BENCH_PER_VENUE,
+        help=f"Projects sampled from each venue (default: {BENCH_PER_VENUE})",
+    )
+    arg_parser.add_argument(
+        "--seed",
+        type=int,
+        default=BENCH_SEED,
+        help=f"Seed for project sampling and the GA (default: {BENCH_SEED})",
+    )
+    arg_parser.add_argument(
+        "--ga-generations",
+        type=int,
+        default=GA_OPTIONS["n_generations"],
+        help=f"GA generations per run (default: {GA_OPTIONS['n_generations']})",
+    )
+    arg_parser.add_argument(
+        "--baseline",
+        type=str,
+        default=DEFAULT_BASELINE,
+        help=f"Baseline results to compare against (default: {DEFAULT_BASELINE})",
+    )
+    arg_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write this run's results as the new baseline instead of comparing",
+    )
+    arg_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"Allowed relative slowdown / throughput drop / memory growth (default: {DEFAULT_TOLERANCE})",
+    )
+    arg_parser.add_argument(
+        "--output",
+        type=str,
+        default=DEFAULT_OUTPUT,
+        help=f"Where to write this run's results (default: {DEFAULT_OUTPUT})",
+    )
+    args = arg_parser.parse_args()
+
+    req_dir = Path(args.requirements_dir)
+    projects = select_projects(req_dir, args.venues, args.per_venue, args.seed)
+    config = {
+        "venues": args.venues,
+        "per_venue": args.per_venue,
+        "seed": args.seed,
+        "sample": [str(p.relative_to(req_dir).with_suffix("")) for p in projects],
+        "ga": dict(GA_OPTIONS, n_generations=args.ga_generations, seed=args.seed),
+        # 예전 baseline 은 dep space 를 포함한 peak RSS 를 기록했으므로 config 가 달라 거부됨
+        "rss": "delta",
+    }
+
+    baseline = None
+    if not args.update_baseline:
+        if Path(args.baseline).exists():
+            baseline = load_json(args.baseline)
+            if baseline["config"] != config:
+                print(f"[ERROR] {args.baseline} was recorded with a different project sample or GA options, rerun with --update-baseline")
+                sys.exit(2)
+        else:
+            print(f"[WARN] No baseline at {args.baseline}, only recording results")
+
+    t = time.perf_counter()
+    _dep_space = load_json(args.dep_space)
+    version_intern.canonicalize_dep_space(_dep_space)
+    for scheme in ("pep440", "base"):
+        version_intern.ensure_ranked(scheme)
+    print(f"[INFO] Loaded {len(_dep_space)} packages in {time.perf_counter() - t:.1f}s")
+    _ga_options = config["ga"]
+
+    # 측정이 서로 간섭하지 않도록 한 번에 한 프로젝트씩, 프로젝트마다 새 프로세스에서 실행
+    try:
+        ctx = multiprocessing.get_context("fork")
+    except ValueError:
+        ctx = multiprocessing.get_context()
+    print(f"[INFO] Benchmarking {len(projects)} projects")
+    records = []
+    with ctx.Pool(1, maxtasksperchild=1) as pool:
+        for record in pool.imap(_bench_job, [(p, req_dir) for p in projects]):
+            print_record(record)
+            records.append(record)
+
+    results = {"config": config, "projects": {record["project"]: record for record in records}}
+    save_json(results, Path(args.output))
+    if args.update_baseline:
+        save_json(results, Path(args.baseline))
+        print(f"[INFO] Baseline written to {args.baseline}")
+        return
+    if baseline is None:
+        return
+
+    regressions = compare(records, baseline, args.tolerance)
+    if regressions:
+        print(f"[FAILED] {len(regressions)} regressions against {args.baseline}:")
+        for line in regressions:
+            print(f"  - {line}")
+        sys.exit(1)
+    print(f"[INFO] No regressions against {args.baseline}")
+
+if __name__ == "__main__":
+    main()
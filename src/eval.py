@@ -3,6 +3,7 @@ import json
 import re
 
 import utils
+import version_intern
 
 
 def parse_version_constraint(op, ver):
@@ -30,6 +31,7 @@ def validate_solution(solution_path: str, dep_space_path: str):
         sol_data = json.load(f)
     with open(dep_space_path, "r", encoding="utf-8") as f:
         dep_space = json.load(f)
+    version_intern.register_dep_space(dep_space)
 
     packages = sol_data.get("packages", sol_data.get("all_packages", {}))
     current_python_ver = sol_data.get("python_version", "3.8")
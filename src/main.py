@@ -1,24 +1,34 @@
 import argparse
 from pathlib import Path
 import json
+import os
 import sys
-import subprocess
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "pruning"))
 from main_pruning import run_pruning
+from pruning import build_dep_space_from_requirements
+sys.path.insert(0, str(Path(__file__).parent.parent / "ga"))
+from ga6 import python_minor_versions, solve_dep_space, print_solution, save_solution
 
 import parse
-import solver
-
-def load_json(path):
-    try:
-        with open(path) as f:
-            return json.load(f)
-    except Exception:
-        print(f"[ERROR] Failed to load JSON: {path}")
-        exit(1)
-
-def solve_project(reqs_txt, dep_space):
+from pipeline import GA_OPTIONS, load_json, requirements_slice, solve_exact
+from solution_cache import SolutionCache, cache_key, DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES
+
+GA_OUTPUT = "results/ga6_test_strong.json"
+GA_PROGRESS_INTERVAL = 25
+
+def load_previous(path):
+    """
+    Previous solution for --warm-start, in GA format {"python_version", "all_packages"/"packages"}.
+    Accepts ga_solution_detailed.json / ga_solution.json or an exact solution {pkg: ver, "python": ver}.
+    """
+    previous = load_json(path)
+    if "python_version" in previous:
+        return previous
+    packages = dict(previous)
+    return {"python_version": packages.pop("python", None), "packages": packages}
+
+def load_project(reqs_txt, dep_space):
     requirements = parse.load_reqs_txt(reqs_txt)
     proj_constraints = parse.parse_reqs(requirements)
     required_packages = parse.get_all_package_names(requirements)
@@ -30,12 +40,16 @@ def solve_project(reqs_txt, dep_space):
         print(f"[ERROR] Missing packages in dependancy space (run precompute.py first): {missing_pkgs}")
         exit(1)
 
+    return proj_constraints, required_packages
+
+def prune_project(proj_constraints, required_packages, dep_space):
     print("Running pruning preprocessing...")
     result = run_pruning(
         proj_constraints=proj_constraints,
         required_packages=required_packages,
         visualize=False,
-        save_files=True
+        save_files=True,
+        dep_space=dep_space,
     )
 
     print(f"Pruning completed:")
@@ -45,8 +59,67 @@ def solve_project(reqs_txt, dep_space):
     print(f"  - precomputed.json: {len(result['precomputed_dep_space'])} packages")
     print(f"    (Fixed: {len(result['fixed_versions'])}, Constrained: {len(result['constrained_versions'])})")
 
-    dep_space_pruned = result['dep_space_clean']
-    return solver.solve(proj_constraints, dep_space_pruned)
+    return result
+
+def project_cache_key(proj_constraints, required_packages, dep_space, previous=None):
+    # pruning 결과는 requirements 에서 닿는 패키지들에만 의존하므로 그 부분만 키에 넣음
+    dep_space_slice = build_dep_space_from_requirements(proj_constraints, dep_space)
+    return cache_key(
+        proj_constraints, required_packages, dep_space_slice,
+        python_minor_versions(dep_space_slice), {"ga": GA_OPTIONS, "warm_start": previous},
+    )
+
+def solve_requirements(proj_constraints, required_packages, dep_space, previous=None, trace_path=None, workers=1):
+    """
+    pruning -> exact solver -> (unsat 이면) GA
+    previous: load_previous 결과, 있으면 두 solver 모두 이전 해에서 시작 (warm start)
+    trace_path: 있으면 GA 의 세대별 trace 를 JSON lines 로 기록
+    workers: GA 의 python 후보들 (후보가 하나면 독립된 연결 요소들) 을 동시에 푸는 프로세스 수
+    return: {"solution": {...}} 또는 {"proof": [...], "ga": solve_dep_space 결과, "interrupted": bool}
+      interrupted 는 GA 가 SIGINT 로 도중에 멈춰 그때까지의 최고 해를 돌려줬다는 뜻 (캐시하지 않음)
+    """
+    pruned = prune_project(proj_constraints, required_packages, dep_space)
+    dep_space_slice = requirements_slice(pruned)
+    solution, proof = solve_exact(proj_constraints, dep_space_slice, previous)
+    if solution is not None:
+        return {"solution": solution}
+
+    # 정확한 해가 없음을 증명한 경우에도 GA 로 위반이 가장 적은 조합을 찾음
+    print("\nNo conflict-free solution, running GA solver...")
+
+    # pruning 결과와 requirements 제약을 메모리에서 바로 GA 에 넘김
+    # (dep_space_req.json / dep_space_r.json 을 다시 읽지 않음)
+    stats = {}
+    solved = solve_dep_space(
+        dep_space_slice,
+        hard_constraints=proj_constraints,
+        progress=report_progress,
+        warm_start=previous,
+        trace_path=trace_path,
+        stats=stats,
+        workers=workers,
+        **GA_OPTIONS,
+    )
+    return {"proof": proof, "ga": solved, "interrupted": bool(stats.get("interrupted"))}
+
+def report_outcome(outcome):
+    if "solution" in outcome:
+        print("Solution found!")
+        print(json.dumps(outcome["solution"], indent=2))
+        return
+
+    print("\nNo conflict-free solution:")
+    for line in outcome["proof"]:
+        print(f"  - {line}")
+    solved = outcome["ga"]
+    print_solution(solved)
+    if solved["python_version"] is None:
+        sys.exit(1)
+    save_solution(solved, GA_OUTPUT)
+
+def report_progress(gen, best_fitness):
+    if gen % GA_PROGRESS_INTERVAL == 0:
+        print(f"[GA] gen {gen:03d} best fitness = {best_fitness:.3f}", flush=True)
 
 def main():
     arg_parser = argparse.ArgumentParser(description="Dependency Solver")
@@ -62,6 +135,41 @@ def main():
         required=True,
         help="Path to dependency space JSON",
     )
+    arg_parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Solution cache directory (default: {DEFAULT_CACHE_DIR})",
+    )
+    arg_parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=DEFAULT_MAX_BYTES / (1024 * 1024),
+        help=f"Solution cache size limit in MB, least recently used entries are evicted (default: {DEFAULT_MAX_BYTES // (1024 * 1024)})",
+    )
+    arg_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always solve, without reading or writing the solution cache",
+    )
+    arg_parser.add_argument(
+        "--warm-start",
+        type=str,
+        default=None,
+        help="Previous solution (solution JSON or ga_solution_detailed.json) to re-solve from after a requirements edit",
+    )
+    arg_parser.add_argument(
+        "--trace",
+        type=str,
+        default=None,
+        help="Write a per-generation JSON-lines trace of the GA fallback to this path (one file per component / Python candidate)",
+    )
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes used by the GA fallback to solve Python candidates (or, with a single candidate, independent components) in parallel (default: CPU count)",
+    )
     args = arg_parser.parse_args()
 
     req_path = Path(args.file)
@@ -70,62 +178,25 @@ def main():
         return
 
     dep_space = load_json(args.dep_space)
+    proj_constraints, required_packages = load_project(req_path, dep_space)
+    previous = load_previous(args.warm_start) if args.warm_start else None
+
+    cache = None
+    if not args.no_cache:
+        cache = SolutionCache(args.cache_dir, int(args.cache_max_mb * 1024 * 1024))
+        key = project_cache_key(proj_constraints, required_packages, dep_space, previous)
+        outcome = cache.get(key)
+        if outcome is not None:
+            print(f"[INFO] Using cached solution ({key[:12]}), skipping pruning and solving")
+            report_outcome(outcome)
+            return
+
+    outcome = solve_requirements(proj_constraints, required_packages, dep_space, previous, args.trace, args.workers)
+    if outcome.get("interrupted"):
+        print("[WARN] GA was interrupted, the result is not cached")
+    elif cache is not None:
+        cache.put(key, outcome)
+    report_outcome(outcome)
 
-    solution = solve_project(req_path, dep_space)
-    #print("Solution found!")
-    #print(json.dumps(solution, indent=2))
-
-    print("\nRunning GA solver...")
-
-    # requirements 경로로부터 프로젝트 결과 디렉토리 계산
-    # data/requirements/NeurIPS/2023/BELLE.txt
-    # -> dep_space_result/NeurIPS/2023/BELLE/
-    rel = req_path.relative_to("data/requirements").with_suffix("")
-    project_dir = Path("dep_space_result") / rel
-
-    dep_space_req = Path("data/dep_space_req.json")
-    hard_constraints = project_dir / "dep_space_r.json"
-
-    if not dep_space_req.exists():
-        print(f"[ERROR] Missing file: {dep_space_req}")
-        sys.exit(1)
-
-    if not hard_constraints.exists():
-        print(f"[ERROR] Missing file: {hard_constraints}")
-        sys.exit(1)
-
-    ga_cmd = [
-        sys.executable,
-        "ga/ga6.py",
-        "--dep-space", str(dep_space_req),
-        "--hard-constraints", str(hard_constraints),
-        "--population-size", "250",
-        "--generations", "250",
-        "--python-versions", "3.9",
-        "--output", "results/ga6_test_strong.json",
-    ]
-
-    print("[GA CMD]")
-    print(" ".join(ga_cmd))
-
-    try:
-        completed = subprocess.run(
-            ga_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            check=True,
-        )
-
-        print("\n[GA OUTPUT]")
-        print(completed.stdout)
-
-    except subprocess.CalledProcessError as e:
-        print("\n[ERROR] GA solver failed")
-        print(e.stdout)
-        sys.exit(1)
-    
 if __name__ == "__main__": 
     main()
-
-   
\ No newline at end of file
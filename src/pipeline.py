@@ -0,0 +1,74 @@
+"""
+풀이 파이프라인 공용 부분
+
+main.py (CLI), batch.py, benchmark.py 가 같은 설정과 같은 단계로 풀도록
+GA 설정과 pruning 이후의 exact solver 단계를 여기에 둔다.
+"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "ga"))
+from ga6 import python_minor_versions, previous_assignment, evaluate_solution
+
+import solver
+
+GA_OPTIONS = {
+    "python_candidates": "auto",
+    "components": True,
+    "per_python": True,
+    "pop_size": 250,
+    "n_generations": 250,
+}
+
+def load_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except Exception:
+        print(f"[ERROR] Failed to load JSON: {path}")
+        exit(1)
+
+def requirements_slice(pruned):
+    """
+    exact solver 와 GA 가 푸는 dep space
+    dep_space_clean 은 python depends 가 빠지고 pruning 으로 고정된 패키지가 precomputed 로 옮겨져 있어서
+    그대로 풀면 python 범위나 고정된 패키지의 depends 를 어기는 해가 나옴
+    """
+    return pruned['dep_space_req'] if pruned['dep_space_req'] is not None else pruned['dep_space_clean']
+
+def solve_exact(proj_constraints, dep_space_slice, previous=None):
+    """
+    exact solver 로 풀고 찾은 해를 evaluate_solution 으로 slice 전체에 대해 다시 검사
+    previous: load_previous 결과 (warm start)
+    return: (해, None) 또는 (None, proof), proof 가 있으면 GA 로 넘어감
+    """
+    python_candidates = python_minor_versions(dep_space_slice)
+    exact_previous = None
+    if previous is not None:
+        python_ver, pkg_versions = previous_assignment(previous)
+        exact_previous = {pkg: ver for pkg, ver in pkg_versions.items() if ver is not None}
+        exact_previous["python"] = python_ver
+    try:
+        solution = solver.solve(proj_constraints, dep_space_slice, python_candidates, previous=exact_previous)
+    except solver.UnsatisfiableError as e:
+        return None, e.proof
+
+    python_ver = solution.get("python")
+    _, conflicts, constrain_conflicts = evaluate_solution(
+        dep_space_slice, python_candidates, proj_constraints, python_ver, solution,
+    )
+    # evaluate_solution 은 설치되지 않은 dep 을 위반으로 세지 않으므로 따로 셈
+    missing = sum(
+        1
+        for pkg, ver in solution.items() if pkg != "python"
+        for dep_pkg in (dep_space_slice[pkg][ver] or {}).get("depends", {})
+        if dep_pkg in dep_space_slice and dep_pkg not in solution
+    )
+    if conflicts or constrain_conflicts or missing:
+        print(f"[WARN] Exact solution failed validation ({conflicts} depends, {constrain_conflicts} constrains, {missing} missing)")
+        return None, [
+            f"exact solver result violates {conflicts} depends / {constrain_conflicts} constrains conditions"
+            f" and misses {missing} dependencies on the requirements slice"
+        ]
+    return solution, None
@@ -0,0 +1,91 @@
+"""
+풀이 결과 캐시 (content-addressed)
+
+키는 정규화한 proj_constraints, requirements 에서 닿는 dep space 부분(slice),
+python 후보, solver 파라미터를 합친 JSON 의 sha256 이라서
+이 중 하나라도 바뀌면 자연히 다른 키가 되고, 바뀌지 않았으면 pruning / solver 없이 결과를 재사용한다.
+
+디렉토리에 키마다 JSON 파일 하나로 저장하며, 전체 크기가 max_bytes 를 넘으면
+가장 오래 쓰이지 않은(mtime 기준) 파일부터 지운다. 읽을 때 mtime 을 갱신하므로 LRU 가 된다.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+# 결과 형식이나 solver 동작이 바뀌면 올려서 이전 캐시를 무효화
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = ".solution_cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def cache_key(proj_constraints, required_packages, dep_space_slice, python_candidates, params):
+    """
+    proj_constraints: {pkg: [{"op", "ver"}, ...]} (조건 순서는 무시)
+    required_packages: requirements 의 패키지 이름들 (순서, 중복 무시)
+    dep_space_slice: requirements 에서 depends / constrains 로 닿는 패키지들의 dep space
+    python_candidates / params: solver 에 넘기는 값 (JSON 으로 직렬화 가능해야 함)
+    """
+    payload = {
+        "version": CACHE_VERSION,
+        "constraints": {
+            pkg: sorted([c["op"], c["ver"]] for c in conds)
+            for pkg, conds in proj_constraints.items()
+        },
+        "required": sorted(set(required_packages)),
+        "dep_space": dep_space_slice,
+        "python": python_candidates,
+        "params": params,
+    }
+    data = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+class SolutionCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return self.directory / f"{key}.json"
+
+    def get(self, key):
+        """저장된 값, 없거나 읽을 수 없으면 None"""
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                value = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return value
+
+    def put(self, key, value):
+        """임시 파일에 쓴 뒤 교체하므로 여러 프로세스가 같은 캐시를 써도 깨진 파일이 남지 않음"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(value, f)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 mtime 이 오래된 항목부터 삭제"""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
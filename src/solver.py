@@ -1,6 +1,516 @@
+"""
+정확한(exact) 의존성 solver
 
-def solve(proj_constraints, dep_space):
-    ver_space = {pkg: list(dep_space[pkg].keys()) for pkg in dep_space}
-    # print(ver_space)
+CDCL (conflict-driven clause learning) 방식의 backtracking resolver
+  - 변수: (패키지, 버전) 마다 설치 여부 boolean 하나 (python 은 candidate 버전마다 하나)
+  - 절(clause)
+      requirement : proj_constraints 패키지는 조건을 만족하는 버전 중 하나가 설치되어야 함
+      depends     : pkg==ver 이 설치되면 dep 의 조건을 만족하는 버전 중 하나가 설치되어야 함
+      constrains  : pkg==ver 이 설치되면 target 의 조건을 만족하지 않는 버전은 설치될 수 없음
+      at-most-one : 한 패키지는 한 버전만
+    constrains / at-most-one 은 절을 미리 만들지 않고 전파할 때 이유(reason)만 기록한다.
+  - 결정: requirement 절, 그다음 설치된 순서대로 depends 절 중 아직 만족되지 않은 첫 절의 최신 버전
+          (warm start 면 이전 해의 버전을 먼저)
+  - 충돌: 1-UIP 절을 배우고 backjump, level 0 에서 충돌하면 unsat
 
-    return {"asdf": "0.0.0", "aaaaa": "1.2.3"}
+unsat 이면 마지막 충돌까지 쓰인 원래 절들(unsat core)을 사람이 읽을 수 있는 문장으로 모아
+UnsatisfiableError.proof 로 돌려준다.
+버전 비교는 eval.py 와 같은 base_version 기준이며, 비교할 수 없는 조건은 만족한 것으로 본다.
+"""
+from packaging.version import InvalidVersion
+
+import version_intern
+
+
+class UnsatisfiableError(Exception):
+    """proj_constraints 를 만족하는 설치 조합이 없음 (proof: 모순을 이루는 조건들)"""
+
+    def __init__(self, proof):
+        self.proof = proof
+        super().__init__("\n".join(proof))
+
+
+def _base_rank(ver):
+    """version_intern 의 base rank (비교할 수 없는 버전이면 None)"""
+    try:
+        return version_intern.rank(ver, "base")
+    except InvalidVersion:
+        return None
+
+
+def _match_op(r, op, target):
+    if op in ("==", "="):
+        return r == target
+    if op == "!=":
+        return r != target
+    if op == ">=":
+        return r >= target
+    if op == "<=":
+        return r <= target
+    if op == ">":
+        return r > target
+    if op == "<":
+        return r < target
+    return True
+
+
+def _format_conds(conds):
+    return ",".join(f"{c['op']}{c['ver']}" for c in conds) or "(any)"
+
+
+class Resolver:
+    """
+    literal 표현: 변수 v 가 설치되면 2v, 설치되지 않으면 2v+1 (반대 literal 은 l ^ 1)
+    reason[v]
+      - int  : v 를 정한 절의 id (self.clauses)
+      - tuple: (u, info) u 가 설치되어 v 가 설치될 수 없음 (at-most-one / constrains)
+      - None : 결정(decision)
+    """
+
+    def __init__(self, proj_constraints, dep_space, python_candidates=None, previous=None):
+        # rank 를 만들기 전에 모든 버전 문자열을 등록해 두어야 rank 를 한 번만 다시 만든다
+        version_intern.register_dep_space(dep_space)
+        for conds in proj_constraints.values():
+            for cond in conds:
+                version_intern.intern(cond["ver"])
+        for ver in python_candidates or ():
+            version_intern.intern(ver)
+        version_intern.ensure_ranked("base")
+        self.dep_space = dep_space
+
+        self.names = []           # v -> (pkg, ver)
+        self.ranks = []           # v -> base rank (None 이면 어떤 조건이든 만족한 것으로 봄)
+        self.pkg_vars = {}        # pkg -> [v, ...] 최신 버전부터
+        self.amo_info = {}
+        if python_candidates:
+            self._add_package("python", python_candidates)
+        for pkg, versions in dep_space.items():
+            self._add_package(pkg, versions)
+
+        n = len(self.names)
+        # warm start: 이전 해의 버전을 결정할 때 최신 버전보다 먼저 고름
+        self.prefer = [False] * n
+        if previous:
+            for v, (pkg, ver) in enumerate(self.names):
+                self.prefer[v] = previous.get(pkg) == ver
+        self.lit_value = [None] * (2 * n)   # literal -> True / False / None (정해지지 않음)
+        self.level = [0] * n
+        self.reason = [None] * n
+        self.trail = []
+        self.trail_lim = []
+        self.qhead = 0
+
+        self.clauses = []
+        self.candidates = []      # 절 id -> 설치 literal 후보 (최신 버전부터, 결정 순서용)
+        self.info = []            # 절 id -> 원래 조건 설명 또는 ("learned", srcs, level0 변수들)
+        self.watches = [[] for _ in range(2 * n)]
+        self.units = []
+        # depends / constrains 는 변수가 처음 설치될 때 만든다 (_expand)
+        self.expanded = [False] * n
+        self.depends_clauses = [[] for _ in range(n)]
+        self.excludes = [[] for _ in range(n)]   # v -> [(u, info), ...] 함께 설치될 수 없는 변수
+        self._sat_cache = {}
+        # 결정 후보가 되는 절들: requirement 절 + 설치된 변수의 depends 절 (설치된 순서대로)
+        # active[:cursor] 는 이미 만족됨을 확인한 절 (할당은 backjump 전까지 늘기만 하므로 유지됨)
+        self.active = []
+        self.active_lim = []
+        self._cursor = 0
+        self._units_undone = False
+
+        if python_candidates:
+            self._add_clause(
+                [2 * v for v in self.pkg_vars["python"]],
+                ("requirement", "python", [{"op": "==", "ver": ver} for ver in python_candidates]),
+                requirement=True,
+            )
+        for pkg, conds in proj_constraints.items():
+            if pkg not in self.pkg_vars:
+                continue
+            self._add_clause(
+                [2 * u for u in self._matching(pkg, conds)],
+                ("requirement", pkg, conds),
+                requirement=True,
+            )
+
+    def _add_package(self, pkg, versions):
+        self.amo_info[pkg] = ("amo", pkg)
+        ranked = sorted(
+            ((_base_rank(ver), ver) for ver in versions),
+            key=lambda rv: -1 if rv[0] is None else rv[0],
+            reverse=True,
+        )
+        self.pkg_vars[pkg] = list(range(len(self.names), len(self.names) + len(ranked)))
+        self.names.extend((pkg, ver) for _, ver in ranked)
+        self.ranks.extend(r for r, _ in ranked)
+
+    def _target(self, dep_pkg):
+        """dep 이름 -> 변수가 있는 패키지 이름 (dep space 밖이거나 python 후보가 없으면 None)"""
+        if dep_pkg in ("python", "python_abi"):
+            dep_pkg = "python"
+        return dep_pkg if dep_pkg in self.pkg_vars else None
+
+    def _matching(self, pkg, conds):
+        key = (pkg, tuple((c["op"], c["ver"]) for c in conds))
+        matched = self._sat_cache.get(key)
+        if matched is None:
+            targets = []
+            for cond in conds:
+                ver = cond["ver"]
+                # wildcard 나 비교할 수 없는 버전의 조건은 만족한 것으로 봄 (pruning / eval 과 같음)
+                if isinstance(ver, str) and not ver.endswith(".*"):
+                    r = _base_rank(ver)
+                    if r is not None:
+                        targets.append((cond["op"], r))
+            ranks = self.ranks
+            matched = tuple(
+                v for v in self.pkg_vars[pkg]
+                if ranks[v] is None or all(_match_op(ranks[v], op, r) for op, r in targets)
+            )
+            self._sat_cache[key] = matched
+        return matched
+
+    def _add_clause(self, lits, info, requirement=False, watch=True):
+        cid = len(self.clauses)
+        self.clauses.append(lits)
+        self.candidates.append(tuple(l for l in lits if not l & 1))
+        self.info.append(info)
+        if requirement:
+            self.active.append(cid)
+        if not watch:
+            return cid
+        if len(lits) >= 2:
+            self.watches[lits[0]].append(cid)
+            self.watches[lits[1]].append(cid)
+        else:
+            self.units.append(cid)
+        return cid
+
+    # ---- 할당 / 전파 ----
+
+    def _assign(self, lit, reason):
+        v = lit >> 1
+        self.lit_value[lit] = True
+        self.lit_value[lit ^ 1] = False
+        self.level[v] = len(self.trail_lim)
+        self.reason[v] = reason
+        self.trail.append(lit)
+        if not lit & 1:
+            self.active.extend(self.depends_clauses[v])
+
+    def _expand(self, v):
+        """
+        v 의 depends 절과 constrains 배제 관계를 만듦 (변수마다 1회)
+        v 를 결정하기 전이나 v 가 처음 설치되어 전파될 때 불림
+        이미 정해진 변수들 때문에 v 가 설치될 수 없으면 v 를 거짓으로 전파
+        return: v 가 설치된 상태에서 만든 depends 절이 바로 충돌하면 (거짓 literal 들, 절 id), 아니면 None
+        """
+        self.expanded[v] = True
+        pkg, ver = self.names[v]
+        if pkg == "python":
+            return None
+        meta = self.dep_space[pkg].get(ver) or {}
+
+        for target_pkg, conds in meta.get("constrains", {}).items():
+            target_pkg = self._target(target_pkg)
+            if target_pkg is None:
+                continue
+            allowed = set(self._matching(target_pkg, conds))
+            info = ("constrains", pkg, ver, target_pkg, conds)
+            for u in self.pkg_vars[target_pkg]:
+                if u not in allowed:
+                    self.excludes[v].append((u, info))
+                    self.excludes[u].append((v, info))
+                    if self.lit_value[2 * u] and self.lit_value[2 * v] is None:
+                        self._assign(2 * v + 1, (u, info))
+
+        conflict = None
+        for dep_pkg, conds in meta.get("depends", {}).items():
+            dep_pkg = self._target(dep_pkg)
+            if dep_pkg is None:
+                continue
+            matched = [2 * u for u in self._matching(dep_pkg, conds)]
+            cid = self._add_clause([2 * v + 1] + matched, ("depends", pkg, ver, dep_pkg, conds), watch=False)
+            self.depends_clauses[v].append(cid)
+            if self.lit_value[2 * v]:
+                # 이미 설치되어 _assign 에서 active 에 넣지 못한 절
+                self.active.append(cid)
+            # 이미 충돌이 났으면 나머지 절은 watch 만 걸어 둠
+            result = self._watch_new(cid, propagate=conflict is None)
+            if conflict is None:
+                conflict = result
+        return conflict
+
+    def _watch_new(self, cid, propagate=True):
+        """
+        새로 만든 절의 watch 를 정하고 필요하면 전파
+        참인 literal, 정해지지 않은 literal 순으로 앞에 두며, 모두 거짓이면 충돌로 돌려줌
+        """
+        c = self.clauses[cid]
+        order = sorted(
+            range(len(c)),
+            key=lambda k: (self.lit_value[c[k]] is not True, self.lit_value[c[k]] is False),
+        )
+        c[:] = [c[k] for k in order]
+        if len(c) >= 2:
+            self.watches[c[0]].append(cid)
+            self.watches[c[1]].append(cid)
+        else:
+            self.units.append(cid)
+        first = self.lit_value[c[0]]
+        if not propagate:
+            return None
+        if first is False:
+            return list(c), cid
+        if first is None and (len(c) < 2 or self.lit_value[c[1]] is False):
+            self._assign(c[0], cid)
+        return None
+
+    def _propagate(self):
+        """
+        trail 에 새로 들어온 literal 들을 전파
+        return: 충돌이면 (거짓이 된 literal 들, 충돌 원인), 아니면 None
+        """
+        lit_value = self.lit_value
+        trail = self.trail
+        if self._units_undone:
+            # 길이 1 절은 watch 가 없으므로 되돌린 뒤 다시 세움 (이유가 없는 사실이라 어느 level 이든 무방)
+            self._units_undone = False
+            for cid in self.units:
+                lit = self.clauses[cid][0]
+                if lit_value[lit] is False:
+                    return [lit], cid
+                if lit_value[lit] is None:
+                    self._assign(lit, cid)
+        while self.qhead < len(trail):
+            lit = trail[self.qhead]
+            self.qhead += 1
+            v = lit >> 1
+
+            if not lit & 1:
+                if not self.expanded[v]:
+                    conflict = self._expand(v)
+                    if conflict is not None:
+                        return conflict
+                pkg = self.names[v][0]
+                amo = self.amo_info[pkg]
+                for u, info in [(u, amo) for u in self.pkg_vars[pkg] if u != v] + self.excludes[v]:
+                    val = lit_value[2 * u]
+                    if val is None:
+                        self._assign(2 * u + 1, (v, info))
+                    elif val:
+                        return [lit ^ 1, 2 * u + 1], (u, info)
+
+            false_lit = lit ^ 1
+            watching = self.watches[false_lit]
+            self.watches[false_lit] = kept = []
+            for k, cid in enumerate(watching):
+                c = self.clauses[cid]
+                if c[0] == false_lit:
+                    c[0], c[1] = c[1], c[0]
+                if lit_value[c[0]]:
+                    kept.append(cid)
+                    continue
+                for m in range(2, len(c)):
+                    if lit_value[c[m]] is not False:
+                        c[1], c[m] = c[m], c[1]
+                        self.watches[c[1]].append(cid)
+                        break
+                else:
+                    kept.append(cid)
+                    if lit_value[c[0]] is False:
+                        kept.extend(watching[k + 1:])
+                        return list(c), cid
+                    self._assign(c[0], cid)
+        return None
+
+    def _backjump(self, level):
+        start = self.trail_lim[level]
+        for lit in self.trail[start:]:
+            self.lit_value[lit] = self.lit_value[lit ^ 1] = None
+        del self.trail[start:]
+        del self.trail_lim[level:]
+        del self.active[self.active_lim[level]:]
+        del self.active_lim[level:]
+        self.qhead = len(self.trail)
+        self._cursor = 0
+        self._units_undone = True
+
+    def _reason_lits(self, v):
+        """v 를 정한 이유에서 v 를 뺀 나머지 (모두 거짓인) literal 들"""
+        reason = self.reason[v]
+        if isinstance(reason, int):
+            return [l for l in self.clauses[reason] if l >> 1 != v]
+        return [2 * reason[0] + 1]
+
+    # ---- 충돌 분석 ----
+
+    def _analyze(self, conflict_lits, conflict_src):
+        """1-UIP 절 (첫 literal 이 UIP 의 부정), backjump level, 사용한 이유들, level 0 변수들"""
+        current = len(self.trail_lim)
+        seen = set()
+        learnt = [None]
+        srcs = [conflict_src]
+        level0 = []
+        counter = 0
+        lits = conflict_lits
+        idx = len(self.trail) - 1
+        while True:
+            for q in lits:
+                u = q >> 1
+                if u in seen:
+                    continue
+                seen.add(u)
+                if self.level[u] == current:
+                    counter += 1
+                elif self.level[u] > 0:
+                    learnt.append(q)
+                else:
+                    level0.append(u)
+            while self.trail[idx] >> 1 not in seen:
+                idx -= 1
+            p = self.trail[idx]
+            idx -= 1
+            counter -= 1
+            if counter == 0:
+                break
+            srcs.append(self.reason[p >> 1])
+            lits = self._reason_lits(p >> 1)
+
+        learnt[0] = p ^ 1
+        back_level = 0
+        if len(learnt) > 1:
+            best = max(range(1, len(learnt)), key=lambda k: self.level[learnt[k] >> 1])
+            learnt[1], learnt[best] = learnt[best], learnt[1]
+            back_level = self.level[learnt[1] >> 1]
+        return learnt, back_level, srcs, level0
+
+    def _proof(self, conflict_lits, conflict_src):
+        """level 0 충돌에서 출발해 배운 절들을 거슬러 올라가며 쓰인 원래 조건들을 모음"""
+        core = []
+        seen_src = set()
+        seen_vars = set()
+        stack_src = [conflict_src]
+        stack_vars = [l >> 1 for l in conflict_lits]
+        while stack_src or stack_vars:
+            if stack_vars:
+                v = stack_vars.pop()
+                if v in seen_vars:
+                    continue
+                seen_vars.add(v)
+                if self.reason[v] is not None:
+                    stack_src.append(self.reason[v])
+                    stack_vars.extend(l >> 1 for l in self._reason_lits(v))
+                continue
+            src = stack_src.pop()
+            if isinstance(src, int):
+                info = self.info[src]
+                if info[0] == "learned":
+                    if src not in seen_src:
+                        seen_src.add(src)
+                        stack_src.extend(info[1])
+                        stack_vars.extend(info[2])
+                    continue
+            else:
+                info = src[1]
+            if info not in core:
+                core.append(info)
+        return [self._describe(info) for info in core]
+
+    def _describe(self, info):
+        kind = info[0]
+        if kind == "requirement":
+            _, pkg, conds = info
+            if pkg == "python":
+                return f"python must be one of {', '.join(c['ver'] for c in conds)}"
+            return f"project requires {pkg} {_format_conds(conds)}"
+        if kind == "depends":
+            _, pkg, ver, dep_pkg, conds = info
+            if not self._matching(dep_pkg, conds):
+                return f"{pkg} {ver} depends on {dep_pkg} {_format_conds(conds)} (no available version)"
+            return f"{pkg} {ver} depends on {dep_pkg} {_format_conds(conds)}"
+        if kind == "constrains":
+            _, pkg, ver, target_pkg, conds = info
+            return f"{pkg} {ver} constrains {target_pkg} {_format_conds(conds)}"
+        return f"only one version of {info[1]} can be installed"
+
+    # ---- 탐색 ----
+
+    def _decide(self):
+        """
+        다음 결정 literal, 결정할 것이 없으면 None
+        requirement 절과 설치된 변수의 depends 절이 모두 만족되면 나머지 변수를 설치하지 않는
+        것으로 원래 조건이 모두 만족된다 (배운 절은 원래 조건에서 유도된 것이라 따로 볼 필요 없음)
+        """
+        lit_value = self.lit_value
+        prefer = self.prefer
+        while self._cursor < len(self.active):
+            free = preferred = None
+            for lit in self.candidates[self.active[self._cursor]]:
+                val = lit_value[lit]
+                if val is True:
+                    break
+                if val is None:
+                    if free is None:
+                        free = lit
+                    if preferred is None and prefer[lit >> 1]:
+                        preferred = lit
+            else:
+                if free is not None:
+                    return preferred if preferred is not None else free
+            self._cursor += 1
+        return None
+
+    def solve(self):
+        for cid in self.units:
+            lits = self.clauses[cid]
+            if not lits:
+                raise UnsatisfiableError([self._describe(self.info[cid])])
+            val = self.lit_value[lits[0]]
+            if val is False:
+                raise UnsatisfiableError(self._proof(lits, cid))
+            if val is None:
+                self._assign(lits[0], cid)
+
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                conflict_lits, conflict_src = conflict
+                if not self.trail_lim:
+                    raise UnsatisfiableError(self._proof(conflict_lits, conflict_src))
+                learnt, back_level, srcs, level0 = self._analyze(conflict_lits, conflict_src)
+                self._backjump(back_level)
+                cid = self._add_clause(learnt, ("learned", srcs, level0))
+                self._assign(learnt[0], cid)
+                continue
+
+            lit = self._decide()
+            if lit is None:
+                break
+            if not self.expanded[lit >> 1]:
+                # 결정하기 전에 후보의 조건을 만들어 두면 바로 걸리는 버전은 전파로 걸러짐
+                n_assigned = len(self.trail)
+                self._expand(lit >> 1)
+                if len(self.trail) > n_assigned:
+                    continue
+            self.trail_lim.append(len(self.trail))
+            self.active_lim.append(len(self.active))
+            self._assign(lit, None)
+
+        return {
+            self.names[v][0]: self.names[v][1]
+            for v in range(len(self.names))
+            if self.lit_value[2 * v]
+        }
+
+
+def solve(proj_constraints, dep_space, python_candidates=None, previous=None):
+    """
+    proj_constraints: {pkg: [{"op": ">=", "ver": "1.0"}, ...]} (parse.parse_reqs 결과)
+    dep_space: requirements 에서 닿는 dep space (dep_space_req, python depends 포함) {pkg: {ver: {depends, constrains}}}
+    python_candidates: 있으면 python 도 변수로 두고 python depends / constrains 를 검사
+    previous: 이전 해 {pkg: ver} ("python" 포함 가능), 있으면 그 버전들을 먼저 시도하므로
+      바뀐 제약과 관계없는 패키지는 이전 버전을 유지하고 충돌이 난 부분만 다시 고름
+    return: 충돌 없는 {pkg: ver} (python_candidates 가 있으면 "python" 포함, 설치되는 패키지만)
+    만족하는 조합이 없으면 UnsatisfiableError (proof 에 모순을 이루는 조건들)
+    """
+    return Resolver(proj_constraints, dep_space, python_candidates, previous).solve()
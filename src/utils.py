@@ -2,7 +2,8 @@ import re
 from pathlib import Path
 
 import requests
-from packaging.version import Version
+
+import version_intern
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
@@ -80,24 +81,7 @@ def cmp_v(v1, op, v2):
         print(f"[ERROR] op {op} not in INEQ_OPS")
         return False
 
-    v1 = Version(v1)
-    v2 = Version(v2)
-
-    match op:
-        case "==":
-            return v1 == v2
-        case "!=":
-            return v1 != v2
-        case ">=":
-            return v1 >= v2
-        case "<=":
-            return v1 <= v2
-        case ">":
-            return v1 > v2
-        case "<":
-            return v1 < v2
-
-    return False
+    return _match_op(version_intern.compare(v1, v2, "pep440"), op)
 
 
 def cmp_v2(v1, op, v2):
@@ -105,25 +89,23 @@ def cmp_v2(v1, op, v2):
         print(f"[ERROR] op {op} not in INEQ_OPS")
         return False
 
-    v1 = Version(v1)
-    v2 = Version(v2)
+    return _match_op(version_intern.compare(v1, v2, "base"), op)
 
-    v1_base = Version(v1.base_version)
-    v2_base = Version(v2.base_version)
 
+def _match_op(c, op):
     match op:
         case "==":
-            return v1_base == v2_base
+            return c == 0
         case "!=":
-            return v1_base != v2_base
+            return c != 0
         case ">=":
-            return v1_base >= v2_base
+            return c >= 0
         case "<=":
-            return v1_base <= v2_base
+            return c <= 0
         case ">":
-            return v1_base > v2_base
+            return c > 0
         case "<":
-            return v1_base < v2_base
+            return c < 0
 
     return False
 
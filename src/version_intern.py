@@ -0,0 +1,235 @@
+"""
+버전 문자열 interning
+
+GA / pruning / eval 이 같은 버전 문자열을 매번 다시 파싱하지 않도록
+문자열마다 정수 id 를 주고, 비교 방식(scheme)별 전순서 rank 를 미리 계산해 둔다.
+
+scheme:
+  - "numeric" : 숫자 prefix 만 비교 ("3.10.0a0" == "3.10"), ga6 에서 사용
+  - "pep440"  : packaging.Version 비교, utils.cmp_v / pruning 에서 사용
+  - "base"    : packaging.Version.base_version 비교, utils.cmp_v2 / eval 에서 사용
+
+기본 테이블(TABLE)은 프로세스 전체에서 공유하며 지우지 않는다.
+서로 다른 문자열마다 한 항목이므로 dep space 의 버전 어휘 + requirements 의 버전 문자열 크기를 넘지 않고,
+batch 처럼 같은 dep space 로 여러 프로젝트를 풀면 처음 등록한 뒤로는 거의 늘지 않는다.
+"""
+import sys
+
+from packaging.version import InvalidVersion, Version
+
+SCHEMES = ("numeric", "pep440", "base")
+
+_INVALID = object()
+
+
+def normalize_version(v):
+    """
+    "3.10.0a0" -> (3, 10, 0)
+    "3.9"      -> (3, 9)
+    """
+    cleaned = ""
+    for ch in v:
+        if ch.isdigit() or ch == ".":
+            cleaned += ch
+        else:
+            break
+    if not cleaned:
+        return (0,)
+    parts = [int(p) for p in cleaned.split(".") if p != ""]
+    if not parts:
+        return (0,)
+    return tuple(parts)
+
+
+def _numeric_key(v):
+    # 뒤쪽 0 을 떼면 (3, 10) == (3, 10, 0) 이 되어 0 padding 비교와 같은 순서가 됨
+    parts = list(normalize_version(v))
+    while parts and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+def _pep440_key(v):
+    return Version(v)
+
+
+def _base_key(v):
+    return Version(Version(v).base_version)
+
+
+_KEY_FUNCS = {
+    "numeric": _numeric_key,
+    "pep440": _pep440_key,
+    "base": _base_key,
+}
+
+
+class VersionTable:
+    """
+    버전 문자열 -> id, scheme 별 id -> rank
+    rank 는 같은 버전이면 같은 값인 dense rank 이다.
+    새 문자열이 조금 추가된 정도로는 rank 를 다시 만들지 않고 캐시된 key 로 비교하며,
+    rank 없는 문자열이 충분히 쌓이면 (기존의 절반 이상) 한 번에 다시 만든다.
+    """
+
+    def __init__(self):
+        self._ids = {}
+        self._strings = []
+        self._keys = {scheme: {} for scheme in SCHEMES}
+        self._ranks = {scheme: [] for scheme in SCHEMES}
+
+    def __len__(self):
+        return len(self._strings)
+
+    def intern(self, ver):
+        """버전 문자열의 id (처음 보는 문자열이면 새로 등록)"""
+        vid = self._ids.get(ver)
+        if vid is None:
+            ver = sys.intern(ver)
+            vid = len(self._strings)
+            self._ids[ver] = vid
+            self._strings.append(ver)
+        return vid
+
+    def canonical(self, ver):
+        """같은 내용의 문자열을 하나의 객체로 공유하기 위한 대표 문자열"""
+        return self._strings[self.intern(ver)]
+
+    def register_dep_space(self, dep_space):
+        """
+        dep space 안의 모든 버전 문자열(버전 키와 constraint 의 "ver")을 등록 (dep space 는 바꾸지 않음)
+        비교 전에 한 번 불러 두면 rank 를 한 번만 만들면 된다.
+        """
+        for versions in dep_space.values():
+            for ver_str, metadata in versions.items():
+                self.intern(ver_str)
+                if not metadata:
+                    continue
+                for field in ("depends", "constrains"):
+                    for conds in (metadata.get(field) or {}).values():
+                        for cond in conds:
+                            ver = cond.get("ver")
+                            if isinstance(ver, str):
+                                self.intern(ver)
+        return dep_space
+
+    def canonicalize_dep_space(self, dep_space):
+        """
+        register_dep_space 에 더해 constraint 의 "ver" 값을 대표 문자열로 교체 (제자리 수정)
+        JSON 에서 읽은 큰 dep space 는 같은 버전 문자열이 constraint 마다 따로 있으므로,
+        dep space 를 직접 읽어 오래 들고 있는 쪽(batch / benchmark)이 읽은 직후 한 번 불러 메모리를 줄인다.
+        """
+        for versions in dep_space.values():
+            for ver_str, metadata in versions.items():
+                self.intern(ver_str)
+                if not metadata:
+                    continue
+                for field in ("depends", "constrains"):
+                    for conds in (metadata.get(field) or {}).values():
+                        for cond in conds:
+                            ver = cond.get("ver")
+                            if isinstance(ver, str):
+                                cond["ver"] = self.canonical(ver)
+        return dep_space
+
+    def _key(self, vid, scheme):
+        keys = self._keys[scheme]
+        key = keys.get(vid)
+        if key is None:
+            try:
+                key = _KEY_FUNCS[scheme](self._strings[vid])
+            except InvalidVersion:
+                key = _INVALID
+            keys[vid] = key
+        return key
+
+    def _rebuild_ranks(self, scheme):
+        valid = []
+        ranks = [None] * len(self._strings)
+        for vid in range(len(self._strings)):
+            key = self._key(vid, scheme)
+            if key is not _INVALID:
+                valid.append((key, vid))
+        valid.sort(key=lambda kv: kv[0])
+
+        rank = -1
+        prev = _INVALID
+        for key, vid in valid:
+            if prev is _INVALID or key != prev:
+                rank += 1
+                prev = key
+            ranks[vid] = rank
+        self._ranks[scheme] = ranks
+
+    def ensure_ranked(self, scheme="pep440"):
+        """
+        지금까지 등록된 모든 문자열에 scheme rank 를 매겨 둠
+        rank 는 다시 만들 때마다 값이 바뀌므로, rank 값을 저장해 두고 서로 비교하려면
+        필요한 문자열을 모두 등록한 뒤 이것을 먼저 불러야 한다.
+        """
+        if len(self._ranks[scheme]) < len(self._strings):
+            self._rebuild_ranks(scheme)
+
+    def rank(self, ver, scheme="pep440"):
+        """
+        scheme 기준 전순서 rank (작을수록 낮은 버전)
+        pep440 / base 에서 잘못된 버전이면 InvalidVersion
+        """
+        vid = self.intern(ver)
+        ranks = self._ranks[scheme]
+        if vid >= len(ranks):
+            self._rebuild_ranks(scheme)
+            ranks = self._ranks[scheme]
+        r = ranks[vid]
+        if r is None:
+            raise InvalidVersion(f"Invalid version: {ver!r}")
+        return r
+
+    def compare(self, a, b, scheme="pep440"):
+        """
+        a < b  -> -1
+        a == b ->  0
+        a > b  -> +1
+        """
+        ia = self.intern(a)
+        ib = self.intern(b)
+        ranks = self._ranks[scheme]
+        n_ranked = len(ranks)
+
+        if (ia >= n_ranked or ib >= n_ranked) and len(self._strings) - n_ranked > max(64, n_ranked // 2):
+            self._rebuild_ranks(scheme)
+            ranks = self._ranks[scheme]
+            n_ranked = len(ranks)
+
+        if ia < n_ranked and ib < n_ranked:
+            ka = ranks[ia]
+            kb = ranks[ib]
+            if ka is None:
+                raise InvalidVersion(f"Invalid version: {a!r}")
+            if kb is None:
+                raise InvalidVersion(f"Invalid version: {b!r}")
+        else:
+            ka = self._key(ia, scheme)
+            kb = self._key(ib, scheme)
+            if ka is _INVALID:
+                raise InvalidVersion(f"Invalid version: {a!r}")
+            if kb is _INVALID:
+                raise InvalidVersion(f"Invalid version: {b!r}")
+
+        if ka < kb:
+            return -1
+        elif ka > kb:
+            return 1
+        return 0
+
+
+# 프로세스 전체에서 공유하는 기본 테이블
+TABLE = VersionTable()
+
+intern = TABLE.intern
+canonical = TABLE.canonical
+register_dep_space = TABLE.register_dep_space
+canonicalize_dep_space = TABLE.canonicalize_dep_space
+ensure_ranked = TABLE.ensure_ranked
+rank = TABLE.rank
+compare = TABLE.compare